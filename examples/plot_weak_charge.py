@@ -1,9 +1,10 @@
 
 """.. moduleauthor:: Sacha Medaer"""
 
+from itertools import combinations_with_replacement
+
 import matplotlib.pyplot as plt
 import numpy as np
-import sympy as sp
 
 from nupot.physics.atom import Atom
 from nupot.matrices.global_weak_charge import GlobalWeakCharge
@@ -11,21 +12,12 @@ from nupot.matrices.global_weak_charge import GlobalWeakCharge
 i = [0, 1, 2, 0, 0, 1]
 j = [0, 1, 2, 1, 2, 2]
 max_Z = 50
-gwc_obj = []
-for k in range(1, max_Z+1):
-    atom = Atom(k)
-    gwc_obj.append(GlobalWeakCharge(atom.atomic_number, atom.neutrons))
-
-
-gwc_values = [np.zeros((max_Z, max_Z)) for _ in range(len(i))]
-for m in range(len(i)):
-    for k in range(1, max_Z+1):
-        for l in range(1, max_Z+1):
-            gwc_1 = gwc_obj[k-1]
-            gwc_2 = gwc_obj[l-1]
-            gwc_values[m][k-1, l-1] = (gwc_1[i[m],j[m]]
-                                       * sp.conjugate(gwc_2[i[m],j[m]])
-                                      ).evalf()
+Q = GlobalWeakCharge.evaluate_atoms([Atom(k) for k in range(1, max_Z+1)])
+# (max_Z, max_Z, 6) products in the order of combinations_with_replacement
+products = GlobalWeakCharge.pair_products(Q, Q)
+combs = list(combinations_with_replacement([0, 1, 2], 2))
+gwc_values = [np.real(products[:, :, combs.index((i[m], j[m]))])
+              for m in range(len(i))]
 
 print(gwc_values)
 
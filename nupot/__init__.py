@@ -0,0 +1,4 @@
+
+""".. moduleauthor:: Sacha Medaer"""
+
+__version__ = '0.1.1'
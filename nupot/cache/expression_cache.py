@@ -0,0 +1,192 @@
+
+""".. moduleauthor:: Sacha Medaer"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, List, Tuple
+
+import sympy as sp
+
+import nupot
+import nupot.utils.constants as cst
+import nupot.utils.utilities as util
+
+
+# Exceptions
+class ExpressionCacheInputError(Exception):
+    pass
+
+
+class ExpressionCache(object):
+    r"""This class represents a content-addressed on-disk cache of
+    sympy expressions, e.g. the derived potentials.
+
+    Notes
+    -----
+    The key of an entry is the SHA-256 hash of the :func:`sp.srepr` of
+    its parts, which includes the assumptions of the symbols, and of
+    the version of nupot. Each entry is pickled in its own file. The
+    files are written in a temporary file and atomically renamed, such
+    that concurrent writers and readers never see a partial entry. The
+    total size of the entries is capped by removing the least recently
+    used ones, the last use of an entry being its modification time.
+
+    """
+    suffix: str = '.pkl'
+
+    def __init__(self, directory: str, max_size: int = 2**30) -> None:
+        """
+        Parameters
+        ----------
+        directory :
+            The directory where the entries are stored, created if it
+            does not exist.
+        max_size :
+            The maximum total size of the entries in bytes.
+
+        """
+        if (max_size <= 0):
+
+            raise ExpressionCacheInputError("The maximum size must be "
+                                            "positive, got {}."
+                                            .format(max_size))
+        self._directory: str = os.path.abspath(directory)
+        self._max_size: int = max_size
+        os.makedirs(self._directory, exist_ok=True)
+
+        return None
+    # ==================================================================
+    @property
+    def directory(self) -> str:
+
+        return self._directory
+    # ==================================================================
+    @property
+    def max_size(self) -> int:
+
+        return self._max_size
+    # ==================================================================
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Return the key of the entry identified by parts. The sympy
+        objects are represented by their :func:`sp.srepr`.
+        """
+        hash_ = hashlib.sha256()
+        hash_.update(nupot.__version__.encode())
+        for part in parts:
+            if (isinstance(part, sp.Basic)):
+                part = sp.srepr(part)
+            elif (isinstance(part, (list, tuple))):
+                part = tuple(sp.srepr(elem) if isinstance(elem, sp.Basic)
+                             else repr(elem) for elem in part)
+            hash_.update(b'\x00' + repr(part).encode())
+
+        return hash_.hexdigest()
+    # ==================================================================
+    def _get_path(self, key: str) -> str:
+
+        return os.path.join(self._directory, key + ExpressionCache.suffix)
+    # ==================================================================
+    def __contains__(self, key: str) -> bool:
+
+        return os.path.isfile(self._get_path(key))
+    # ==================================================================
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the entry of key, or default if the entry does not
+        exist or can not be read.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+
+            return default
+        except (EOFError, pickle.UnpicklingError, AttributeError,
+                ImportError, TypeError):
+            # corrupted or outdated entry
+            self._remove(path)
+
+            return default
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+
+        return value
+    # ==================================================================
+    def set(self, key: str, value: Any) -> None:
+        """Store value in the entry of key and evict the least recently
+        used entries if the maximum size is exceeded.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._get_path(key))
+        except BaseException:
+            self._remove(tmp_path)
+
+            raise
+        self._evict()
+
+        return None
+    # ==================================================================
+    def get_or_compute(self, key: str, func: Callable[[], Any]) -> Any:
+        """Return the entry of key, computing it with func and storing
+        it if it does not exist.
+        """
+        value = self.get(key, None)
+        if (value is None):
+            value = func()
+            self.set(key, value)
+
+        return value
+    # ==================================================================
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        with os.scandir(self._directory) as it:
+            for entry in it:
+                if (entry.name.endswith(ExpressionCache.suffix)):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:   # removed concurrently
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        return entries
+    # ==================================================================
+    def size(self) -> int:
+        """Return the total size of the entries in bytes."""
+
+        return sum(entry[1] for entry in self._entries())
+    # ==================================================================
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        total_size = sum(entry[1] for entry in entries)
+        # always keep the most recent entry
+        for _, size, path in entries[:-1]:
+            if (total_size <= self._max_size):
+                break
+            self._remove(path)
+            total_size -= size
+
+        return None
+    # ==================================================================
+    def clear(self) -> None:
+        """Remove all the entries."""
+        for _, _, path in self._entries():
+            self._remove(path)
+
+        return None
+    # ==================================================================
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+        return None
@@ -0,0 +1,61 @@
+
+""".. moduleauthor:: Sacha Medaer"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+# Exceptions
+class LRUDictInputError(Exception):
+    pass
+
+
+class LRUDict(OrderedDict):
+    r"""This class represents an in-memory cache which keeps at most
+    maxsize entries by removing the least recently used ones, the use
+    of an entry being its insertion or a lookup with :meth:`get` or
+    the [] operator.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Parameters
+        ----------
+        maxsize :
+            The maximum number of entries.
+
+        """
+        if (maxsize <= 0):
+
+            raise LRUDictInputError("The maximum number of entries must "
+                                    "be positive, got {}.".format(maxsize))
+        super().__init__()
+        self._maxsize: int = maxsize
+
+        return None
+    # ==================================================================
+    @property
+    def maxsize(self) -> int:
+
+        return self._maxsize
+    # ==================================================================
+    def __getitem__(self, key: Hashable) -> Any:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+
+        return value
+    # ==================================================================
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while (len(self) > self._maxsize):
+            self.popitem(last=False)
+
+        return None
+    # ==================================================================
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        if (key in self):
+
+            return self[key]
+
+        return default
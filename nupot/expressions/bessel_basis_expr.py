@@ -0,0 +1,261 @@
+
+""".. moduleauthor:: Sacha Medaer"""
+
+from typing import Dict, Iterator, Optional, Tuple
+
+import sympy as sp
+
+import nupot.utils.constants as cst
+import nupot.utils.utilities as util
+
+
+# Exceptions
+class BesselBasisExprInputError(Exception):
+    pass
+
+
+class BesselBasisExprOperationError(Exception):
+    pass
+
+
+class BesselBasisExpr(object):
+    r"""This class represents a linear combination of basis functions,
+    e.g. :math:`K_0(x)`, :math:`K_1(x)`, :math:`KLKL(x)`, :math:`e^{-x}`
+    and :math:`1`, each multiplied by a Laurent polynomial in the generators
+    :attr:`gens`.
+
+    Notes
+    -----
+    Represents the following expression:
+
+    .. math::  \sum_{b} f_b(x_b) \sum_{\vec{k}} c_{b,\vec{k}}
+               \prod_i g_i^{k_i}
+
+    The terms are stored as a mapping from the basis function
+    :math:`f_b(x_b)` (a sympy expression holding the function and its
+    argument, :math:`1` for the polynomial part) to a dict of exponent
+    tuples :math:`\vec{k}` to numeric coefficients
+    :math:`c_{b,\vec{k}}`. The exponents can be rational, e.g.
+    :math:`\frac{1}{2}` for a polynomial in :math:`\sqrt{a}`.
+
+    """
+
+    def __init__(self, gens: Tuple[cst.SYMBOL_TYPE, ...],
+                 terms: Optional[Dict] = None) -> None:
+        self._gens: Tuple[cst.SYMBOL_TYPE, ...] = tuple(gens)
+        self._terms: Dict = {}
+        if (terms is not None):
+            for basis, coeffs in terms.items():
+                for expos, coeff in coeffs.items():
+                    self._add_term(basis, expos, coeff)
+
+        return None
+    # ==================================================================
+    @property
+    def gens(self) -> Tuple[cst.SYMBOL_TYPE, ...]:
+
+        return self._gens
+    # ==================================================================
+    @property
+    def terms(self) -> Dict:
+
+        return self._terms
+    # ==================================================================
+    def basis_functions(self) -> Tuple[cst.EXPR_TYPE, ...]:
+        """Return the basis functions which have non-zero
+        coefficients.
+        """
+
+        return tuple(self._terms.keys())
+    # ==================================================================
+    def items(self) -> Iterator:
+
+        return iter(self._terms.items())
+    # ==================================================================
+    def copy(self) -> 'BesselBasisExpr':
+        res = BesselBasisExpr(self._gens)
+        res._terms = {basis: dict(coeffs)
+                      for basis, coeffs in self._terms.items()}
+
+        return res
+    # ==================================================================
+    def _add_term(self, basis, expos, coeff) -> None:
+        if (not coeff):
+
+            return None
+        expos = tuple(sp.Rational(expo) for expo in expos)
+        coeffs = self._terms.setdefault(basis, {})
+        coeff = coeffs.get(expos, 0) + coeff
+        if (coeff):
+            coeffs[expos] = coeff
+        else:
+            del coeffs[expos]
+            if (not coeffs):
+                del self._terms[basis]
+
+        return None
+    # ==================================================================
+    def _check_gens(self, other: 'BesselBasisExpr') -> None:
+        if (self._gens != other.gens):
+
+            raise BesselBasisExprOperationError("The generators {} and {} "
+                "of the two expressions differ.".format(self._gens,
+                                                        other.gens))
+
+        return None
+    # ==================================================================
+    def __bool__(self) -> bool:
+
+        return bool(self._terms)
+    # ==================================================================
+    def __eq__(self, other) -> bool:
+        if (isinstance(other, BesselBasisExpr)):
+
+            return ((self._gens == other.gens)
+                    and (self._terms == other.terms))
+        if ((not other) and (not self._terms)):
+
+            return True
+
+        return False
+    # ==================================================================
+    def __repr__(self) -> str:
+
+        return 'BesselBasisExpr({}, {})'.format(self._gens, self._terms)
+    # ==================================================================
+    def __neg__(self) -> 'BesselBasisExpr':
+
+        return self.scale(sp.Rational(-1))
+    # ==================================================================
+    def __add__(self, other) -> 'BesselBasisExpr':
+        if ((not isinstance(other, BesselBasisExpr)) and (not other)):
+
+            return self.copy()  # allow the use of sum()
+        if (not isinstance(other, BesselBasisExpr)):
+
+            return NotImplemented
+        self._check_gens(other)
+        res = self.copy()
+        for basis, coeffs in other.items():
+            for expos, coeff in coeffs.items():
+                res._add_term(basis, expos, coeff)
+
+        return res
+    # ==================================================================
+    def __radd__(self, other) -> 'BesselBasisExpr':
+
+        return self.__add__(other)
+    # ==================================================================
+    def __sub__(self, other) -> 'BesselBasisExpr':
+        if (not isinstance(other, BesselBasisExpr)):
+
+            return NotImplemented
+
+        return self.__add__(-other)
+    # ==================================================================
+    def scale(self, coeff, expos: Optional[Tuple] = None
+              ) -> 'BesselBasisExpr':
+        """Return the expression multiplied by the numeric coefficient
+        coeff and by the monomial of exponents expos in the generators.
+        """
+        res = BesselBasisExpr(self._gens)
+        if (not coeff):
+
+            return res
+        if (expos is None):
+            expos = (0,) * len(self._gens)
+        expos = tuple(sp.Rational(expo) for expo in expos)
+        for basis, coeffs in self._terms.items():
+            res._terms[basis] = {tuple(e + f for e, f in zip(expos_, expos)):
+                                 coeff * coeff_
+                                 for expos_, coeff_ in coeffs.items()}
+
+        return res
+    # ==================================================================
+    def __mul__(self, other) -> 'BesselBasisExpr':
+        if (not isinstance(other, BesselBasisExpr)):
+            other = sp.sympify(other)
+            if (other.is_number):
+
+                return self.scale(other)
+
+            return self.__mul__(BesselBasisExpr.from_sympy(other,
+                                                           self._gens))
+        self._check_gens(other)
+        if (set(other.basis_functions()) <= {sp.S.One}):
+            poly, expr = other, self
+        elif (set(self.basis_functions()) <= {sp.S.One}):
+            poly, expr = self, other
+        else:
+
+            raise BesselBasisExprOperationError("The product of two "
+                "non-polynomial basis functions is not in the basis.")
+        res = BesselBasisExpr(self._gens)
+        for expos, coeff in poly.terms.get(sp.S.One, {}).items():
+            res = res + expr.scale(coeff, expos)
+
+        return res
+    # ==================================================================
+    def __rmul__(self, other) -> 'BesselBasisExpr':
+
+        return self.__mul__(other)
+    # ==================================================================
+    def to_sympy(self) -> cst.EXPR_TYPE:
+        """Return the sympy expression corresponding to the stored
+        linear combination.
+        """
+        terms = []
+        for basis, coeffs in self._terms.items():
+            for expos, coeff in coeffs.items():
+                monomial = [gen**expo for gen, expo in zip(self._gens, expos)]
+                terms.append(sp.Mul(coeff, basis, *monomial))
+
+        return sp.Add(*terms)
+    # ==================================================================
+    def collect(self):
+        """Return a list of tuples (coefficient, basis function) with
+        the coefficients as sympy expressions in the generators.
+        """
+        res = []
+        for basis, coeffs in self._terms.items():
+            coeff_expr = sp.Add(*[sp.Mul(coeff,
+                                         *[gen**expo for gen, expo
+                                           in zip(self._gens, expos)])
+                                  for expos, coeff in coeffs.items()])
+            res.append((coeff_expr, basis))
+
+        return res
+    # ==================================================================
+    @classmethod
+    def from_sympy(cls, expr: cst.EXPR_TYPE,
+                   gens: Tuple[cst.SYMBOL_TYPE, ...]) -> 'BesselBasisExpr':
+        """Return the decomposition of the sympy expression expr in
+        basis functions with Laurent polynomial coefficients in gens.
+        The expression is expanded first, which also expands the
+        arguments of the basis functions.
+        """
+        gens = tuple(gens)
+        res = cls(gens)
+        index = {gen: i for i, gen in enumerate(gens)}
+        for term in sp.Add.make_args(sp.sympify(expr).expand()):
+            coeff = sp.Rational(1)
+            expos = [sp.Rational(0)] * len(gens)
+            basis = sp.S.One
+            for factor in sp.Mul.make_args(term):
+                base, expo = factor.as_base_exp()
+                if (factor.is_number):
+                    coeff *= factor
+                elif ((base in index) and expo.is_Rational):
+                    expos[index[base]] += expo
+                elif ((isinstance(base, sp.Function)
+                       or isinstance(factor, sp.exp))
+                      and (basis == sp.S.One)):
+                    basis = factor
+                else:
+
+                    raise BesselBasisExprInputError("The factor {} of the "
+                        "term {} is neither a monomial in {} nor a basis "
+                        "function.".format(factor, term, gens))
+            res._add_term(basis, expos, coeff)
+
+        return res
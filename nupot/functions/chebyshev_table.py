@@ -0,0 +1,148 @@
+
+""".. moduleauthor:: Sacha Medaer"""
+
+import math
+import os
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
+from numpy.polynomial import chebyshev
+from scipy.special import k0, k0e, k1, k1e
+
+from nupot.functions.klkl_function import klkl
+
+
+# Range of the table in u = ln(x)
+U_MIN: float = -20 * math.log(2)
+U_MAX: float = 10 * math.log(2)
+# Number of pieces of equal width in u and degree of their polynomials
+NBR_PIECES: int = 128
+DEGREE: int = 12
+# Maximum relative error of the tabulated functions in the range, K_0
+# and K_1 have the additional rounding error x*2.2e-16 of exp(-x)
+MAX_REL_ERROR: float = 3e-14
+# Stored table, rebuilt if its shape does not match the above parameters
+TABLE_PATH: str = os.path.join(os.path.dirname(__file__), 'data',
+                               'chebyshev_table.npy')
+# Tabulated functions of x, in the order of the rows of the table
+_TABULATED = (lambda x: np.log(k0e(x)), lambda x: np.log(k1e(x)),
+              lambda x: np.log(klkl(x)))
+
+
+def build_table() -> np.ndarray:
+    r"""Return the piecewise Chebyshev table of :math:`\ln(e^xK_0(x))`,
+    :math:`\ln(e^xK_1(x))` and :math:`\ln(KLKL(x))` in
+    :math:`u = \ln(x)`, an array of shape (3, DEGREE+1, NBR_PIECES).
+
+    Notes
+    -----
+    The three functions are smooth and slowly varying in u over the
+    whole range, from the logarithmic behaviour at small x to the
+    algebraic one at large x. Tabulating their logarithm makes the
+    absolute error of the interpolation the relative error of the
+    functions.
+
+    """
+    width = (U_MAX-U_MIN) / NBR_PIECES
+    table = np.empty((len(_TABULATED), DEGREE+1, NBR_PIECES))
+    for i, func in enumerate(_TABULATED):
+        for j in range(NBR_PIECES):
+            u_lo = U_MIN + (j*width)
+            table[i, :, j] = chebyshev.chebinterpolate(
+                lambda t: func(np.exp(u_lo + ((t+1)*width/2))), DEGREE)
+
+    return table
+
+
+@lru_cache(maxsize=None)
+def get_table() -> np.ndarray:
+    """Return the table of :func:`build_table`, loaded from TABLE_PATH.
+    The table is built and saved at the first use if the file is
+    missing or outdated.
+    """
+    shape = (len(_TABULATED), DEGREE+1, NBR_PIECES)
+    if (os.path.isfile(TABLE_PATH)):
+        table = np.load(TABLE_PATH)
+        if (table.shape == shape):
+
+            return table
+    table = build_table()
+    try:
+        os.makedirs(os.path.dirname(TABLE_PATH), exist_ok=True)
+        np.save(TABLE_PATH, table)
+    except OSError:     # read-only installation, keep it in memory only
+        pass
+
+    return table
+
+
+def _clenshaw(coeffs: np.ndarray, t: np.ndarray) -> np.ndarray:
+    # sum_k coeffs[k] T_k(t) with the Clenshaw recurrence
+    b_1 = np.zeros(t.shape)
+    b_2 = np.zeros(t.shape)
+    for k in range(len(coeffs)-1, 0, -1):
+        b_1, b_2 = (2*t*b_1) - b_2 + coeffs[k], b_1
+
+    return (t*b_1) - b_2 + coeffs[0]
+
+
+def _evaluate(row: int, x, exact: Callable, is_scaled: bool) -> np.ndarray:
+    # tabulated function of the row in the range, exact one outside
+    x = np.asarray(x, dtype=float)
+    res = np.empty(x.shape)
+    in_range = (x >= math.exp(U_MIN)) & (x <= math.exp(U_MAX))
+    x_ = x[in_range]
+    width = (U_MAX-U_MIN) / NBR_PIECES
+    u = np.log(x_)
+    index = np.clip(((u-U_MIN)/width).astype(int), 0, NBR_PIECES-1)
+    t = (2*(u-U_MIN-(index*width))/width) - 1
+    log_values = _clenshaw(get_table()[row][:, index], t)
+    if (is_scaled):
+        log_values -= x_
+    res[in_range] = np.exp(log_values)
+    res[~in_range] = exact(x[~in_range])
+
+    return res
+
+
+def k0_table(x) -> np.ndarray:
+    r"""Return the numeric values of :math:`K_0(x)` from the table of
+    :func:`get_table`, vectorized over the array x. The relative error
+    is below MAX_REL_ERROR plus the rounding error :math:`2.2\cdot
+    10^{-16}x` of :math:`e^{-x}` in the range of the table,
+    scipy.special.k0 is used outside.
+    """
+
+    return _evaluate(0, x, k0, True)
+
+
+def k1_table(x) -> np.ndarray:
+    r"""Return the numeric values of :math:`K_1(x)` from the table of
+    :func:`get_table`, vectorized over the array x. The relative error
+    is below MAX_REL_ERROR plus the rounding error :math:`2.2\cdot
+    10^{-16}x` of :math:`e^{-x}` in the range of the table,
+    scipy.special.k1 is used outside.
+    """
+
+    return _evaluate(1, x, k1, True)
+
+
+def klkl_table(x) -> np.ndarray:
+    r"""Return the numeric values of the function :math:`K_0(x)
+    \boldsymbol{L}_{-1}(x) + K_1(x)\boldsymbol{L}_{0}(x)` from the table
+    of :func:`get_table`, vectorized over the array x. The relative
+    error is below MAX_REL_ERROR in the range of the table,
+    :func:`klkl` is used outside.
+
+    Notes
+    -----
+    The tabulated function is several times faster than :func:`klkl`
+    and than scipy.special.kn and modstruve by orders of magnitude.
+    :func:`k0_table` and :func:`k1_table` share the same evaluation but
+    are only faster than the generic scipy.special.kn, not than the
+    dedicated scipy.special.k0 and k1.
+
+    """
+
+    return _evaluate(2, x, klkl, False)
@@ -1,17 +1,168 @@
 
 """.. moduleauthor:: Sacha Medaer"""
 
+from functools import lru_cache
 from typing import Union
 import copy
 
+import mpmath
 import numpy as np
 import sympy as sp
-from scipy.special import kn, modstruve
+from scipy.special import gamma, iv, k0, k0e, k1, k1e
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
 
 
+# Bounds of the regimes of klkl and klkl_remainder_scaled
+X_SMALL: float = 2.0
+X_LARGE: float = 35.0
+# Gauss-Legendre rule on [0, pi/2] of the integral representations
+_GL_NODES, _GL_WEIGHTS = np.polynomial.legendre.leggauss(64)
+_THETA = (np.pi/4) * (_GL_NODES+1)
+_THETA_WEIGHTS = (np.pi/4) * _GL_WEIGHTS
+
+
+def _struve_l_series(x, order: int, nbr_terms: int = 24):
+    # power series of L_nu, converged to double precision for x <= 2
+    term = ((x/2)**(order+1)) / (gamma(1.5)*gamma(order+1.5))
+    res = term.copy()
+    for k in range(1, nbr_terms):
+        term = term * ((x/2)**2) / ((k+0.5)*(k+order+0.5))
+        res += term
+
+    return res
+
+
+def _struve_m_quadrature(x):
+    # M_{-1}(x) = (2/pi) int_0^{pi/2} sin(t) e^{-x sin(t)} dt
+    # M_0(x) = -(2/pi) int_0^{pi/2} e^{-x sin(t)} dt
+    exp_ = np.exp(-x[:, None]*np.sin(_THETA)[None, :])
+    m_m1 = (2/np.pi) * (exp_ @ (_THETA_WEIGHTS*np.sin(_THETA)))
+    m_0 = -(2/np.pi) * (exp_ @ _THETA_WEIGHTS)
+
+    return m_m1, m_0
+
+
+def _struve_m_asymptotic(x, order: int, max_nbr_terms: int = 40):
+    # DLMF 11.6.1, truncated at the smallest term
+    term = (-gamma(0.5) * ((x/2)**(order-1)) / gamma(order+0.5)) / np.pi
+    res = term.copy()
+    is_decreasing = np.ones(x.shape, dtype=bool)
+    for k in range(1, max_nbr_terms):
+        new_term = -term * (k-0.5) * (order+0.5-k) / ((x/2)**2)
+        is_decreasing &= (np.abs(new_term) < np.abs(term))
+        res += np.where(is_decreasing, new_term, 0.0)
+        term = new_term
+
+    return res
+
+
+def klkl_remainder_scaled(x):
+    r"""Return the numeric values of :math:`e^x\big(KLKL(x) -
+    \frac{1}{x}\big)`, vectorized over the array x.
+
+    Notes
+    -----
+    With :math:`\boldsymbol{M}_{\nu} = \boldsymbol{L}_{\nu} - I_{\nu}`
+    and the Wronskian :math:`I_0K_1 + I_1K_0 = \frac{1}{x}`:
+
+    .. math::  KLKL(x) = \frac{1}{x} + K_0(x)\boldsymbol{M}_{-1}(x)
+                         + K_1(x)\boldsymbol{M}_0(x)
+
+    where :math:`\boldsymbol{M}_{-1}` and :math:`\boldsymbol{M}_0` are
+    algebraic at large x, such that the remainder is computed with the
+    exponentially scaled :math:`e^xK_0` and :math:`e^xK_1` without the
+    cancellation of :math:`\boldsymbol{L}_{\nu}` and :math:`I_{\nu}`.
+    The :math:`\boldsymbol{M}_{\nu}` are computed from the power series
+    of :math:`\boldsymbol{L}_{\nu}` for :math:`x \leq` X_SMALL, from
+    their integral representations for :math:`x \leq` X_LARGE and from
+    their asymptotic expansions above. The relative error is below
+    :math:`10^{-13}`.
+
+    """
+    x = np.asarray(x, dtype=float)
+    res = np.empty(x.shape)
+    small = (x <= X_SMALL)
+    large = (x > X_LARGE)
+    mid = ~(small | large)
+    x_ = x[small]
+    res[small] = np.exp(x_) * ((k0(x_)*(_struve_l_series(x_, -1)-iv(1, x_)))
+                               + (k1(x_)*(_struve_l_series(x_, 0)-iv(0, x_))))
+    x_ = x[mid]
+    m_m1, m_0 = _struve_m_quadrature(x_)
+    res[mid] = (k0e(x_)*m_m1) + (k1e(x_)*m_0)
+    x_ = x[large]
+    res[large] = ((k0e(x_)*_struve_m_asymptotic(x_, -1))
+                  + (k1e(x_)*_struve_m_asymptotic(x_, 0)))
+
+    return res
+
+
+def klkl(x):
+    r"""Return the numeric values of the function :math:`K_0(x)
+    \boldsymbol{L}_{-1}(x) + K_1(x)\boldsymbol{L}_{0}(x)`, vectorized
+    over the array x.
+
+    Notes
+    -----
+    For :math:`x \leq` X_SMALL, :math:`\boldsymbol{L}_{-1}` and
+    :math:`\boldsymbol{L}_{0}` are computed from their power series and
+    the function has no cancellation, :math:`f(x) \sim -\frac{2}{\pi}
+    \ln(x)` at small x. Above, the function is computed as
+    :math:`\frac{1}{x} + e^{-x}R(x)` with the remainder :math:`R` of
+    :func:`klkl_remainder_scaled`, such that the growing
+    :math:`\boldsymbol{L}_{\nu}` and the decaying :math:`K_{\nu}` are
+    never multiplied. The relative error is below :math:`10^{-13}`.
+
+    """
+    x = np.asarray(x, dtype=float)
+    res = np.empty(x.shape)
+    zero = (x == 0)
+    small = (x <= X_SMALL) & ~zero
+    large = ~(small | zero)
+    res[zero] = np.inf
+    x_ = x[small]
+    res[small] = ((k0(x_)*_struve_l_series(x_, -1))
+                  + (k1(x_)*_struve_l_series(x_, 0)))
+    x_ = x[large]
+    res[large] = (1/x_) + (np.exp(-x_)*klkl_remainder_scaled(x_))
+
+    return res
+
+
+@lru_cache(maxsize=4096)
+def klkl_mpmath(x, prec: int):
+    r"""Return the value of the function :math:`K_0(x)
+    \boldsymbol{L}_{-1}(x) + K_1(x)\boldsymbol{L}_{0}(x)` at the
+    mpmath number x with prec bits of precision, memoized per (x, prec).
+
+    Notes
+    -----
+    The two terms are computed with guard bits. If their sum cancels
+    more bits than the guard bits, which can happen for complex
+    arguments, the working precision is raised by the number of lost
+    bits and the terms are computed again.
+
+    """
+    guard = 16
+    while (True):
+        with mpmath.workprec(prec + guard):
+            term_0 = mpmath.besselk(0, x) * mpmath.struvel(-1, x)
+            term_1 = mpmath.besselk(1, x) * mpmath.struvel(0, x)
+            res = term_0 + term_1
+            if (not mpmath.isfinite(res) or not res):
+
+                return res
+            lost = (max(mpmath.mag(term_0), mpmath.mag(term_1))
+                    - mpmath.mag(res))
+        if (lost < guard):
+            with mpmath.workprec(prec):
+
+                return +res
+        guard = lost + 16
+
+
 class KLKLFunction(sp.Function):
     r"""
 
@@ -23,6 +174,8 @@ class KLKLFunction(sp.Function):
                       + K_1(x)\boldsymbol{L}_{0}(x)
 
     """
+    # Numeric implementation used by sp.lambdify
+    _imp_ = staticmethod(klkl)
     # ==================================================================
     @property
     def argument(self):
@@ -40,16 +193,20 @@ class KLKLFunction(sp.Function):
             return sp.core.S.Zero
     # ==================================================================
     def _eval_evalf(self, prec) -> sp.Float:
-        """Return the custom evaluation of the symbol."""
-        x_var = self.argument
-        # evalf return a sympy float, need to convert to python float first
-        x_num = float(x_var.evalf())
-        K_1: float = kn(1, x_num)
-        K_0: float = kn(0, x_num)
-        L_m1 = modstruve(-1, x_num)
-        L_0 = modstruve(0, x_num)
-
-        return sp.core.numbers.Float((K_0*L_m1) + (K_1*L_0))
+        """Return the custom evaluation of the symbol with prec bits of
+        precision, from :func:`klkl` up to the double precision and from
+        :func:`klkl_mpmath` above.
+        """
+        try:
+            x_num = self.argument._to_mpmath(prec + 5)
+        except ValueError:
+
+            return None
+        if ((prec <= 53) and isinstance(x_num, mpmath.mpf)):
+
+            return sp.Float(float(klkl(float(x_num))), precision=prec)
+
+        return sp.Expr._from_mpmath(klkl_mpmath(x_num, prec), prec)
     # ==================================================================
     def _latex(self, printer) -> str:
         x_var = self.argument
@@ -2,7 +2,7 @@
 """.. moduleauthor:: Sacha Medaer"""
 
 from abc import ABCMeta
-from typing import Union
+from typing import Callable, Dict, List, Tuple, Union
 
 import numpy as np
 import sympy as sp
@@ -17,7 +17,18 @@ class AbstractIntegralBInputError(Exception):
     pass
 
 
+# Coefficients (c, p, q, basis) of the terms c r^p alpha^q f_basis(alpha r)
+COEFFS_TYPE = Tuple[Tuple[sp.Rational, int, int, int], ...]
+
+
 class AbstractIntegralB(AbstractIntegral):
+    # Indices of the basis functions of the closed forms, BASE is the
+    # specific function of the family at the bottom of the recurrence
+    K0: int = 0
+    K1: int = 1
+    BASE: int = 2
+    # Hints of doit which are passed along to solve_integral
+    solve_hints: Tuple[str, ...] = ()
     # ==================================================================
     def doit(self, deep=False, **hints):
         # Extracting arguments
@@ -41,28 +52,118 @@ class AbstractIntegralB(AbstractIntegral):
             n = n.doit(deep=deep, **hints)
             alpha = alpha.doit(deep=deep, **hints)
             r = r.doit(deep=deep, **hints)
+        options = {key: hints[key] for key in self.solve_hints
+                   if key in hints}
 
         if (definite_integral):
             if (is_fully_definite):
                 if (b.is_infinite):
 
-                    return -1*self.solve_integral(a, n, alpha)
+                    return -1*self.solve_integral(a, n, alpha, **options)
                 else:
 
-                    return (self.solve_integral(b, n, alpha)
-                            - self.solve_integral(a, n, alpha))
+                    return (self.solve_integral(b, n, alpha, **options)
+                            - self.solve_integral(a, n, alpha, **options))
             else:
                 if (a.is_infinite):
 
                     return sp.Rational(0)
                 else:
 
-                    return self.solve_integral(a, n, alpha)
+                    return self.solve_integral(a, n, alpha, **options)
         else:
 
-            return self.solve_integral(r, n, alpha)
+            return self.solve_integral(r, n, alpha, **options)
     # ==================================================================
     @staticmethod
     def solve_integral(r, *args):
 
         return NotImplementedError()
+    # ==================================================================
+    @classmethod
+    def evaluate(cls, n: int, alpha, r_lo, r_hi) -> np.ndarray:
+        r"""Return the numeric values of the definite integral of order
+        n with limits between r_lo and r_hi, vectorized over the arrays
+        alpha, r_lo and r_hi which are broadcast together.
+
+        Notes
+        -----
+        The difference of :meth:`evaluate_antiderivative` at both limits
+        is returned, the value at r_hi = inf is the analytic limit of
+        the antiderivative from :meth:`evaluate_at_infinity`. The
+        relative accuracy decreases with n for small :math:`\alpha r`
+        where the terms of the closed form cancel.
+
+        """
+        alpha, r_lo, r_hi = np.broadcast_arrays(
+            np.asarray(alpha, dtype=float), np.asarray(r_lo, dtype=float),
+            np.asarray(r_hi, dtype=float))
+        infinite = np.isinf(r_hi)
+        res = np.empty(alpha.shape)
+        res[~infinite] = cls.evaluate_antiderivative(n, alpha[~infinite],
+                                                     r_hi[~infinite])
+        res[infinite] = cls.evaluate_at_infinity(n, alpha[infinite])
+
+        return res - cls.evaluate_antiderivative(n, alpha, r_lo)
+    # ==================================================================
+    @staticmethod
+    def evaluate_antiderivative(n, alpha, r):
+
+        return NotImplementedError()
+    # ==================================================================
+    @staticmethod
+    def evaluate_at_infinity(n: int, alpha: np.ndarray) -> np.ndarray:
+        """Return the limit at infinity of the antiderivative of
+        :meth:`evaluate_antiderivative`, zero unless the family defines
+        a non vanishing limit.
+        """
+
+        return np.zeros(np.shape(alpha))
+    # ==================================================================
+    @staticmethod
+    def unroll_recurrence(n: int, base: List[Tuple], step: Callable
+                          ) -> COEFFS_TYPE:
+        r"""Return the coefficients of the closed form of the integral
+        of order n of a family defined by the recurrence:
+
+        .. math::  I_k = \sum_{(c, p, q, b) \in T_k} c\, r^p \alpha^q
+                         f_b(\alpha r) + g_k \alpha^{s_k} I_{k-1}
+
+        with :math:`I_0` given by the coefficients base and step(k)
+        returning :math:`(T_k, g_k, s_k)`. The coefficients are built
+        bottom-up from :math:`I_0` as exact rationals.
+        """
+        coeffs = tuple((sp.Rational(c), p, q, b) for c, p, q, b in base)
+        for k in range(1, int(n)+1):
+            terms, factor, alpha_power = step(k)
+            factor = sp.Rational(factor)
+            coeffs = (tuple((sp.Rational(c), p, q, b)
+                            for c, p, q, b in terms if c)
+                      + tuple((factor*c, p, q+alpha_power, b)
+                              for c, p, q, b in coeffs if factor))
+
+        return coeffs
+    # ==================================================================
+    @staticmethod
+    def build_closed_form(coeffs: COEFFS_TYPE, r, alpha, basis: Dict
+                          ) -> cst.EXPR_TYPE:
+        """Return the expression of the coefficients coeffs of
+        :meth:`unroll_recurrence` in a single pass, basis maps the
+        indices of the basis functions to their expressions.
+        """
+
+        return sp.Add(*[c * (r**p) * (alpha**q) * basis[b]
+                        for c, p, q, b in coeffs])
+    # ==================================================================
+    @staticmethod
+    def evaluate_closed_form(coeffs: COEFFS_TYPE, r: np.ndarray,
+                             alpha: np.ndarray, basis: Dict) -> np.ndarray:
+        """Return the numeric values of the closed form of the
+        coefficients coeffs of :meth:`unroll_recurrence`, basis maps the
+        indices of the basis functions to their values at alpha r.
+        """
+        res = np.zeros(np.broadcast(r, alpha).shape)
+        for c, p, q, b in coeffs:
+            res += float(c) * (r**p) * (alpha**q) * basis[b]
+
+        return res
@@ -2,13 +2,17 @@
 """.. moduleauthor:: Sacha Medaer"""
 
 import copy
+from collections import namedtuple
+from functools import lru_cache
 
 import numpy as np
 import sympy as sp
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
+from nupot.expressions.bessel_basis_expr import BesselBasisExpr
 from nupot.integrals.abstract_integral import AbstractIntegral
+from nupot.integrals.quadratureAA import QuadratureAA
 from nupot.functions.klkl_function import KLKLFunction
 
 
@@ -17,6 +21,9 @@ class IntegralAAInputError(Exception):
     pass
 
 
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'currsize'])
+
+
 class FunctionAA(sp.Function):
     # Sympy advises not to create such function, instead use python
     # functions, the exception is made here to follow the Function
@@ -37,7 +44,27 @@ class IntegralAA(AbstractIntegral):
     .. math::  \int_{a}^{\infty} x^{\rho} (x-a)^{\mu}
                e^{-r \sqrt{x}} dx
 
+    The solutions of the definite integral are memoized on
+    :math:`(\rho, \mu)`. Each solution is stored once as a template in
+    the placeholder symbols :attr:`a_cache` and :attr:`r_cache`, and the
+    actual :math:`a` and :math:`r` are substituted in the template on
+    later calls. The templates are combined in the integration by parts
+    as :class:`BesselBasisExpr`, i.e. as Laurent polynomials in
+    :math:`a` and :math:`r` in front of the basis functions.
+
     """
+    # Placeholder symbols of the memoized templates
+    a_cache = sp.Symbol('a_cache', positive=True)
+    r_cache = sp.Symbol('r_cache', positive=True)
+    __cache: dict = {}
+    __cache_hits: int = 0
+    __cache_misses: int = 0
+    __numeric_cache: dict = {}
+    # (rho, mu) solved by Feynman's trick in _solve_def_integral
+    feynman_cases = frozenset({(sp.Rational(-1), sp.Rational(1, 2)),
+                               (sp.Rational(-1), sp.Rational(-1, 2)),
+                               (sp.Rational(-1), sp.Rational(-3, 2)),
+                               (sp.Rational(-3, 2), sp.Rational(-3, 2))})
     # ==================================================================
     @classmethod
     def _get_integrand(cls, x, *args):
@@ -83,8 +110,153 @@ class IntegralAA(AbstractIntegral):
         # all other possibilities are not defined
     # ==================================================================
     @staticmethod
+    def cache_info() -> CacheInfo:
+        """Return the hits, misses and current size of the memoization
+        table of :meth:`solve_def_integral`.
+        """
+
+        return CacheInfo(IntegralAA.__cache_hits, IntegralAA.__cache_misses,
+                         len(IntegralAA.__cache))
+    # ==================================================================
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the memoization table of :meth:`solve_def_integral`
+        and reset its statistics.
+        """
+        IntegralAA.__cache.clear()
+        IntegralAA.__cache_hits = 0
+        IntegralAA.__cache_misses = 0
+        IntegralAA.__numeric_cache.clear()
+    # ==================================================================
+    @staticmethod
+    def has_closed_form(rho, mu) -> bool:
+        """Return True if the closed form of the definite integral is
+        known for the parameters rho and mu, i.e. if both are integer
+        or half-integer and the recursion of :meth:`_solve_def_integral`
+        terminates without dividing by zero.
+        """
+        if (not ((2*sp.Rational(rho)).is_integer
+                 and (2*sp.Rational(mu)).is_integer)):
+
+            return False
+
+        return IntegralAA._terminates(sp.Rational(rho), sp.Rational(mu))
+    # ==================================================================
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _terminates(rho, mu) -> bool:
+        # follow the branches of _solve_def_integral without computing
+        if ((rho == sp.Rational(-1, 2)) or (not rho)):
+            # pole of gamma(mu+1) in the integral table
+
+            return (not ((mu + 1).is_integer and (mu + 1 <= 0)))
+        if ((rho, mu) in IntegralAA.feynman_cases):
+
+            return True
+        if (rho == sp.Rational(-1)):
+            if (mu < sp.Rational(-3, 2)):
+
+                return (IntegralAA._terminates(sp.Rational(0), mu)
+                        and IntegralAA._terminates(rho, mu + 1))
+            # integration by parts would divide by rho+1=0
+
+            return False
+        if (rho > 0):
+            if (mu == sp.Rational(-1)):    # would divide by mu+1=0
+
+                return False
+
+            return (IntegralAA._terminates(rho - sp.Rational(1, 2), mu + 1)
+                    and IntegralAA._terminates(rho - 1, mu + 1))
+
+        return (IntegralAA._terminates(rho + sp.Rational(1, 2), mu)
+                and IntegralAA._terminates(rho + 1, mu - 1))
+    # ==================================================================
+    @staticmethod
+    def _get_cache_entry(rho, mu):
+        key = (sp.Rational(rho), sp.Rational(mu))
+        entry = IntegralAA.__cache.get(key)
+        if ((entry is None) and (not IntegralAA.has_closed_form(*key))):
+
+            raise IntegralAAInputError("No closed form is known for "
+                "rho={} and mu={}, the numeric evaluation is provided by "
+                "IntegralAA.evaluate.".format(*key))
+        if (entry is None):
+            IntegralAA.__cache_misses += 1
+            basis_template = IntegralAA._solve_def_integral(
+                None, *key, IntegralAA.a_cache, IntegralAA.r_cache)
+            entry = (basis_template, basis_template.to_sympy())
+            IntegralAA.__cache[key] = entry
+        else:
+            IntegralAA.__cache_hits += 1
+
+        return entry
+    # ==================================================================
+    @staticmethod
+    def get_basis_template(rho, mu) -> BesselBasisExpr:
+        """Return the solution of the definite integral for the
+        parameters rho and mu as a :class:`BesselBasisExpr` in the
+        generators :attr:`a_cache` and :attr:`r_cache`.
+        """
+
+        return IntegralAA._get_cache_entry(rho, mu)[0]
+    # ==================================================================
+    @staticmethod
+    def get_template(rho, mu) -> cst.EXPR_TYPE:
+        """Return the solution of the definite integral for the
+        parameters rho and mu, expressed in the placeholder symbols
+        :attr:`a_cache` and :attr:`r_cache`.
+        """
+
+        return IntegralAA._get_cache_entry(rho, mu)[1]
+    # ==================================================================
+    @staticmethod
+    def evaluate(rho, mu, a, r) -> np.ndarray:
+        """Return the numeric values of the definite integral for the
+        parameters rho and mu, vectorized over the arrays a and r which
+        are broadcast together. The closed form of each (rho, mu) is
+        compiled once with :func:`util.lambdify_numeric` and reused. If no
+        closed form is known for (rho, mu), the integral is computed with
+        :class:`QuadratureAA`.
+        """
+        key = (sp.Rational(rho), sp.Rational(mu))
+        if (not IntegralAA.has_closed_form(*key)):
+
+            return QuadratureAA.evaluate(rho, mu, a, r)
+        func = IntegralAA.__numeric_cache.get(key)
+        if (func is None):
+            # collected form -> each basis function is evaluated once
+            collected = IntegralAA.get_basis_template(*key).collect()
+            expr = sp.Add(*[coeff*basis for coeff, basis in collected])
+            func = util.lambdify_numeric((IntegralAA.a_cache,
+                                          IntegralAA.r_cache), expr)
+            IntegralAA.__numeric_cache[key] = func
+        a = np.asarray(a, dtype=float)
+        r = np.asarray(r, dtype=float)
+
+        return np.broadcast_to(func(a, r), np.broadcast(a, r).shape)
+    # ==================================================================
+    @staticmethod
     def solve_def_integral(x, rho, mu, a, r):
-        r"""
+        """Return the solution of the definite integral, see
+        :meth:`_solve_def_integral` for the details of the computation.
+        """
+        template = IntegralAA.get_template(rho, mu)
+        if ((a == IntegralAA.a_cache) and (r == IntegralAA.r_cache)):
+
+            return template
+        # the argument must be expanded for the factorization logic
+        b_arg_cache = IntegralAA.r_cache*(IntegralAA.a_cache**sp.Rational(1, 2))
+        b_arg = (r*(a**sp.Rational(1, 2))).expand()
+        template = template.xreplace({b_arg_cache: b_arg})
+
+        return template.xreplace({IntegralAA.a_cache: a, IntegralAA.r_cache: r})
+    # ==================================================================
+    @staticmethod
+    def _solve_def_integral(x, rho, mu, a, r) -> BesselBasisExpr:
+        r"""Return the solution of the definite integral as a
+        :class:`BesselBasisExpr` in the generators a and r.
+
         Notes
         -----
         sp.Symbolic computation :
@@ -140,48 +312,55 @@ class IntegralAA(AbstractIntegral):
         b_arg = (r*(a**sp.Rational(1, 2))).expand()
         klkl = KLKLFunction(b_arg)
         if ((rho == sp.Rational(-1, 2))):  # Integral Table
-            bessel_order = mu+0.5
-            bessel_fct = sp.besselk(sp.Rational(bessel_order), b_arg)
-            if (bessel_order > 1):    # will transform K_n in K_0 and K_1
-                bessel_fct = sp.simplify(bessel_fct)
+            bessel_order = mu + sp.Rational(1, 2)
+            # K_n in K_0 and K_1, or K_{n+1/2} in elementary functions
+            bessel_fct = util.besselk_reduced(bessel_order, b_arg)
 
-            return (sp.gamma(mu+1)*sp.Rational(2**(mu+1.5))
+            expr = (sp.gamma(mu+1)*(2**(mu+sp.Rational(3, 2)))
                     *(sp.pi**sp.Rational(-1, 2))
                     *(r**sp.Rational(-0.5-mu))*(a**sp.Rational(0.5*mu+0.25))
                     *bessel_fct)
 
         elif (not rho): # Integral Table
-            bessel_order = mu+1.5
-            bessel_fct = sp.besselk(sp.Rational(bessel_order), b_arg)
-            if (bessel_order > 1):    # will transform K_n in K_0 and K_1
-                bessel_fct = sp.simplify(bessel_fct)
+            bessel_order = mu + sp.Rational(3, 2)
+            # K_n in K_0 and K_1, or K_{n+1/2} in elementary functions
+            bessel_fct = util.besselk_reduced(bessel_order, b_arg)
 
-            return (sp.gamma(mu+1)*sp.Rational(2**(mu+1.5))
+            expr = (sp.gamma(mu+1)*(2**(mu+sp.Rational(3, 2)))
                     *(sp.pi**sp.Rational(-1, 2))
                     *(r**sp.Rational(-0.5-mu))*(a**sp.Rational(0.5*mu+0.75))
                     *bessel_fct)
 
         elif ((rho == sp.Rational(-1)) and (mu == sp.Rational(1, 2))):  # Feynman
 
-            return ((2*(a**sp.Rational(1, 2))*sp.besselk(1, b_arg))
+            expr = ((2*(a**sp.Rational(1, 2))*sp.besselk(1, b_arg))
                     + (sp.pi*a*r*klkl) - (sp.pi*(a**sp.Rational(1, 2))))
 
         elif ((rho == sp.Rational(-1)) and (mu == sp.Rational(-1, 2))): # Feynman
 
-            return (-r*sp.pi*klkl) + (sp.pi*(a**sp.Rational(-1, 2)))
+            expr = (-r*sp.pi*klkl) + (sp.pi*(a**sp.Rational(-1, 2)))
 
         elif ((rho == sp.Rational(-1)) and (mu == sp.Rational(-3, 2))): # Feynman
 
-            return ((sp.pi*(a**sp.Rational(-1))*r*klkl)
+            expr = ((sp.pi*(a**sp.Rational(-1))*r*klkl)
                     - (sp.pi*(a**sp.Rational(-3, 2)))
                     - (2*(a**sp.Rational(-1))*r*sp.besselk(0, b_arg)))
 
         elif ((rho == sp.Rational(-3, 2)) and (mu == sp.Rational(-3, 2))): # Feynman
 
-            return ((sp.pi*(a**sp.Rational(-3, 2))*r)
+            expr = ((sp.pi*(a**sp.Rational(-3, 2))*r)
                     - (sp.pi*(a**sp.Rational(-1))*(r**2)*klkl)
                     - (4*(a**sp.Rational(-3, 2))*r*sp.besselk(1, b_arg)))
 
+        elif ((rho == sp.Rational(-1)) and (mu < sp.Rational(-3, 2))):
+            # x^{-1} = x^{-1} (x-a)/a + 1/a, the integration by parts
+            # below would divide by rho+1=0
+            integral_1 = IntegralAA.get_basis_template(sp.Rational(0), mu)
+            integral_2 = IntegralAA.get_basis_template(sp.Rational(-1),
+                                                       mu + sp.Rational(1))
+
+            return (integral_1 - integral_2).scale(sp.Rational(1), (-1, 0))
+
         else:       # Integration by parts
             # Tried mu < 3/2, integrate by part with integ (t-a)
             # but then loop for ever
@@ -192,12 +371,12 @@ class IntegralAA(AbstractIntegral):
                 coeff_second_deriv = copy.copy(rho)
                 rho_int_1 = rho + sp.Rational(-1, 2)
                 mu_int_1 = mu + sp.Rational(1)
-                integral_1 = IntegralAA.solve_def_integral(x, rho_int_1,
-                                                           mu_int_1, a, r)
+                integral_1 = IntegralAA.get_basis_template(rho_int_1,
+                                                           mu_int_1)
                 rho_int_2 = rho + sp.Rational(-1)
                 mu_int_2 = mu + sp.Rational(1)
-                integral_2 = IntegralAA.solve_def_integral(x, rho_int_2,
-                                                           mu_int_2, a, r)
+                integral_2 = IntegralAA.get_basis_template(rho_int_2,
+                                                           mu_int_2)
 
                 return ((part_factor*coeff_first_integ*coeff_first_deriv
                          *integral_1)
@@ -211,15 +390,17 @@ class IntegralAA(AbstractIntegral):
                 coeff_second_deriv = copy.copy(mu)
                 rho_int_1 = rho + sp.Rational(1) + sp.Rational(-1, 2)
                 mu_int_1 = copy.copy(mu)
-                integral_1 = IntegralAA.solve_def_integral(x, rho_int_1,
-                                                           mu_int_1, a, r)
+                integral_1 = IntegralAA.get_basis_template(rho_int_1,
+                                                           mu_int_1)
                 rho_int_2 = rho + sp.Rational(1)
                 mu_int_2 = mu - sp.Rational(1)
-                integral_2 = IntegralAA.solve_def_integral(x, rho_int_2,
-                                                           mu_int_2, a, r)
+                integral_2 = IntegralAA.get_basis_template(rho_int_2,
+                                                           mu_int_2)
 
                 return ((part_factor*coeff_first_integ*coeff_first_deriv
                          *integral_1)
                         + (part_factor*coeff_first_integ*coeff_second_deriv
                            *integral_2)
                         )
+
+        return BesselBasisExpr.from_sympy(expr, (a, r))
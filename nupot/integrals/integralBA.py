@@ -8,7 +8,7 @@ import sympy as sp
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
-from nupot.functions.klkl_function import KLKLFunction
+from nupot.functions.klkl_function import KLKLFunction, klkl
 from nupot.integrals.abstract_integralB import AbstractIntegralB
 from nupot.integrals.integralBB import IntegralBB
 
@@ -82,3 +82,23 @@ class IntegralBA(AbstractIntegralB):
         return (((r**sp.Rational((2*n)+2)) * klkl * sp.Rational(1, (2*n)+1))
                 - (sp.Rational(2, (2*n)+1) * integral_ / sp.pi)
                )
+    # ==================================================================
+    @staticmethod
+    def evaluate_antiderivative(n: int, alpha: np.ndarray, r: np.ndarray
+                                ) -> np.ndarray:
+        """Return the numeric values of the closed form of
+        :meth:`solve_integral`, vectorized over alpha and r.
+        """
+        integral_ = IntegralBB.evaluate_antiderivative(n, alpha, r)
+
+        return (((r**((2*n)+2)) * klkl(alpha*r) / ((2*n)+1))
+                - (2 * integral_ / (np.pi*((2*n)+1))))
+    # ==================================================================
+    @staticmethod
+    def evaluate_at_infinity(n: int, alpha: np.ndarray) -> np.ndarray:
+        """Return the limit at infinity of the closed form of
+        :meth:`solve_integral`, the integral diverges as the integrand
+        behaves as :math:`r^{2n}/\alpha`.
+        """
+
+        return np.full(np.shape(alpha), np.inf)
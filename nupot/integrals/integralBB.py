@@ -2,13 +2,16 @@
 """.. moduleauthor:: Sacha Medaer"""
 
 import copy
+from functools import lru_cache
 
 import numpy as np
 import sympy as sp
+from scipy.special import k0, k1
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
-from nupot.integrals.abstract_integralB import AbstractIntegralB
+from nupot.integrals.abstract_integralB import COEFFS_TYPE,\
+                                              AbstractIntegralB
 
 
 # Exceptions
@@ -70,17 +73,39 @@ class IntegralBB(AbstractIntegralB):
         """
         # the argument must be expanded for the factorization logic
         b_arg = (alpha * r).expand()
-        k0 = sp.besselk(0, b_arg)
-        k1 = sp.besselk(1, b_arg)
+        basis = {IntegralBB.K0: sp.besselk(0, b_arg),
+                 IntegralBB.K1: sp.besselk(1, b_arg)}
 
-        if (not n):
+        return IntegralBB.build_closed_form(IntegralBB.get_coefficients(n),
+                                            r, alpha, basis)
+    # ==================================================================
+    @staticmethod
+    def evaluate_antiderivative(n: int, alpha: np.ndarray, r: np.ndarray
+                                ) -> np.ndarray:
+        """Return the numeric values of the closed form of
+        :meth:`solve_integral`, vectorized over alpha and r.
+        """
+        x = alpha * r
+        basis = {IntegralBB.K0: k0(x), IntegralBB.K1: k1(x)}
+
+        return IntegralBB.evaluate_closed_form(
+            IntegralBB.get_coefficients(n), r, alpha, basis)
+    # ==================================================================
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_coefficients(n) -> COEFFS_TYPE:
+        r"""Return the coefficients of the closed form of order n, see
+        :meth:`unroll_recurrence`, from the recurrence:
 
-            return (-r / alpha * k1)
+        .. math:: I_n = -\frac{1}{\alpha}r^{2n+1} K_1(\alpha r)
+                        - \frac{2n}{\alpha^2} r^{2n} K_0(\alpha r)
+                        + \frac{4n^2}{\alpha^2} I_{n-1}
+
+        """
+        def step(k):
 
-        else:
-            integral_ = IntegralBB.solve_integral(r, n-1, alpha)
+            return ([(-1, (2*k)+1, -1, IntegralBB.K1),
+                     (-2*k, 2*k, -2, IntegralBB.K0)], 4*(k**2), -2)
 
-            return ((-(r**sp.Rational((2*n)+1))/alpha*k1)
-                    + (-2*n*(r**sp.Rational(2*n))/(alpha**sp.Rational(2))*k0)
-                    + (4*(n**sp.Rational(2))/(alpha**sp.Rational(2))*integral_)
-                   )
+        return IntegralBB.unroll_recurrence(
+            n, [(-1, 1, -1, IntegralBB.K1)], step)
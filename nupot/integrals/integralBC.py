@@ -2,13 +2,16 @@
 """.. moduleauthor:: Sacha Medaer"""
 
 import copy
+from functools import lru_cache
 
 import numpy as np
 import sympy as sp
+from scipy.special import k0, k1
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
-from nupot.integrals.abstract_integralB import AbstractIntegralB
+from nupot.integrals.abstract_integralB import COEFFS_TYPE,\
+                                              AbstractIntegralB
 
 
 # Exceptions
@@ -65,17 +68,40 @@ class IntegralBC(AbstractIntegralB):
         """
         # the argument must be expanded for the factorization logic
         b_arg = (alpha * r).expand()
-        k0 = sp.besselk(0, b_arg)
-        k1 = sp.besselk(1, b_arg)
+        basis = {IntegralBC.K0: sp.besselk(0, b_arg),
+                 IntegralBC.K1: sp.besselk(1, b_arg)}
 
-        if (not n):
+        return IntegralBC.build_closed_form(IntegralBC.get_coefficients(n),
+                                            r, alpha, basis)
+    # ==================================================================
+    @staticmethod
+    def evaluate_antiderivative(n: int, alpha: np.ndarray, r: np.ndarray
+                                ) -> np.ndarray:
+        """Return the numeric values of the closed form of
+        :meth:`solve_integral`, vectorized over alpha and r.
+        """
+        x = alpha * r
+        basis = {IntegralBC.K0: k0(x), IntegralBC.K1: k1(x)}
 
-            return (-k0 / alpha)
+        return IntegralBC.evaluate_closed_form(
+            IntegralBC.get_coefficients(n), r, alpha, basis)
+    # ==================================================================
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_coefficients(n) -> COEFFS_TYPE:
+        r"""Return the coefficients of the closed form of order n, see
+        :meth:`unroll_recurrence`, from the recurrence:
+
+        .. math:: I_n = -\frac{1}{\alpha}r^{2n} K_0(\alpha r)
+                        - \frac{2n}{\alpha^2} r^{2n-1} K_1(\alpha r)
+                        + \frac{2n(2n-2)}{\alpha^2} I_{n-1}
+
+        """
+        def step(k):
 
-        else:
-            integral_ = IntegralBC.solve_integral(r, n-1, alpha).doit()
+            return ([(-1, 2*k, -1, IntegralBC.K0),
+                     (-2*k, (2*k)-1, -2, IntegralBC.K1)],
+                    2*k*((2*k)-2), -2)
 
-            return (-(r**sp.Rational(2*n)/alpha*k0)
-                    + (-2*n*(r**sp.Rational(2*n-1))/(alpha**sp.Rational(2))*k1)
-                    + (2*n*((2*n)-2)/(alpha**sp.Rational(2))*integral_)
-                   )
+        return IntegralBC.unroll_recurrence(
+            n, [(-1, 0, -1, IntegralBC.K0)], step)
@@ -2,9 +2,11 @@
 """.. moduleauthor:: Sacha Medaer"""
 
 import copy
+from typing import Optional, Tuple
 
 import numpy as np
 import sympy as sp
+from scipy.special import k0, k1
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
@@ -43,6 +45,8 @@ class IntegralBD(AbstractIntegralB):
     .. math::  \int r^{-2n} K_1(\alpha r)d r
 
     """
+    # Hints of doit which are passed along to solve_integral
+    solve_hints: Tuple[str, ...] = ('nbr_terms', 'x_max')
     # ==================================================================
     @classmethod
     def _get_integrand(cls, r, *args):
@@ -50,7 +54,8 @@ class IntegralBD(AbstractIntegralB):
         return FunctionBD(r, *args)
     # ==================================================================
     @staticmethod
-    def solve_integral(r, n, alpha):
+    def solve_integral(r, n, alpha, nbr_terms: Optional[int] = None,
+                       x_max: Optional[float] = None):
         r"""
         Notes
         -----
@@ -60,6 +65,9 @@ class IntegralBD(AbstractIntegralB):
                   = - \frac{1}{2n} r^{-2n+1}K_1(\alpha r)
                     - \frac{\alpha }{2n}\int r^{-2n +1} K_0(\alpha r)d r
 
+        with nbr_terms and x_max passed along to
+        :meth:`IntegralBE.solve_integral`.
+
         """
         # the argument must be expanded for the factorization logic
         b_arg = (alpha * r).expand()
@@ -71,8 +79,26 @@ class IntegralBD(AbstractIntegralB):
             return (-k0 / alpha)
 
         else:
-            integral_ = IntegralBE.solve_integral(r, n-1, alpha).doit()
+            integral_ = IntegralBE.solve_integral(r, n-1, alpha, nbr_terms,
+                                                  x_max)
 
             return ((sp.Rational(-1, 2*n)*(r**((-2*n)+1))*k1)
                     - (alpha * sp.Rational(1, 2*n) * integral_)
                    )
+    # ==================================================================
+    @staticmethod
+    def evaluate_antiderivative(n: int, alpha: np.ndarray, r: np.ndarray
+                                ) -> np.ndarray:
+        """Return the numeric values of the closed form of
+        :meth:`solve_integral`, vectorized over alpha and r.
+        """
+        x = alpha * r
+        if (not n):
+
+            return (-k0(x) / alpha)
+
+        else:
+            integral_ = IntegralBE.evaluate_antiderivative(n-1, alpha, r)
+
+            return ((-(r**((-2*n)+1)) * k1(x) / (2*n))
+                    - (alpha * integral_ / (2*n)))
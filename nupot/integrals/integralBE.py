@@ -2,13 +2,17 @@
 """.. moduleauthor:: Sacha Medaer"""
 
 import copy
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import numpy as np
 import sympy as sp
+from scipy.special import k0, k1
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
-from nupot.integrals.abstract_integralB import AbstractIntegralB
+from nupot.integrals.abstract_integralB import COEFFS_TYPE,\
+                                              AbstractIntegralB
 from nupot.integrals.ksi_integral import KSiIntegral
 
 
@@ -43,6 +47,11 @@ class IntegralBE(AbstractIntegralB):
     .. math::  \int r^{-2n-1} K_0(\alpha r)d r
 
     """
+    # Number of terms of the series of KSiIntegral in the closed forms
+    # if neither nbr_terms nor x_max is given, accurate for alpha*r <~ 1
+    default_nbr_terms: int = 6
+    # Hints of doit which are passed along to solve_integral
+    solve_hints: Tuple[str, ...] = ('nbr_terms', 'x_max')
     # ==================================================================
     @classmethod
     def _get_integrand(cls, r, *args):
@@ -50,7 +59,8 @@ class IntegralBE(AbstractIntegralB):
         return FunctionBE(r, *args)
     # ==================================================================
     @staticmethod
-    def solve_integral(r, n, alpha):
+    def solve_integral(r, n, alpha, nbr_terms: Optional[int] = None,
+                       x_max: Optional[float] = None):
         r"""
         Notes
         -----
@@ -59,22 +69,57 @@ class IntegralBE(AbstractIntegralB):
         .. math:: \int r^{-2n-1} K_0(\alpha  r) d r
                   = -\frac{1}{2n}r^{-2n} K_0(\alpha  r)
                     + \frac{\alpha }{4n^2} r^{-2n+1}K_1(\alpha  r)
-                    + \frac{a}{4n^2}\int r^{-2n+1} K_0(\alpha  r) d r
+                    + \frac{\alpha^2}{4n^2}\int r^{-2n+1} K_0(\alpha  r) d r
+
+        The series of :meth:`KSiIntegral.solve_def_integral` is truncated
+        after nbr_terms terms, or sized for :math:`\alpha r \leq` x_max.
+        If both are None, :attr:`default_nbr_terms` terms are used. Both
+        are also available as hints of :meth:`doit`.
 
         """
+        if ((nbr_terms is None) and (x_max is None)):
+            nbr_terms = IntegralBE.default_nbr_terms
         # the argument must be expanded for the factorization logic
         b_arg = (alpha * r).expand()
-        k0 = sp.besselk(0, b_arg)
-        k1 = sp.besselk(1, b_arg)
+        basis = {IntegralBE.K0: sp.besselk(0, b_arg),
+                 IntegralBE.K1: sp.besselk(1, b_arg),
+                 IntegralBE.BASE: KSiIntegral.solve_def_integral(
+                     r, alpha, nbr_terms, x_max=x_max)}
 
-        if (not n):
+        return IntegralBE.build_closed_form(IntegralBE.get_coefficients(n),
+                                            r, alpha, basis)
+    # ==================================================================
+    @staticmethod
+    def evaluate_antiderivative(n: int, alpha: np.ndarray, r: np.ndarray
+                                ) -> np.ndarray:
+        """Return the numeric values of the closed form of
+        :meth:`solve_integral`, vectorized over alpha and r.
+        """
+        x = alpha * r
+        basis = {IntegralBE.K0: k0(x), IntegralBE.K1: k1(x),
+                 IntegralBE.BASE: KSiIntegral.evaluate(r, alpha)}
 
-            return alpha * -1 * KSiIntegral.solve_def_integral(r, alpha)
+        return IntegralBE.evaluate_closed_form(
+            IntegralBE.get_coefficients(n), r, alpha, basis)
+    # ==================================================================
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_coefficients(n) -> COEFFS_TYPE:
+        r"""Return the coefficients of the closed form of order n, see
+        :meth:`unroll_recurrence`, from the recurrence:
+
+        .. math:: I_n = -\frac{1}{2n}r^{-2n} K_0(\alpha r)
+                        + \frac{\alpha}{4n^2} r^{-2n+1} K_1(\alpha r)
+                        + \frac{\alpha^2}{4n^2} I_{n-1}
+
+        with :math:`I_0 = -\alpha KSi(\alpha r)`, see
+        :class:`KSiIntegral`.
+        """
+        def step(k):
 
-        else:
-            integral_ = IntegralBE.solve_integral(r, n-1, alpha)
+            return ([(sp.Rational(-1, 2*k), -2*k, 0, IntegralBE.K0),
+                     (sp.Rational(1, 4*(k**2)), (-2*k)+1, 1, IntegralBE.K1)],
+                    sp.Rational(1, 4*(k**2)), 2)
 
-            return ((sp.Rational(-1, 2*n)*(r**(-2*n))*k0)
-                    + (sp.Rational(1, 4*(n**2))*alpha*(r**((-2*n)+1))*k1)
-                    - (sp.Rational(1, 4*(n**2)) * (alpha**2) * integral_)
-                   )
+        return IntegralBE.unroll_recurrence(
+            n, [(-1, 0, 1, IntegralBE.BASE)], step)
@@ -2,14 +2,17 @@
 """.. moduleauthor:: Sacha Medaer"""
 
 import copy
+from functools import lru_cache
 
 import numpy as np
 import sympy as sp
+from scipy.special import k0, k1
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
-from nupot.functions.klkl_function import KLKLFunction
-from nupot.integrals.abstract_integralB import AbstractIntegralB
+from nupot.functions.klkl_function import KLKLFunction, klkl
+from nupot.integrals.abstract_integralB import COEFFS_TYPE,\
+                                              AbstractIntegralB
 
 
 # Exceptions
@@ -69,20 +72,56 @@ class IntegralBF(AbstractIntegralB):
         """
         # the argument must be expanded for the factorization logic
         b_arg = (alpha * r).expand()
+        basis = {IntegralBF.K0: sp.besselk(0, b_arg),
+                 IntegralBF.K1: sp.besselk(1, b_arg),
+                 IntegralBF.BASE: sp.pi * KLKLFunction(b_arg)}
 
-        if (not n):
-            klkl = KLKLFunction(b_arg)
+        return IntegralBF.build_closed_form(IntegralBF.get_coefficients(n),
+                                            r, alpha, basis)
+    # ==================================================================
+    @staticmethod
+    def evaluate_antiderivative(n: int, alpha: np.ndarray, r: np.ndarray
+                                ) -> np.ndarray:
+        """Return the numeric values of the closed form of
+        :meth:`solve_integral`, vectorized over alpha and r.
+        """
+        x = alpha * r
+        basis = {IntegralBF.K0: k0(x), IntegralBF.K1: k1(x),
+                 IntegralBF.BASE: np.pi * klkl(x)}
+
+        return IntegralBF.evaluate_closed_form(
+            IntegralBF.get_coefficients(n), r, alpha, basis)
+    # ==================================================================
+    @staticmethod
+    def evaluate_at_infinity(n: int, alpha: np.ndarray) -> np.ndarray:
+        r"""Return the limit at infinity of the closed form of
+        :meth:`solve_integral`, from :math:`r\,KLKL(\alpha r) \to
+        1/\alpha` as the terms in :math:`K_0` and :math:`K_1` vanish.
+        """
+        res = np.zeros(np.shape(alpha))
+        for c, p, q, b in IntegralBF.get_coefficients(n):
+            if (b == IntegralBF.BASE):
+                res += float(c) * np.pi * (alpha**(q-1))
+
+        return res
+    # ==================================================================
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_coefficients(n) -> COEFFS_TYPE:
+        r"""Return the coefficients of the closed form of order n, see
+        :meth:`unroll_recurrence`, from the recurrence:
+
+        .. math:: I_n = -\frac{1}{\alpha}r^{2n} K_1(\alpha r)
+                        - \frac{2n-1}{\alpha^2} r^{2n-1} K_0(\alpha r)
+                        + \frac{(2n-1)^2}{\alpha^2} I_{n-1}
 
-            return r * sp.pi * klkl / 2.0
+        with :math:`I_0 = \frac{\pi}{2} r KLKL(\alpha r)`.
+        """
+        def step(k):
 
-        else:
-            k0 = sp.besselk(0, b_arg)
-            k1 = sp.besselk(1, b_arg)
-            integral_ = IntegralBF.solve_integral(r, n-1, alpha).doit()
+            return ([(-1, 2*k, -1, IntegralBF.K1),
+                     (-((2*k)-1), (2*k)-1, -2, IntegralBF.K0)],
+                    ((2*k)-1)**2, -2)
 
-            return (- ((r**sp.Rational(2*n))*k1/alpha)
-                    - (((2*n)-1)*(r**sp.Rational((2*n)-1))*k0
-                       /(alpha**sp.Rational(2)))
-                    + ((((2*n)-1)**sp.Rational(2))*integral_
-                       /(alpha**sp.Rational(2)))
-                   )
+        return IntegralBF.unroll_recurrence(
+            n, [(sp.Rational(1, 2), 1, 0, IntegralBF.BASE)], step)
@@ -5,6 +5,7 @@ import copy
 
 import numpy as np
 import sympy as sp
+from scipy.special import k0
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
@@ -67,8 +68,28 @@ class IntegralBG(AbstractIntegralB):
         # the argument must be expanded for the factorization logic
         b_arg = (alpha * r).expand()
         k0 = sp.besselk(0, b_arg)
-        integral_ = IntegralBF.solve_integral(r, n, alpha).doit()
+        integral_ = IntegralBF.solve_integral(r, n, alpha)
 
         return (- ((r**sp.Rational((2*n)+1))*k0/alpha)
                 + (((2*n)+1)*integral_/alpha)
                )
+    # ==================================================================
+    @staticmethod
+    def evaluate_antiderivative(n: int, alpha: np.ndarray, r: np.ndarray
+                                ) -> np.ndarray:
+        """Return the numeric values of the closed form of
+        :meth:`solve_integral`, vectorized over alpha and r.
+        """
+        integral_ = IntegralBF.evaluate_antiderivative(n, alpha, r)
+
+        return ((-(r**((2*n)+1)) * k0(alpha*r) / alpha)
+                + (((2*n)+1) * integral_ / alpha))
+    # ==================================================================
+    @staticmethod
+    def evaluate_at_infinity(n: int, alpha: np.ndarray) -> np.ndarray:
+        """Return the limit at infinity of the closed form of
+        :meth:`solve_integral`, see :meth:`IntegralBF.evaluate_at_infinity`.
+        """
+
+        return (((2*n)+1) * IntegralBF.evaluate_at_infinity(n, alpha)
+                / alpha)
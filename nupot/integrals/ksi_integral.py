@@ -2,10 +2,13 @@
 """.. moduleauthor:: Sacha Medaer"""
 
 import copy
+import math
+import warnings
+from typing import Optional, Tuple
 
 import numpy as np
 import sympy as sp
-from scipy.special import digamma, factorial
+from scipy.special import k0e
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
@@ -41,6 +44,11 @@ class KSiIntegral(AbstractIntegral):
                         - \left.KSi(\alpha r)\right|_b^\infty
 
     """
+    # Largest alpha*r of the series, the tail is used above
+    x_series: float = 3.0
+    # Gauss-Laguerre rule of the tail
+    __laguerre: Tuple[np.ndarray, np.ndarray] = \
+        np.polynomial.laguerre.laggauss(32)
     # ==================================================================
     @classmethod
     def _get_integrand(cls, r, *args):
@@ -75,20 +83,28 @@ class KSiIntegral(AbstractIntegral):
         if (deep):
             alpha = alpha.doit(deep=deep, **hints)
             r = r.doit(deep=deep, **hints)
+        # the tolerance and the bound of the series can be passed as hints
+        options = {key: hints[key] for key in ('rtol', 'x_max')
+                   if key in hints}
 
         if (definite_integral):
             if (is_fully_definite):
                 if (isinstance(b, sp.core.numbers.Infinity)):
 
-                    return self.solve_def_integral(a, alpha, *args[2:])
+                    return self.solve_def_integral(a, alpha, *args[2:],
+                                                   **options)
                 else:
 
-                    return (self.solve_def_integral(a, alpha, *args[2:])
-                            - self.solve_def_integral(b, alpha, *args[2:]))
+                    return (self.solve_def_integral(a, alpha, *args[2:],
+                                                    **options)
+                            - self.solve_def_integral(b, alpha, *args[2:],
+                                                      **options))
         # all other possibilities are not defined
     # ==================================================================
     @staticmethod
-    def solve_def_integral(r, alpha, n=6):
+    def solve_def_integral(r, alpha, n: Optional[int] = None,
+                           rtol: float = 1e-15,
+                           x_max: Optional[float] = None):
         r"""Return the custom evaluation of the definite integral
         with limits between r and infinite.
 
@@ -108,14 +124,108 @@ class KSiIntegral(AbstractIntegral):
                           \frac{\left(\frac{\alpha a}{2}\right)^{2k}}
                                {2k(k!)^2}\right)
 
+        truncated after n terms. If n is None, n is chosen with
+        :meth:`get_nbr_terms` for the relative tolerance rtol at
+        :math:`\alpha a` if it is a number, else at the largest value
+        x_max of :math:`\alpha a` at which the result is evaluated. If
+        x_max is also None, a warning is emitted and x_series is used,
+        such that the result loses accuracy for :math:`\alpha a >`
+        x_series, see :meth:`evaluate` for the numeric values at any
+        :math:`\alpha a`.
+
         """
-        log_num = sp.log(alpha*r/2.0)
-        res = (np.pi**2) / 24.0
-        res += 0.5 * (log_num + np.euler_gamma)**2
+        half_arg = alpha * r * sp.Rational(1, 2)
+        if (n is None):
+            x = (alpha*r).evalf()
+            if (not x.is_number):
+                if (x_max is None):
+                    warnings.warn("The number of terms of the series is "
+                                  "chosen for alpha*a <= {}, pass n or "
+                                  "x_max for larger alpha*a."
+                                  .format(KSiIntegral.x_series))
+                    x = KSiIntegral.x_series
+                else:
+                    x = x_max
+            n = KSiIntegral.get_nbr_terms(float(x), rtol)
+        log_num = sp.log(half_arg)
+        res = (sp.pi**2) * sp.Rational(1, 24)
+        res += sp.Rational(1, 2) * (log_num + sp.EulerGamma)**2
         for k in range(1, n+1):
-            res -= ((digamma(k+1) + (1/(2*k)) - log_num)
-                    *(((alpha*r/2.0)**2) / (2*k*(factorial(k)**2)))
-                    )
+            # exact digamma(k+1) = H_k - gamma such that evalf(prec) holds
+            digamma_k = sp.harmonic(k) - sp.EulerGamma
+            res -= ((digamma_k + sp.Rational(1, 2*k) - log_num)
+                    * ((half_arg**(2*k)) / (2*k*(sp.factorial(k)**2))))
         res /= alpha
 
         return res
+    # ==================================================================
+    @staticmethod
+    def _series(x: np.ndarray, rtol: float, max_nbr_terms: int = 100
+                ) -> Tuple[np.ndarray, int]:
+        # series of solve_def_integral up to the first term below rtol
+        # times the partial sum at all x, and the number of terms used
+        half_x = x / 2
+        log_num = np.log(half_x)
+        res = ((math.pi**2)/24) + (0.5*((log_num+np.euler_gamma)**2))
+        harmonic = 0.0
+        factor = np.ones(x.shape)    # (x/2)^{2k} / (k!)^2
+        for k in range(1, max_nbr_terms+1):
+            harmonic += 1 / k
+            factor = factor * (half_x**2) / (k**2)
+            term = ((harmonic - np.euler_gamma + (1/(2*k)) - log_num)
+                    * factor / (2*k))
+            if (np.all(np.abs(term) <= (rtol*np.abs(res)))):
+
+                return res, k - 1
+            res = res - term
+
+        return res, max_nbr_terms
+    # ==================================================================
+    @staticmethod
+    def get_nbr_terms(x: float, rtol: float = 1e-15) -> int:
+        """Return the number of terms of the series of
+        :meth:`solve_def_integral` at alpha*a=x such that the first
+        omitted term is below rtol times the sum.
+        """
+        if (x <= 0.0):
+
+            raise KSiIntegralInputError("The series is only defined for "
+                                        "alpha*a > 0, got {}.".format(x))
+
+        return KSiIntegral._series(np.array([float(x)]), rtol)[1]
+    # ==================================================================
+    @staticmethod
+    def evaluate(r, alpha, rtol: float = 1e-15) -> np.ndarray:
+        r"""Return the numeric values of the definite integral with
+        limits between r and infinite, vectorized over the arrays r and
+        alpha which are broadcast together.
+
+        Notes
+        -----
+        For :math:`x = \alpha r \leq` x_series, the series of
+        :meth:`solve_def_integral` is summed up to the relative
+        tolerance rtol. Above, the integral is computed with the
+        Gauss-Laguerre rule of the tail:
+
+        .. math::  \int_x^\infty \frac{K_0(t)}{t} dt
+                   = e^{-x} \int_0^\infty e^{-s}
+                     \frac{e^{x+s}K_0(x+s)}{x+s} ds
+
+        The relative error is below :math:`5\cdot 10^{-14}`, the largest
+        error is due to the cancellation of the series near x_series.
+
+        """
+        r, alpha = np.broadcast_arrays(np.asarray(r, dtype=float),
+                                       np.asarray(alpha, dtype=float))
+        x = alpha * r
+        res = np.empty(x.shape)
+        zero = (x == 0)
+        small = (x <= KSiIntegral.x_series) & ~zero
+        tail = ~(small | zero)
+        res[zero] = np.inf
+        res[small] = KSiIntegral._series(x[small], rtol)[0]
+        nodes, weights = KSiIntegral.__laguerre
+        x_ = x[tail][:, None] + nodes[None, :]
+        res[tail] = np.exp(-x[tail]) * ((k0e(x_)/x_) @ weights)
+
+        return res / alpha
@@ -0,0 +1,96 @@
+
+""".. moduleauthor:: Sacha Medaer"""
+
+import math
+from typing import Dict, Tuple
+
+import numpy as np
+
+import nupot.utils.constants as cst
+import nupot.utils.utilities as util
+
+
+# Exceptions
+class QuadratureAAInputError(Exception):
+    pass
+
+
+class QuadratureAA(object):
+    r"""Numeric backend of the integral :math:`\int_{a}^{\infty}
+    x^{\rho} (x-a)^{\mu} e^{-r \sqrt{x}} dx` for arbitrary
+    :math:`\rho` and :math:`\mu > -1`.
+
+    Notes
+    -----
+    With the change of variables :math:`x = (\sqrt{a} + t/r)^2`, the
+    integral becomes:
+
+    .. math::  \frac{2}{r} e^{-r\sqrt{a}} \int_0^{\infty} e^{-t}
+               \Big(\frac{t}{r}\Big)^{\mu}
+               \Big(2\sqrt{a} + \frac{t}{r}\Big)^{\mu}
+               \Big(\sqrt{a} + \frac{t}{r}\Big)^{2\rho+1} dt
+
+    which is computed with the exp-sinh rule (the tanh-sinh rule of the
+    half line) :math:`t_k = \exp(\frac{\pi}{2}\sinh(kh))`. The nodes and
+    weights are computed once per :math:`(\mu, h)` and the integrand is
+    evaluated on all the nodes at once for many :math:`(a, r)` pairs.
+
+    """
+    __nodes: Dict[Tuple[float, float], Tuple[np.ndarray, np.ndarray]] = {}
+    # Largest node of the rule, e^{-t} is negligible beyond
+    t_max: float = 750.0
+
+    @staticmethod
+    def nodes(mu: float, step: float = 1/16
+              ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the nodes and the weights of the exp-sinh rule of
+        step size step. The smallest node is chosen such that the part
+        of the integral of :math:`t^{\\mu}` below it is negligible.
+        """
+        key = (float(mu), float(step))
+        if (key not in QuadratureAA.__nodes):
+            eps = np.finfo(float).eps
+            u_low = math.asinh(-math.log(eps) / (key[0]+1) / (math.pi/2))
+            u_high = math.asinh(math.log(QuadratureAA.t_max) / (math.pi/2))
+            k = np.arange(-math.ceil(u_low/step), math.ceil(u_high/step)+1)
+            u = k * step
+            t = np.exp((math.pi/2)*np.sinh(u))
+            w = step * (math.pi/2) * np.cosh(u) * t
+            QuadratureAA.__nodes[key] = (t, w)
+
+        return QuadratureAA.__nodes[key]
+    # ==================================================================
+    @staticmethod
+    def evaluate(rho, mu, a, r, step: float = 1/16, scaled: bool = False,
+                 chunk_size: int = 4096) -> np.ndarray:
+        r"""Return the numeric values of the integral for the arrays
+        a and r which are broadcast together. If scaled is True, return
+        the values multiplied by :math:`e^{r\sqrt{a}}`. The points are
+        processed by chunks of chunk_size to bound the memory.
+        """
+        rho = float(rho)
+        mu = float(mu)
+        if (mu <= -1.0):
+
+            raise QuadratureAAInputError("The integral diverges at x=a for "
+                                         "mu={} <= -1.".format(mu))
+        t, w = QuadratureAA.nodes(mu, step)
+        a, r = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                   np.asarray(r, dtype=float))
+        shape = a.shape
+        a = a.ravel()
+        r = r.ravel()
+        res = np.empty(a.shape)
+        for start in range(0, len(a), chunk_size):
+            sl = slice(start, start+chunk_size)
+            sqrt_a = np.sqrt(a[sl])[:, None]
+            r_ = r[sl][:, None]
+            t_r = t[None, :] / r_
+            # integrand in log domain to avoid intermediate overflow
+            log_f = ((mu*np.log(t_r)) + (mu*np.log((2*sqrt_a) + t_r))
+                     + (((2*rho)+1)*np.log(sqrt_a + t_r)) - t[None, :])
+            res[sl] = (2/r[sl]) * np.sum(w[None, :]*np.exp(log_f), axis=1)
+        if (not scaled):
+            res *= np.exp(-r*np.sqrt(a))
+
+        return res.reshape(shape)
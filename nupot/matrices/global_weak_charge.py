@@ -1,6 +1,9 @@
 
 """.. moduleauthor:: Sacha Medaer"""
 
+from typing import Dict, Iterator, Sequence, Tuple
+
+import numpy as np
 import sympy as sp
 
 import nupot.utils.constants as cst
@@ -12,6 +15,8 @@ class GlobalWeakCharge(sp.Matrix):
     """This class represents the global weak charge of the neutrino
     pair mediated matter scattering.
     """
+    # Natural abundance weighted charge tensors by element symbol
+    __natural_charges: Dict[str, np.ndarray] = {}
 
     def __new__(cls, *args, **kwargs):
         Z, N = args
@@ -28,6 +33,116 @@ class GlobalWeakCharge(sp.Matrix):
         elements[2].append(2*Z*pmns[0, 2]*sp.conjugate(pmns[0, 2]) - N)
 
         return super().__new__(cls, elements, **kwargs)
+    # ==================================================================
+    @staticmethod
+    def evaluate(Z, N) -> np.ndarray:
+        r"""Return the complex numpy array of shape (n, 3, 3) of the
+        global weak charge matrices for the arrays Z and N of n atomic
+        and neutron numbers, which are broadcast together.
+
+        Notes
+        -----
+        Computed from the cached :attr:`Nu.PMNSMatrix_numeric` as:
+
+        .. math::  Q_{ij} = 2Z U_{ei} U_{ej}^* - N \delta_{ij}
+
+        """
+        Z, N = np.broadcast_arrays(np.asarray(Z, dtype=float),
+                                   np.asarray(N, dtype=float))
+        pmns_e = Nu.PMNSMatrix_numeric[0]
+        outer = np.outer(pmns_e, np.conj(pmns_e))
+
+        return ((2 * Z[..., None, None] * outer)
+                - (N[..., None, None] * np.eye(3)))
+    # ==================================================================
+    @staticmethod
+    def evaluate_atoms(atoms: Sequence) -> np.ndarray:
+        """Return the complex numpy array of shape (len(atoms), 3, 3)
+        of the global weak charge matrices of the atoms, see
+        :meth:`evaluate`.
+        """
+        Z = [float(atom.atomic_number.evalf()) for atom in atoms]
+        N = [float(atom.neutrons.evalf()) for atom in atoms]
+
+        return GlobalWeakCharge.evaluate(Z, N)
+    # ==================================================================
+    @staticmethod
+    def evaluate_isotopes(atoms: Sequence
+                          ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the complex numpy array of shape (n, 3, 3) of the
+        global weak charge matrices of the n natural isotopes of all the
+        atoms, see :attr:`Atom.isotopes`, their natural abundances and
+        the indices in atoms of their elements, computed in one
+        vectorized evaluation.
+        """
+        isotopes = [atom.isotopes for atom in atoms]
+        rows = np.concatenate(isotopes)
+        indices = np.repeat(np.arange(len(atoms)),
+                            [len(isotope) for isotope in isotopes])
+
+        return (GlobalWeakCharge.evaluate(rows['Z'], rows['N']),
+                rows['abundance'], indices)
+    # ==================================================================
+    @staticmethod
+    def evaluate_natural(atoms: Sequence) -> np.ndarray:
+        r"""Return the complex numpy array of shape (len(atoms), 3, 3)
+        of the natural abundance weighted global weak charge matrices
+        of the atoms, cached per element.
+
+        Notes
+        -----
+        The charge is affine in the neutron number N, such that the
+        weighted mean over the isotopes of abundances :math:`w_a` is
+        the charge of the mean neutron number. As the isotopes of two
+        atoms are independent, the weighted mean of the pair products
+        is the pair product of the means, see :meth:`pair_products`:
+
+        .. math::  \sum_{a, b} w_a w_b Q_{W,a}^{ij} Q_{W,b}^{ij\, *}
+                   = \bar{Q}_{W,A}^{ij} \bar{Q}_{W,B}^{ij\, *}
+
+        """
+        cache = GlobalWeakCharge.__natural_charges
+        missing = list({atom.symbol: atom for atom in atoms
+                        if atom.symbol not in cache}.values())
+        if (missing):
+            Q, abundances, indices = GlobalWeakCharge.evaluate_isotopes(
+                missing)
+            means = np.zeros((len(missing), 3, 3), dtype=complex)
+            np.add.at(means, indices, abundances[:, None, None] * Q)
+            for atom, mean in zip(missing, means):
+                cache[atom.symbol] = mean
+
+        return np.array([cache[atom.symbol] for atom in atoms])
+    # ==================================================================
+    @staticmethod
+    def pair_products(Q_A, Q_B) -> np.ndarray:
+        r"""Return the complex numpy array of shape (n_A, n_B, 6) of the
+        products :math:`Q^{ij}_{W,A}Q^{ij\, *}_{W,B}` for all the pairs
+        of the weak charge tensors Q_A and Q_B of shapes (n_A, 3, 3) and
+        (n_B, 3, 3), see :meth:`evaluate`. The elements (i, j) with
+        i <= j are in the order of combinations_with_replacement([0, 1,
+        2], 2).
+        """
+        rows, cols = np.triu_indices(3)
+
+        return np.einsum('ak,bk->abk', np.asarray(Q_A)[:, rows, cols],
+                         np.conj(np.asarray(Q_B)[:, rows, cols]))
+    # ==================================================================
+    @staticmethod
+    def iter_pair_products(Q_A, Q_B, max_bytes: int = 2**28
+                           ) -> Iterator[Tuple[slice, np.ndarray]]:
+        """Yield the tuples (slice of the rows of Q_A, products) of
+        :meth:`pair_products` by blocks of rows of Q_A, such that each
+        block of products takes at most max_bytes in memory (at least
+        one row).
+        """
+        Q_A = np.asarray(Q_A)
+        row_bytes = len(Q_B) * 6 * np.dtype(complex).itemsize
+        nbr_rows = max(1, max_bytes // max(1, row_bytes))
+        for start in range(0, len(Q_A), nbr_rows):
+            rows = slice(start, min(start+nbr_rows, len(Q_A)))
+
+            yield rows, GlobalWeakCharge.pair_products(Q_A[rows], Q_B)
 
 
 
@@ -1,12 +1,14 @@
 
 """.. moduleauthor:: Sacha Medaer"""
 
-from typing import Union
+from typing import Dict, Union
 
-from mendeleev import element
+import numpy as np
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
+from nupot.physics.element_table import find_atomic_number,\
+                                        get_isotopes, get_table
 from nupot.symbols.constant_real_symbol import ConstantRealSymbol
 
 
@@ -16,50 +18,80 @@ class AtomInputError(Exception):
 
 
 class Atom(object):
-    """This class contains the atom properties. Currently, it acts
-    as a custom API of the mendeleev python library.
+    """This class contains the atom properties. The atom of a given
+    element is a flyweight shared by all the calls with its atomic
+    number, symbol or name. The main properties come from the packaged
+    element table, see :mod:`nupot.physics.element_table`, the mendeleev
+    python library is only queried for the extended properties of
+    :attr:`element`.
     """
+    # Shared atoms by atomic number
+    __atoms: Dict[int, 'Atom'] = {}
 
-    def __init__(self, symbol: Union[int, str]) -> None:
-        self._symbol: Union[int, str] = symbol
-        if (Atom.does_element_exist(symbol)):
-            self._elem = element(symbol)
-        else:
+    def __new__(cls, symbol: Union[int, str]) -> 'Atom':
+        Z = find_atomic_number(symbol)
+        if (Z is None):
 
             raise AtomInputError('The specified symbol {} was not found.'
                                  .format(symbol))
+        atom = cls.__atoms.get(Z)
+        if (atom is None):
+            atom = super().__new__(cls)
+            atom._init_element(Z)
+            cls.__atoms[Z] = atom
+
+        return atom
+
+    def __init__(self, symbol: Union[int, str]) -> None:
+        # N.B.: the shared atom is initialized once in __new__
+
+        return None
 
+    def _init_element(self, Z: int) -> None:
+        self._row = get_table()[Z-1]
+        self._elem = None
         self._atomic_number: ConstantRealSymbol
         name_ = 'Z_{' + str(self.symbol)  + '}'
-        self._atomic_number = ConstantRealSymbol(self._elem.atomic_number,
+        self._atomic_number = ConstantRealSymbol(int(self._row['Z']),
                                                  name_, positive=True)
         name_ = 'N_{' + str(self.symbol)  + '}'
         self._neutrons: ConstantRealSymbol
-        self._neutrons = ConstantRealSymbol(self._elem.neutrons, name_,
+        self._neutrons = ConstantRealSymbol(int(self._row['N']), name_,
                                             positive=True)
 
-
         return None
 
+    # Pickling (the shared atom is retrieved from its atomic number)
+    def __reduce__(self):
+
+        return (Atom, (int(self._row['Z']),))
+
     @staticmethod
-    def does_element_exist(symbol: str):
-        try:
-            found = element(symbol)
+    def does_element_exist(symbol: Union[int, str]) -> bool:
 
-            return True
-        except:
+        return (find_atomic_number(symbol) is not None)
+
+    @property
+    def element(self):
+        """The mendeleev element, loaded at the first access, for the
+        properties which are not in the element table.
+        """
+        if (self._elem is None):
+            from mendeleev import element
 
-            return False
+            self._elem = element(int(self._row['Z']))
+
+        return self._elem
 
     @property
     def name(self) -> str:
 
-        return self._elem.name
+        return str(self._row['name'])
 
     @property
-    def symbol(self) -> Union[int, str]:
+    def symbol(self) -> str:
 
-        return self._elem.symbol
+        return str(self._row['symbol'])
 
     @property
     def atomic_number(self) -> ConstantRealSymbol:
@@ -71,6 +103,24 @@ class Atom(object):
 
         return self._neutrons
 
+    @property
+    def mass_number(self) -> int:
+
+        return int(self._row['A'])
+
+    @property
+    def atomic_weight(self) -> float:
+
+        return float(self._row['atomic_weight'])
+
+    @property
+    def isotopes(self) -> np.ndarray:
+        """The rows (Z, N, A, abundance) of the natural isotopes of the
+        element, see :func:`nupot.physics.element_table.get_isotopes`.
+        """
+
+        return get_isotopes(int(self._row['Z']))
+
 
 if __name__ == '__main__':
     import sympy as sp
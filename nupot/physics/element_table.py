@@ -0,0 +1,165 @@
+
+""".. moduleauthor:: Sacha Medaer"""
+
+import os
+from functools import lru_cache
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+
+# Exceptions
+class ElementTableError(Exception):
+    pass
+
+
+# Number of elements of the table, from hydrogen to oganesson
+NBR_ELEMENTS: int = 118
+# Columns of the table, one row per element in order of atomic number
+TABLE_DTYPE: np.dtype = np.dtype([('Z', np.int16), ('N', np.int16),
+                                  ('A', np.int16),
+                                  ('atomic_weight', np.float64),
+                                  ('symbol', 'U3'), ('name', 'U16')])
+# Stored table, rebuilt from mendeleev if its layout does not match
+TABLE_PATH: str = os.path.join(os.path.dirname(__file__), 'data',
+                               'element_table.npy')
+
+
+def build_table() -> np.ndarray:
+    """Return the structured array of dtype TABLE_DTYPE of the atomic
+    number Z, the neutron number N and the mass number A of the most
+    abundant isotope, the standard atomic weight, the symbol and the
+    name of all the elements, queried from mendeleev.
+    """
+    from mendeleev import element
+
+    table = np.empty(NBR_ELEMENTS, dtype=TABLE_DTYPE)
+    for i in range(NBR_ELEMENTS):
+        elem = element(i+1)
+        table[i] = (elem.atomic_number, elem.neutrons, elem.mass_number,
+                    elem.atomic_weight, elem.symbol, elem.name)
+
+    return table
+
+
+# Columns of the isotope table, one row per isotope in order of atomic
+# and mass numbers
+ISOTOPE_DTYPE: np.dtype = np.dtype([('Z', np.int16), ('N', np.int16),
+                                    ('A', np.int16),
+                                    ('abundance', np.float64)])
+ISOTOPE_TABLE_PATH: str = os.path.join(os.path.dirname(__file__), 'data',
+                                       'isotope_table.npy')
+
+
+def build_isotope_table() -> np.ndarray:
+    """Return the structured array of dtype ISOTOPE_DTYPE of the atomic,
+    neutron and mass numbers and of the natural abundance (fraction
+    normalized to one per element) of the natural isotopes, queried from
+    mendeleev. The elements without natural isotopes have the single
+    isotope of :func:`build_table` with abundance one.
+    """
+    from mendeleev.fetch import fetch_table
+
+    isotopes = fetch_table('isotopes')
+    isotopes = isotopes[isotopes['abundance'].notna()]
+    rows = []
+    for elem in get_table():
+        crt = isotopes[isotopes['atomic_number'] == elem['Z']]
+        crt = crt.sort_values('mass_number')
+        if (len(crt)):
+            total = crt['abundance'].sum()
+            for A, abundance in zip(crt['mass_number'], crt['abundance']):
+                rows.append((elem['Z'], A - elem['Z'], A, abundance/total))
+        else:
+            rows.append((elem['Z'], elem['N'], elem['A'], 1.0))
+
+    return np.array(rows, dtype=ISOTOPE_DTYPE)
+
+
+def _is_complete(table: np.ndarray) -> bool:
+    # True if the table has rows for all the elements in order of
+    # atomic number, at least one per element
+    Z = table['Z']
+
+    return bool(len(Z) and (Z[0] == 1) and (Z[-1] == NBR_ELEMENTS)
+                and np.all(np.diff(Z) >= 0) and np.all(np.diff(Z) <= 1))
+
+
+def _load_table(path: str, dtype: np.dtype, build: Callable,
+                nbr_rows: Optional[int] = None) -> np.ndarray:
+    # load the table at path, or build and save it if the file is
+    # missing or outdated, the table must have all the elements and
+    # nbr_rows rows if it is not None
+    if (os.path.isfile(path)):
+        table = np.load(path)
+        if ((table.dtype == dtype) and _is_complete(table)
+                and ((nbr_rows is None) or (len(table) == nbr_rows))):
+
+            return table
+    table = build()
+    if ((not _is_complete(table))
+            or ((nbr_rows is not None) and (len(table) != nbr_rows))):
+
+        raise ElementTableError("The table built for {} does not have the "
+                                "rows of all the {} elements."
+                                .format(path, NBR_ELEMENTS))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.save(path, table)
+    except OSError:     # read-only installation, keep it in memory only
+        pass
+
+    return table
+
+
+@lru_cache(maxsize=None)
+def get_table() -> np.ndarray:
+    """Return the table of :func:`build_table`, loaded from TABLE_PATH.
+    The table is built and saved at the first use if the file is
+    missing or outdated.
+    """
+
+    return _load_table(TABLE_PATH, TABLE_DTYPE, build_table, NBR_ELEMENTS)
+
+
+@lru_cache(maxsize=None)
+def get_isotope_table() -> np.ndarray:
+    """Return the table of :func:`build_isotope_table`, loaded from
+    ISOTOPE_TABLE_PATH, see :func:`get_table`.
+    """
+
+    return _load_table(ISOTOPE_TABLE_PATH, ISOTOPE_DTYPE,
+                       build_isotope_table)
+
+
+def get_isotopes(Z: int) -> np.ndarray:
+    """Return the rows of the isotope table of the element of atomic
+    number Z.
+    """
+    table = get_isotope_table()
+    start, end = np.searchsorted(table['Z'], [Z, Z+1])
+
+    return table[start:end]
+
+
+def find_atomic_number(symbol: Union[int, str]) -> Optional[int]:
+    """Return the atomic number of the element of atomic number, symbol
+    or name (case insensitive) symbol, None if it does not exist.
+    """
+    table = get_table()
+    if (isinstance(symbol, (int, np.integer))
+            and (not isinstance(symbol, bool))):
+        if (1 <= symbol <= NBR_ELEMENTS):
+
+            return int(symbol)
+
+    elif (isinstance(symbol, str)):
+        index = np.flatnonzero(table['symbol'] == symbol)
+        if (not index.size):
+            index = np.flatnonzero(np.char.lower(table['name'])
+                                   == symbol.lower())
+        if (index.size):
+
+            return int(table['Z'][index[0]])
+
+    return None
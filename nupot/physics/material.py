@@ -0,0 +1,175 @@
+
+""".. moduleauthor:: Sacha Medaer"""
+
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.constants import Avogadro
+
+import nupot.utils.constants as cst
+import nupot.utils.utilities as util
+from nupot.matrices.global_weak_charge import GlobalWeakCharge
+from nupot.physics.atom import Atom
+
+
+# Exceptions
+class MaterialInputError(Exception):
+    pass
+
+
+class Material(object):
+    r"""This class represents a composite material, e.g. a compound or
+    an alloy, as a collection of atoms weighted by their stoichiometric
+    or mass fractions, with a given mass density in g/cm^3.
+
+    Notes
+    -----
+    The potential is bilinear in the weak charges of the two bodies,
+    such that the potential between two volume elements of materials A
+    and B is the contraction of the kernel with the effective charges
+    per volume:
+
+    .. math::  Q^{ij}_{W,A} = \sum_{a \in A} n_a \bar{Q}^{ij}_{W,a}
+
+    with :math:`n_a` the number density of the atoms of element a and
+    :math:`\bar{Q}_{W,a}` their natural abundance weighted charge, see
+    :meth:`GlobalWeakCharge.evaluate_natural`. A material can replace an
+    atom in the potentials, see :class:`NuPairPotential`.
+
+    """
+
+    def __init__(self, name: str, components: Dict[Union[int, str, Atom],
+                                                   float],
+                 density: float, mass_fractions: bool = False) -> None:
+        r"""
+        Parameters
+        ----------
+        name :
+            The name of the material.
+        components :
+            The atoms, or their atomic numbers or symbols, mapped to
+            their fractions, the stoichiometric numbers by default,
+            e.g. {'Si': 1, 'O': 2}. The fractions are normalized.
+        density :
+            The mass density in g/cm^3.
+        mass_fractions :
+            If True, the fractions are mass fractions, e.g. {'Fe':
+            0.70, 'Cr': 0.18, 'Ni': 0.12}.
+
+        """
+        if (not components):
+
+            raise MaterialInputError("The material {} must have at least "
+                                     "one component.".format(name))
+        if (density <= 0.0):
+
+            raise MaterialInputError("The density {} of the material {} "
+                                     "must be positive.".format(density,
+                                                                name))
+        self._name: str = name
+        self._atoms: Tuple[Atom, ...] = tuple(
+            atom if isinstance(atom, Atom) else Atom(atom)
+            for atom in components)
+        fractions = np.array(list(components.values()), dtype=float)
+        if (np.any(fractions < 0.0) or (not np.sum(fractions))):
+
+            raise MaterialInputError("The fractions {} of the material {} "
+                                     "must be non-negative and not all "
+                                     "zero.".format(fractions, name))
+        self._density: float = density
+        if (mass_fractions):
+            fractions = fractions / self._get_atomic_weights()
+        self._atom_fractions: np.ndarray = fractions / np.sum(fractions)
+        self._weak_charge_tensor: Optional[np.ndarray] = None
+
+        return None
+
+    @property
+    def name(self) -> str:
+
+        return self._name
+
+    @property
+    def atoms(self) -> Tuple[Atom, ...]:
+
+        return self._atoms
+
+    @property
+    def density(self) -> float:
+
+        return self._density
+
+    @property
+    def atom_fractions(self) -> np.ndarray:
+        """The fractions of the numbers of atoms of the components."""
+
+        return self._atom_fractions
+
+    @property
+    def mass_fractions(self) -> np.ndarray:
+        """The fractions of the masses of the components."""
+        masses = self._atom_fractions * self._get_atomic_weights()
+
+        return masses / np.sum(masses)
+
+    @property
+    def molar_mass(self) -> float:
+        """The mean molar mass per atom in g/mol."""
+
+        return float(np.dot(self._atom_fractions,
+                            self._get_atomic_weights()))
+
+    @property
+    def number_densities(self) -> np.ndarray:
+        """The number densities of the atoms of the components in
+        1/cm^3.
+        """
+
+        return (self._density * Avogadro * self._atom_fractions
+                / self.molar_mass)
+
+    @property
+    def weak_charge_tensor(self) -> np.ndarray:
+        """The complex (3, 3) matrix of the effective global weak charge
+        per volume in 1/cm^3, computed once.
+        """
+        if (self._weak_charge_tensor is None):
+            charges = GlobalWeakCharge.evaluate_natural(self._atoms)
+            self._weak_charge_tensor = np.tensordot(self.number_densities,
+                                                    charges, axes=1)
+
+        return self._weak_charge_tensor
+
+    @property
+    def weak_charge_vector(self) -> np.ndarray:
+        """The elements (i, j) with i <= j of :attr:`weak_charge_tensor`,
+        in the order of combinations_with_replacement([0, 1, 2], 2).
+        """
+
+        return self.weak_charge_tensor[np.triu_indices(3)]
+
+    def _get_atomic_weights(self) -> np.ndarray:
+
+        return np.array([atom.atomic_weight for atom in self._atoms])
+
+    @staticmethod
+    def evaluate(materials: Sequence['Material']) -> np.ndarray:
+        """Return the complex numpy array of shape (len(materials), 3, 3)
+        of the effective weak charges per volume of the materials, to be
+        contracted pairwise with :meth:`GlobalWeakCharge.pair_products`.
+        """
+
+        return np.array([material.weak_charge_tensor
+                         for material in materials])
+
+
+if __name__ == '__main__':
+
+    silica = Material('SiO2', {'Si': 1, 'O': 2}, 2.65)
+    steel = Material('Stainless steel', {'Fe': 0.70, 'Cr': 0.18,
+                                         'Ni': 0.12}, 8.0,
+                     mass_fractions=True)
+    print('The number densities are: ', silica.number_densities)
+    print('The charge products are: ',
+          GlobalWeakCharge.pair_products(Material.evaluate([silica]),
+                                         Material.evaluate([steel])))
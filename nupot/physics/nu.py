@@ -32,13 +32,30 @@ def build_pmns_matrix(theta_12, theta_23, theta_13, delta_cp):
     elements[1].append(c_13*s_23)
     elements[2].append((s_12*s_23)
                        - (c_12*s_13*c_23*sp.exp(sp.I*delta_cp)))
-    elements[2].append((c_12*s_23)
+    elements[2].append((-c_12*s_23)
                        - (s_12*s_13*c_23*sp.exp(sp.I*delta_cp)))
     elements[2].append(c_13*c_23)
 
     return sp.Matrix(elements)
 
 
+def build_pmns_matrix_numeric(theta_12: float, theta_23: float,
+                              theta_13: float, delta_cp: float
+                              ) -> np.ndarray:
+    """Return the complex numpy array of the PMNS matrix, see
+    :func:`build_pmns_matrix` for the symbolic counterpart.
+    """
+    c_12, c_23, c_13 = np.cos([theta_12, theta_23, theta_13])
+    s_12, s_23, s_13 = np.sin([theta_12, theta_23, theta_13])
+    phase = np.exp(1j*delta_cp)
+
+    return np.array([[c_12*c_13, s_12*c_13, s_13*np.conj(phase)],
+                     [(-s_12*c_23) - (c_12*s_13*s_23*phase),
+                      (c_12*c_23) - (s_12*s_13*s_23*phase), c_13*s_23],
+                     [(s_12*s_23) - (c_12*s_13*c_23*phase),
+                      (-c_12*s_23) - (s_12*s_13*c_23*phase), c_13*c_23]])
+
+
 class NuInputError(Exception):
     pass
 
@@ -91,6 +108,9 @@ class Nu(object):
                                                 __theta_23[0] + __theta_23[2],
                                                 __theta_13[0] + __theta_13[2],
                                                 __delta_cp[0] + __delta_cp[2])
+    __pmns_matrix_numeric = build_pmns_matrix_numeric(
+        *[float(param[0].evalf())
+          for param in (__theta_12, __theta_23, __theta_13, __delta_cp)])
     # |Delta m_{21}^2 : signed value # in eV^2
     __delta_m_sq_21 = (ConstantRealSymbol(7.49e-5, r'\Delta m_{21}^2',
                                           positive=True),
@@ -148,6 +168,11 @@ class Nu(object):
 
         return cls.__pmns_matrix
 
+    @classproperty
+    def PMNSMatrix_numeric(cls) -> np.ndarray:
+
+        return cls.__pmns_matrix_numeric
+
     @classproperty
     def PMNSMatrix_lower_unc(cls) -> sp.Matrix:
 
@@ -1,13 +1,15 @@
 
 """.. moduleauthor:: Sacha Medaer"""
 
+from typing import List, Tuple
+
 import numpy as np
 import sympy as sp
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
-from nupot.integrals.integralAA import IntegralAA
 from nupot.potentials.nu_pair_potential import NuPairPotential
+from nupot.potentials.series_builder import SeriesBuilder
 
 
 class DiracNuPairPotential(NuPairPotential):
@@ -28,13 +30,16 @@ class DiracNuPairPotential(NuPairPotential):
                \Biggr[ 1-\frac{1}{t}\overline{m_{ij}^2}-\frac{1}{2}
                \biggr[\frac{\Delta m_{ij}^2}{t}\biggr]^2\Biggr]
     """
+    default_orders = [1]*3
     # ==================================================================
     @staticmethod
-    def pot_term(m_1, m_2, r, Q_A, Q_B, orders = [1]*3)-> cst.EXPR_TYPE:
+    def pot_term(m_1, m_2, r, Q_A, Q_B, orders = None)-> cst.EXPR_TYPE:
+        if (orders is None):
+            orders = DiracNuPairPotential.default_orders
 
         if (m_1.equals(m_2)):
             return (Q_A*Q_B*(cst.G_F**sp.Rational(2))*(m_1**sp.Rational(3))
-                    *sp.simplify(sp.besselk(3, 2*m_1*r))
+                    *util.besselk_reduced(3, 2*m_1*r)
                     /(16*(sp.pi**sp.Rational(3))*(r**sp.Rational(2))))
 
         else:
@@ -46,56 +51,37 @@ class DiracNuPairPotential(NuPairPotential):
                     * (term_1 + term_2 + term_3))
     # ==================================================================
     @staticmethod
+    def get_series(m_1, m_2, r) -> List[Tuple[cst.EXPR_TYPE, SeriesBuilder]]:
+        """Return the prefactors and the series of term_1, term_2 and
+        term_3, in the order of the parameter orders of pot_term.
+        """
+        f = (m_1**sp.Rational(2)) + (m_2**sp.Rational(2))
+        g = (m_1**sp.Rational(2)) - (m_2**sp.Rational(2))
+
+        return [(sp.Rational(1, 192) * (1/r),
+                 SeriesBuilder.get(m_1, m_2, r, sp.Rational(1, 2))),
+                (-f * sp.Rational(1, 384) * (1/r),
+                 SeriesBuilder.get(m_1, m_2, r, sp.Rational(-1, 2))),
+                (-(g**sp.Rational(2)) * sp.Rational(1, 384) * (1/r),
+                 SeriesBuilder.get(m_1, m_2, r, sp.Rational(-3, 2)))]
+    # ==================================================================
+    @staticmethod
     def term_1(m_1, m_2, r, order: int = 1):
-        expr = sp.Rational(0)
-        a = (m_1 + m_2)**sp.Rational(2)
-        e = (m_1 - m_2)**sp.Rational(2)
-        dummyx = sp.symbols('dummyx')
-        for k in range(order):
-            integral = IntegralAA((sp.Rational(0.5-k), sp.Rational(1, 2),
-                                   a, r), (dummyx, a, np.inf))
-            expr += ((sp.Rational(-1)**k)
-                     * sp.Rational(sp.binomial(sp.Rational(1, 2), k))
-                     * (e**k) * sp.Rational(1, 192) * (1/r)
-                     * integral.doit())
-
-        return expr
+        prefactor, series = DiracNuPairPotential.get_series(m_1, m_2, r)[0]
+
+        return prefactor * series.partial_sum(order)
     # ==================================================================
     @staticmethod
     def term_2(m_1, m_2, r, order: int = 1):
-        expr = sp.Rational(0)
-        a = (m_1 + m_2)**sp.Rational(2)
-        e = (m_1 - m_2)**sp.Rational(2)
-        f = (m_1**sp.Rational(2)) + (m_2**sp.Rational(2))
-        dummyx = sp.symbols('dummyx')
-        for k in range(order):
-            integral = IntegralAA((sp.Rational(-0.5-k), sp.Rational(1, 2),
-                                   a, r), (dummyx, a, np.inf))
-            expr -= ((sp.Rational(-1)**k)
-                     * sp.Rational(sp.binomial(sp.Rational(1, 2), k))
-                     * (e**k) * f * sp.Rational(1, 384) * (1/r)
-                     * integral.doit())
-
-        return expr
+        prefactor, series = DiracNuPairPotential.get_series(m_1, m_2, r)[1]
+
+        return prefactor * series.partial_sum(order)
     # ==================================================================
     @staticmethod
     def term_3(m_1, m_2, r, order: int = 1):
-        expr = sp.Rational(0)
-        a = (m_1 + m_2)**sp.Rational(2)
-        e = (m_1 - m_2)**sp.Rational(2)
-        g = (m_1**sp.Rational(2)) - (m_2**sp.Rational(2))
-        dummyx = sp.symbols('dummyx')
-        for k in range(order):
-            integral = IntegralAA((sp.Rational(-1.5-k), sp.Rational(1, 2),
-                                   a, r), (dummyx, a, np.inf))
-            expr -= ((sp.Rational(-1)**k)
-                     * sp.Rational(sp.binomial(sp.Rational(1, 2), k))
-                     * (e**k) * (g**sp.Rational(2))
-                     * sp.Rational(1, 384) * (1/r)
-                     * integral.doit())
-
-        return expr
+        prefactor, series = DiracNuPairPotential.get_series(m_1, m_2, r)[2]
 
+        return prefactor * series.partial_sum(order)
 
 
 if __name__ == '__main__':
@@ -109,7 +95,7 @@ if __name__ == '__main__':
     expr_nuV = nuV.doit()
     new_expr = expr_nuV.subs({m_1: 0.1, m_2: 0.1, m_3: 0.1, r: 0.5, a: 1.0})
     print('numeracil value : ', new_expr.evalf())
-    #fact = DiracNuPairPotential.factorize(expr_nuV, m_1, m_2, m_3, r)
+    #fact = DiracNuPairPotential.factorize(expr_nuV, r)
     over_r = DiracNuPairPotential.integrate_over_r(expr_nuV, m_1, m_2, m_3, r,
                                                    a, np.inf)
 
@@ -1,14 +1,16 @@
 
 """.. moduleauthor:: Sacha Medaer"""
 
+from typing import List, Tuple
+
 import numpy as np
 import sympy as sp
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
-from nupot.integrals.integralAA import IntegralAA
 from nupot.potentials.nu_pair_potential import NuPairPotential
 from nupot.potentials.dirac_nu_pair_potential import DiracNuPairPotential
+from nupot.potentials.series_builder import SeriesBuilder
 
 
 class MajoranaNuPairPotential(NuPairPotential):
@@ -31,13 +33,16 @@ class MajoranaNuPairPotential(NuPairPotential):
                \biggr[\frac{\Delta m_{ij}^2}{t}\biggr]^2\Biggr]
 
     """
+    default_orders = [3]*4
     # ==================================================================
     @staticmethod
-    def pot_term(m_1, m_2, r, Q_A, Q_B, orders = [3]*4)-> cst.EXPR_TYPE:
+    def pot_term(m_1, m_2, r, Q_A, Q_B, orders = None)-> cst.EXPR_TYPE:
+        if (orders is None):
+            orders = MajoranaNuPairPotential.default_orders
 
         if (m_1.equals(m_2)):
             return (Q_A*Q_B*(cst.G_F**sp.Rational(2))*(m_1**sp.Rational(2))
-                    *sp.simplify(sp.besselk(2, 2*m_1*r))
+                    *util.besselk_reduced(2, 2*m_1*r)
                     /(8*(sp.pi**sp.Rational(3))*(r**sp.Rational(3))))
 
         else:
@@ -49,18 +54,21 @@ class MajoranaNuPairPotential(NuPairPotential):
             return term_1 + term_2
     # ==================================================================
     @staticmethod
-    def term_1(m_1, m_2, r, order: int = 1):
-        expr = sp.Rational(0)
-        a = (m_1 + m_2)**sp.Rational(2)
-        e = (m_1 - m_2)**sp.Rational(2)
+    def get_series(m_1, m_2, r) -> List[Tuple[cst.EXPR_TYPE, SeriesBuilder]]:
+        """Return the prefactors and the series of the Dirac term_1 and
+        term_2, of term_1 and of the Dirac term_3, in the order of the
+        parameter orders of pot_term.
+        """
         h = m_1 * m_2
-        dummyx = sp.symbols('dummyx')
-        for k in range(order):
-            integral = IntegralAA((sp.Rational(-0.5-k), sp.Rational(1, 2),
-                                   a, r), (dummyx, a, np.inf))
-            expr -= ((sp.Rational(-1)**k)
-                     * sp.Rational(sp.binomial(sp.Rational(1, 2), k))
-                     * (e**k) * h * sp.Rational(1, 64) * (1/r)
-                     * integral.doit())
+        dirac_series = DiracNuPairPotential.get_series(m_1, m_2, r)
+
+        return (dirac_series[:2]
+                + [(-h * sp.Rational(1, 64) * (1/r),
+                    SeriesBuilder.get(m_1, m_2, r, sp.Rational(-1, 2)))]
+                + dirac_series[2:])
+    # ==================================================================
+    @staticmethod
+    def term_1(m_1, m_2, r, order: int = 1):
+        prefactor, series = MajoranaNuPairPotential.get_series(m_1, m_2, r)[2]
 
-        return expr
+        return prefactor * series.partial_sum(order)
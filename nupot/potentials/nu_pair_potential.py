@@ -2,12 +2,21 @@
 """.. moduleauthor:: Sacha Medaer"""
 
 import numpy as np
+import scipy.special
 import sympy as sp
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations_with_replacement
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from sympy.utilities.lambdify import implemented_function
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
-from nupot.functions.klkl_function import KLKLFunction
+from nupot.cache.expression_cache import ExpressionCache
+from nupot.cache.lru_dict import LRUDict
+from nupot.functions.klkl_function import KLKLFunction,\
+                                         klkl_remainder_scaled
 from nupot.integrals.integralBA import IntegralBA
 from nupot.integrals.integralBB import IntegralBB
 from nupot.integrals.integralBC import IntegralBC
@@ -17,13 +26,24 @@ from nupot.integrals.integralBF import IntegralBF
 from nupot.integrals.integralBG import IntegralBG
 from nupot.matrices.global_weak_charge import GlobalWeakCharge
 from nupot.physics.atom import Atom
+from nupot.physics.material import Material
 from nupot.potentials.abstract_potential import AbstractPotential
+from nupot.potentials.series_builder import SeriesBuilder
 
 
 class NuPairPotentialNotImplementedError(NotImplementedError):
     pass
 
 
+ORDERS_TYPE = Union[List[int], Dict[Tuple[int, int], Optional[List[int]]]]
+
+
+def _get_pair_term(cls, m_1, m_2, r, orders):
+    # module level to be picklable by the process pool
+
+    return cls.pot_term(m_1, m_2, r, 1, 1, orders)
+
+
 class NuPairPotential(sp.Function):
     r"""
 
@@ -48,15 +68,45 @@ class NuPairPotential(sp.Function):
                 & \quad \text{if considering Majorana neutrinos}
               \end{cases}
 
+    The atoms enter only through the factors
+    :math:`Q^{ij}_{W,A}Q^{ij\, *}_{W,B}`. The charge-independent
+    kinematic kernel, i.e. the six mass-pair terms with unit charges, is
+    derived and compiled once per class, orders, masses and radius and
+    shared by all the atom pairs, which are then a contraction of the
+    kernel with the weak charges. The kernel can also be stored on disk
+    by setting :attr:`expression_cache`, see :class:`ExpressionCache`.
+    An atom can be replaced by a :class:`Material`, whose numeric
+    effective charges enter :meth:`doit` as floats.
+
     """
-    def __new__(cls, atom_A: Atom, atom_B: Atom, *args, **kwargs):
-        # pass along the parameters only to the parent class
+    # Orders of the series of pot_term, overridden in the child classes
+    default_orders: Optional[List[int]] = None
+    # On-disk cache of the derived expressions, None to disable
+    expression_cache: Optional[ExpressionCache] = None
+    # In-memory caches of the kinematic kernels and weak charges, which
+    # keep the cache_size most recently used entries
+    cache_size: int = 128
+    __pair_terms: dict = LRUDict(cache_size)
+    __numeric_pair_terms: dict = LRUDict(cache_size)
+    __scaled_pair_terms: dict = LRUDict(cache_size)
+    __charge_tensors: dict = LRUDict(cache_size)
+
+    def __new__(cls, atom_A: Union[Atom, Material],
+                atom_B: Union[Atom, Material], *args,
+                orders: Optional[ORDERS_TYPE] = None, **kwargs):
+        # pass along the parameters only to the parent class, bypassing
+        # the cache of sp.Function.__new__ as the atoms and the orders
+        # are not sympy arguments, otherwise two potentials of different
+        # atoms and same symbols would be the same object
 
-        return super().__new__(cls, *args, **kwargs)
+        return sp.Expr.__new__(cls, *map(sp.sympify, args))
     # ==================================================================
-    def __init__(self, atom_A: Atom, atom_B: Atom, *agrs, **kwargs):
-        self._atom_A: Atom = atom_A
-        self._atom_B: Atom = atom_B
+    def __init__(self, atom_A: Union[Atom, Material],
+                 atom_B: Union[Atom, Material], *agrs,
+                 orders: Optional[ORDERS_TYPE] = None, **kwargs):
+        self._atom_A: Union[Atom, Material] = atom_A
+        self._atom_B: Union[Atom, Material] = atom_B
+        self._orders: Optional[ORDERS_TYPE] = orders
     # ==================================================================
     @property
     def atom_A(self):
@@ -68,6 +118,19 @@ class NuPairPotential(sp.Function):
 
         return self._atom_B
     # ==================================================================
+    @property
+    def orders(self) -> Optional[ORDERS_TYPE]:
+        """The orders of the series of pot_term, the same for all the
+        mass pairs or a dict mapping each pair (i, j) of
+        combinations_with_replacement([0, 1, 2], 2) to its orders.
+        """
+
+        if (self._orders is None):
+
+            return self.default_orders
+
+        return self._orders
+    # ==================================================================
     def doit(self, deep=False, **hints):
         # Extracting arguments
         m_1, m_2, m_3, r = self.args
@@ -79,123 +142,592 @@ class NuPairPotential(sp.Function):
             r = r.doit(deep=deep, **hints)
         # Group masses in iterable
         masses = (m_1, m_2, m_3)
+        # Calculate potential
+        pair_terms = self.get_pair_terms(masses, r,
+                                         hints.get('parallel', False),
+                                         hints.get('max_workers', None))
+        V = sp.Rational(0)
+        if (isinstance(self._atom_A, Material)
+                or isinstance(self._atom_B, Material)):
+            # the charges of a material are only known numerically
+            for product, pair_term in zip(self.get_charge_products(),
+                                          pair_terms):
+                V += sp.Float(product) * pair_term
+
+            return V
         # Initiate the global weak charge matrix
         Q_A = GlobalWeakCharge(self._atom_A.atomic_number,
                                self._atom_A.neutrons)
         Q_B = GlobalWeakCharge(self._atom_B.atomic_number,
                                self._atom_B.neutrons)
-        # Calculate potential
-        V = sp.Rational(0)
-        for comb in list(combinations_with_replacement([0, 1, 2], 2)):
+        for i, comb in enumerate(combinations_with_replacement([0, 1, 2], 2)):
             crt_Q_A = Q_A[comb[0], comb[1]]
             crt_Q_B = sp.conjugate(Q_B[comb[0], comb[1]])
-            V += self.pot_term(masses[comb[0]], masses[comb[1]], r,
-                               crt_Q_A, crt_Q_B)
+            V += crt_Q_A * crt_Q_B * pair_terms[i]
 
         return V
     # ==================================================================
+    def _get_kernel_key(self, masses, r) -> Tuple:
+
+        return (type(self), self._get_orders_key(), tuple(masses), r)
+    # ==================================================================
+    def _get_orders_key(self) -> Optional[Tuple]:
+        orders = self.orders
+        if (orders is None):
+
+            return None
+        if (isinstance(orders, dict)):
+
+            return tuple(sorted((comb, None if (order is None)
+                                 else tuple(order))
+                                for comb, order in orders.items()))
+
+        return tuple(orders)
+    # ==================================================================
+    def get_pair_orders(self, comb: Tuple[int, int]) -> Optional[List[int]]:
+        """Return the orders of the series of pot_term for the mass pair
+        comb.
+        """
+        if (isinstance(self.orders, dict)):
+
+            return self.orders.get(comb)
+
+        return self.orders
+    # ==================================================================
+    def get_pair_terms(self, masses, r, parallel: bool = False,
+                       max_workers: Optional[int] = None
+                       ) -> Tuple[cst.EXPR_TYPE, ...]:
+        """Return the kinematic kernel, i.e. the six mass-pair terms of
+        the potential with unit weak charges, in the order of
+        combinations_with_replacement([0, 1, 2], 2). The kernel is
+        memoized and loaded from :attr:`expression_cache` if it is set.
+        If parallel is True, the terms are derived in a pool of
+        max_workers processes (the number of processors if None), also
+        available as the hints parallel and max_workers of :meth:`doit`.
+        """
+        def compute():
+            args = [(type(self), masses[comb[0]], masses[comb[1]], r,
+                     self.get_pair_orders(comb))
+                    for comb in combinations_with_replacement([0, 1, 2], 2)]
+            if (parallel):
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+
+                    return tuple(executor.map(_get_pair_term, *zip(*args)))
+
+            return tuple(_get_pair_term(*arg) for arg in args)
+
+        key = self._get_kernel_key(masses, r)
+        pair_terms = NuPairPotential.__pair_terms.get(key)
+        if (pair_terms is None):
+            cache = NuPairPotential.expression_cache
+            if (cache is None):
+                pair_terms = compute()
+            else:
+                disk_key = ExpressionCache.make_key(type(self).__module__,
+                                                    type(self).__qualname__,
+                                                    self._get_orders_key(),
+                                                    tuple(masses), r)
+                pair_terms = cache.get_or_compute(disk_key, compute)
+            NuPairPotential.__pair_terms[key] = pair_terms
+
+        return pair_terms
+    # ==================================================================
+    def get_numeric_pair_terms(self) -> Callable:
+        """Return the compiled kinematic kernel, a numpy-vectorized
+        function of (r, m_1, m_2, m_3) returning the list of the six
+        mass-pair terms, see :meth:`get_pair_terms`. The function is
+        compiled once per class, orders, masses and radius.
+        """
+        m_1, m_2, m_3, r = self.args
+        key = self._get_kernel_key((m_1, m_2, m_3), r)
+        func = NuPairPotential.__numeric_pair_terms.get(key)
+        if (func is None):
+            pair_terms = self.get_pair_terms((m_1, m_2, m_3), r)
+            func = util.lambdify_numeric((r, m_1, m_2, m_3),
+                                         list(pair_terms))
+            NuPairPotential.__numeric_pair_terms[key] = func
+
+        return func
+    # ==================================================================
+    def evaluate_pair_terms(self, r, m_1, m_2, m_3) -> np.ndarray:
+        """Return the values of the six mass-pair terms with unit weak
+        charges in an array of shape (6,) + the broadcast shape of r,
+        m_1, m_2 and m_3.
+        """
+        shape = np.broadcast(r, m_1, m_2, m_3).shape
+        values = self.get_numeric_pair_terms()(r, m_1, m_2, m_3)
+
+        return np.stack([np.broadcast_to(value, shape) for value in values])
+    # ==================================================================
+    @staticmethod
+    def get_weak_charge_tensor(atom: Union[Atom, Material]) -> np.ndarray:
+        """Return the complex numpy array of shape (3, 3) of the numeric
+        global weak charge matrix of atom. For a material, the effective
+        charge per volume is returned, see
+        :attr:`Material.weak_charge_tensor`.
+        """
+        if (isinstance(atom, Material)):
+
+            return atom.weak_charge_tensor
+
+        key = (float(atom.atomic_number.evalf()), float(atom.neutrons.evalf()))
+        charges = NuPairPotential.__charge_tensors.get(key)
+        if (charges is None):
+            charges = GlobalWeakCharge.evaluate(*key)
+            NuPairPotential.__charge_tensors[key] = charges
+
+        return charges
+    # ==================================================================
+    @staticmethod
+    def get_weak_charge_vector(atom: Union[Atom, Material]) -> np.ndarray:
+        """Return the numeric values of the elements (i, j) with i <= j
+        of the global weak charge matrix of atom, in the order of
+        combinations_with_replacement([0, 1, 2], 2), see
+        :meth:`get_weak_charge_tensor`.
+        """
+
+        charges = NuPairPotential.get_weak_charge_tensor(atom)
+
+        return charges[np.triu_indices(3)]
+    # ==================================================================
+    def get_charge_products(self) -> np.ndarray:
+        r"""Return the six real products of weak charges contracted with
+        the kinematic kernel, in the order of
+        combinations_with_replacement([0, 1, 2], 2).
+
+        Notes
+        -----
+        The products :math:`Q^{ij}_{W,A}Q^{ij\, *}_{W,B}` of
+        :meth:`doit` are combined with their conjugate terms (j, i):
+
+        .. math::  \frac{1}{2}\Big(Q^{ij}_{W,A}Q^{ij\, *}_{W,B}
+                   + Q^{ji}_{W,A}Q^{ji\, *}_{W,B}\Big)
+
+        The weak charge matrices are hermitian, such that the combination
+        is the real part of the product. For the charges
+        :math:`2Z U_{ei} U_{ej}^* - N \delta_{ij}` the products are real
+        for any :math:`\delta_{CP}`, such that the combination is equal to
+        the product of :meth:`doit`.
+
+        """
+        Q_A = NuPairPotential.get_weak_charge_tensor(self._atom_A)
+        Q_B = NuPairPotential.get_weak_charge_tensor(self._atom_B)
+        products = Q_A * np.conjugate(Q_B)
+        rows, cols = np.triu_indices(3)
+        products = 0.5 * (products[rows, cols] + products[cols, rows])
+
+        # the imaginary parts of the conjugate terms cancel exactly
+        return np.real(products)
+    # ==================================================================
+    def evaluate(self, r, m_1, m_2, m_3) -> np.ndarray:
+        """Return the numeric values of the potential, vectorized over
+        the arrays r, m_1, m_2 and m_3 which are broadcast together, as
+        the contraction of the compiled kinematic kernel with the weak
+        charges of the atom pair, see :meth:`get_charge_products`.
+        """
+        pair_terms = self.evaluate_pair_terms(r, m_1, m_2, m_3)
+
+        return np.tensordot(self.get_charge_products(), pair_terms, axes=1)
+    # ==================================================================
+    def get_scaled_pair_terms(self) -> Tuple[Callable, Callable,
+                                             np.ndarray]:
+        r"""Return the compiled exponentially scaled kinematic kernel,
+        two numpy-vectorized functions of (r, m_1, m_2, m_3) returning
+        the lists of the coefficients :math:`C_b` and of the arguments
+        :math:`x_b` such that the six mass-pair terms are
+        :math:`\sum_b C_b e^{-x_b}`, and the array of the indices of the
+        mass-pair term of each b.
+
+        Notes
+        -----
+        The functions of the kernel are replaced by their scaled
+        counterparts, which are of order one at large arguments:
+
+        .. math::  K_n(x) = e^{-x} \text{kve}(n, x) \quad \text{and}
+                   \quad KLKL(x) = \frac{1}{x} + e^{-x} R(x)
+
+        with :math:`R` the function :func:`klkl_remainder_scaled`. The
+        algebraic parts :math:`\frac{1}{x}` of :math:`KLKL` cancel
+        exactly in the mass-pair terms, a remaining part would be kept
+        with :math:`x_b = 0`.
+
+        """
+        m_1, m_2, m_3, r = self.args
+        key = self._get_kernel_key((m_1, m_2, m_3), r)
+        res = NuPairPotential.__scaled_pair_terms.get(key)
+        if (res is None):
+            kve = implemented_function('kve', scipy.special.kve)
+            remainder = implemented_function('klkl_remainder_scaled',
+                                             klkl_remainder_scaled)
+            pair_terms = self.get_pair_terms((m_1, m_2, m_3), r)
+            coeffs = []
+            args_ = []
+            indices = []
+            for i, term in enumerate(pair_terms):
+                # the dummy scales stand for exp(-x) of each argument x
+                scales: Dict[cst.EXPR_TYPE, sp.Dummy] = {}
+                repl = {}
+                for func in term.atoms(sp.besselk, KLKLFunction):
+                    x = func.args[-1]
+                    scale = scales.setdefault(x, sp.Dummy('scale'))
+                    if (isinstance(func, KLKLFunction)):
+                        repl[func] = (1/x) + (scale*remainder(x))
+                    else:
+                        repl[func] = scale * kve(func.args[0], x)
+                expr = sp.expand(term.xreplace(repl))
+                collected = sp.collect(expr, list(scales.values()),
+                                       evaluate=False)
+                for x, scale in scales.items():
+                    coeffs.append(collected.get(scale, sp.Rational(0)))
+                    args_.append(x)
+                    indices.append(i)
+                rest = sp.cancel(sp.together(collected.get(sp.S.One,
+                                                           sp.Rational(0))))
+                if (rest != 0):
+                    coeffs.append(rest)
+                    args_.append(sp.Rational(0))
+                    indices.append(i)
+            res = (util.lambdify_numeric((r, m_1, m_2, m_3), coeffs),
+                   util.lambdify_numeric((r, m_1, m_2, m_3), args_),
+                   np.array(indices))
+            NuPairPotential.__scaled_pair_terms[key] = res
+
+        return res
+    # ==================================================================
+    def evaluate_scaled(self, r, m_1, m_2, m_3
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+        r"""Return the mantissa and the logarithmic scale s of the
+        numeric values of the potential, :math:`V = \text{mantissa}
+        \cdot e^{-s}`, vectorized as :meth:`evaluate`. The values are
+        computed from the scaled kernel of :meth:`get_scaled_pair_terms`
+        without any overflow or underflow at large radius, where
+        :meth:`evaluate` returns zero or nan.
+
+        Notes
+        -----
+        The scale s is the smallest argument :math:`x_b` of non-zero
+        coefficient, such that the mantissa is of the order of the
+        dominant term:
+
+        .. math::  \text{mantissa} = \sum_b Q_b C_b e^{-(x_b - s)}
+
+        with :math:`Q_b` the product of weak charges of the mass-pair
+        term of b, see :meth:`get_charge_products`.
+
+        """
+        func_coeffs, func_args, indices = self.get_scaled_pair_terms()
+        shape = np.broadcast(r, m_1, m_2, m_3).shape
+        coeffs = np.stack([np.broadcast_to(coeff, shape) for coeff
+                           in func_coeffs(r, m_1, m_2, m_3)])
+        args_ = np.stack([np.broadcast_to(np.asarray(arg, dtype=float),
+                                          shape)
+                          for arg in func_args(r, m_1, m_2, m_3)])
+        charges = self.get_charge_products()[indices]
+        coeffs = charges.reshape((-1,) + (1,)*len(shape)) * coeffs
+        log_scale = np.min(np.where(coeffs != 0, args_, np.inf), axis=0)
+        log_scale = np.where(np.isinf(log_scale), 0.0, log_scale)
+        mantissa = np.sum(coeffs * np.exp(-(args_ - log_scale)), axis=0)
+
+        return mantissa, log_scale
+    # ==================================================================
+    @staticmethod
+    def kernel_cache_clear() -> None:
+        """Clear the in-memory caches of the kinematic kernels and of
+        the weak charges.
+        """
+        NuPairPotential.__pair_terms.clear()
+        NuPairPotential.__numeric_pair_terms.clear()
+        NuPairPotential.__scaled_pair_terms.clear()
+        NuPairPotential.__charge_tensors.clear()
+
+        return None
+    # ==================================================================
+    @staticmethod
+    def get_series(m_1, m_2, r) -> List[Tuple[cst.EXPR_TYPE, SeriesBuilder]]:
+        """Return the prefactors and the series of the terms of
+        pot_term, in the order of its parameter orders.
+        """
+
+        raise NuPairPotentialNotImplementedError()
+    # ==================================================================
+    @classmethod
+    def get_adaptive_orders(cls, m_1, m_2, r, samples: Tuple,
+                            rtol: float = 1e-6, max_order: int = 8
+                            ) -> List[int]:
+        r"""Return the orders of the series of pot_term for the mass
+        pair (m_1, m_2) such that the truncation error is smaller than
+        rtol times the value of pot_term at the samples (r, m_1, m_2),
+        three arrays which are broadcast together.
+
+        Notes
+        -----
+        The truncation error of each series is estimated by the first
+        omitted term. The order of each series is increased by one
+        until its estimate is below the tolerance at all the samples or
+        max_order is reached.
+
+        """
+        series_list = cls.get_series(m_1, m_2, r)
+        samples = np.broadcast_arrays(*[np.asarray(sample, dtype=float)
+                                        for sample in samples])
+        values: List[List[np.ndarray]] = [[] for _ in series_list]
+
+        def get_value(i, k):
+            while (len(values[i]) <= k):
+                prefactor, series = series_list[i]
+                term = prefactor * series.get_term(len(values[i]))
+                func = util.lambdify_numeric((r, m_1, m_2), term)
+                values[i].append(np.broadcast_to(func(*samples),
+                                                 samples[0].shape))
+
+            return values[i][k]
+
+        orders = [1] * len(series_list)
+        is_converged = False
+        while (not is_converged):
+            total = sum(sum(get_value(i, k) for k in range(order))
+                        for i, order in enumerate(orders))
+            is_converged = True
+            for i in range(len(orders)):
+                if (orders[i] < max_order):
+                    error = np.abs(get_value(i, orders[i]))
+                    if (np.any(error >= (rtol*np.abs(total)))):
+                        orders[i] += 1
+                        is_converged = False
+
+        return orders
+    # ==================================================================
+    def set_adaptive_orders(self, samples: Dict, rtol: float = 1e-6,
+                            max_order: int = 8
+                            ) -> Dict[Tuple[int, int], Optional[List[int]]]:
+        """Set the orders of each mass pair with
+        :meth:`get_adaptive_orders` and return them, None for the pairs
+        of equal masses which have a closed form. samples maps the
+        symbols m_1, m_2, m_3 and r of the potential to arrays of values
+        which are broadcast together.
+        """
+        m_1, m_2, m_3, r = self.args
+        masses = (m_1, m_2, m_3)
+        orders = {}
+        for comb in combinations_with_replacement([0, 1, 2], 2):
+            m_i, m_j = masses[comb[0]], masses[comb[1]]
+            if (m_i.equals(m_j)):
+                orders[comb] = None
+            else:
+                orders[comb] = self.get_adaptive_orders(
+                    m_i, m_j, r, (samples[r], samples[m_i], samples[m_j]),
+                    rtol, max_order)
+        self._orders = orders
+
+        return orders
+    # ==================================================================
+    def to_numeric(self, cse: bool = True, tabulated: bool = False
+                   ) -> Callable:
+        """Return the numpy-vectorized function V(r, m_1, m_2, m_3) of
+        the potential, see :func:`util.lambdify_numeric`. The six
+        mass-pair terms are compiled in one function such that their
+        common subexpressions are computed once. If tabulated is True,
+        the special functions are evaluated from their Chebyshev tables.
+        """
+        m_1, m_2, m_3, r = self.args
+
+        return util.lambdify_numeric((r, m_1, m_2, m_3), self.doit(), cse,
+                                     tabulated)
+    # ==================================================================
     def _eval_evalf(self, prec) -> sp.Float:
 
         return self.doit().evalf()
     # ==================================================================
     @staticmethod
-    def factorize(expr, m_1, m_2, m_3, r):
-        #m_1, m_2, m_3, r = self.args
-        vars = []
-        vars.append(2*m_1*r)
-        vars.append(2*m_2*r)
-        vars.append(2*m_3*r)
+    def factorize(expr, r, *deprecated_args
+                  ) -> List[Tuple[cst.EXPR_TYPE, cst.EXPR_TYPE]]:
+        r"""Return the list of pairs (coefficient, factor) such that
+        expr is the sum of their products, where the factors are the
+        :math:`K_0`, :math:`K_1` and :class:`KLKLFunction` depending on
+        r, or their powers, in order of appearance. The remaining terms
+        are last with the factor 1.
+
+        Notes
+        -----
+        The terms of the expanded expression are bucketed by their
+        factor in a single traversal, the arguments of the factors are
+        not assumed. The former signature factorize(expr, m_1, m_2, m_3,
+        r) is deprecated, the masses are ignored.
+
+        """
+        if (deprecated_args):
+            warnings.warn("factorize(expr, m_1, m_2, m_3, r) is "
+                          "deprecated, use factorize(expr, r), the masses "
+                          "are ignored.", DeprecationWarning, stacklevel=2)
+            r = deprecated_args[-1]
+        buckets: Dict[cst.EXPR_TYPE, List[cst.EXPR_TYPE]] = {}
+        rest = []
         # Must expand for the factorization logic, assumed that the
         # argument has been expanded in custom function
-        vars.append((r*(m_1 + m_2)).expand())
-        vars.append((r*(m_2 + m_3)).expand())
-        vars.append((r*(m_1 + m_3)).expand())
-        factors = []
-        for i, var in enumerate(vars):
-            factors.append(sp.besselk(0, var))
-            factors.append(sp.besselk(1, var))
-            if (i > 2): # not KLKLFunction(2*m_i*r)
-                factors.append(KLKLFunction(var))
-
-        factorization = []
-        expr_ = expr.expand()
-        for factor in factors:
-            coeff_expr = expr_.coeff(factor)
-            expr_ = expr_.subs(factor, 0)
-            if (coeff_expr):
-                factorization.append((coeff_expr, factor))
-        if (expr_):
-            factorization.append((expr_, sp.Rational(1))) # add the rest
+        for term in sp.Add.make_args(expr.expand()):
+            args = sp.Mul.make_args(term)
+            for i, arg in enumerate(args):
+                base = arg.base if arg.is_Pow else arg
+                if (isinstance(base, (sp.besselk, KLKLFunction))
+                        and base.has(r)):
+                    coeff = sp.Mul(*(args[:i] + args[i+1:]))
+                    buckets.setdefault(arg, []).append(coeff)
+                    break
+            else:
+                rest.append(term)
+        factorization = [(sp.Add(*coeffs), factor)
+                         for factor, coeffs in buckets.items()]
+        if (rest):
+            factorization.append((sp.Add(*rest), sp.Rational(1)))
 
         return factorization
     # ==================================================================
     @staticmethod
     def integrate_over_r(expr, m_1, m_2, m_3, r, a, b):
-        fact_expr = NuPairPotential.factorize(expr, m_1, m_2, m_3, r)
+        """Return the symbolic definite integral of expr over r with
+        limits between a and b, see :meth:`get_radial_integrals`. The
+        Laurent polynomial part is only integrated for finite limits, as
+        it diverges at infinity term by term.
+        """
+        integrals, antiderivative = NuPairPotential.get_radial_integrals(
+            expr, r)
         res = sp.Rational(0)
-        for fact in fact_expr:
-            if (isinstance(fact[1], sp.besselk)):
-                if (fact[1].order == 0):
-                    alpha = fact[1].argument.coeff(r)
-                    for arg in fact[0].args:
-                        coeff, expo = util.get_coeff_and_expo_of_symbol(arg, r)
-                        if (expo % 2):  # odd
-                            if (expo > 0):
-                                n = (expo - 1) // 2
-                                integral = IntegralBB((n, alpha), (r, a, b))
-                            else:
-                                n = (abs(expo) - 1) // 2
-                                integral = IntegralBE((n, alpha), (r, a, b))
-                            res += coeff * integral.doit()
-                        else:   # even
-                            if (expo > 0):
-                                n = expo // 2
-                                integral = IntegralBF((n, alpha), (r, a, b))
-                            else:
-
-                                raise NuPairPotentialNotImplementedError()
-                            res += coeff * integral.doit()
-                elif (fact[1].order == 1):
-                    alpha = fact[1].argument.coeff(r)
-                    for arg in fact[0].args:
-                        coeff, expo = util.get_coeff_and_expo_of_symbol(arg, r)
-                        if (not (expo % 2)):  # even
-                            if (expo > 0):
-                                n = expo // 2
-                                integral = IntegralBC((n, alpha), (r, a, b))
-                            else:
-                                n = abs(expo) // 2
-                                integral = IntegralBD((n, alpha), (r, a, b))
-                            res += coeff * integral.doit()
-                        else:
-                            if (expo > 0):
-                                n = (expo - 1) // 2
-                                integral = IntegralBG((n, alpha), (r, a, b))
-                            else:
-
-                                raise NuPairPotentialNotImplementedError()
-                            res += coeff * integral.doit()
-                else:
-
-                    raise NuPairPotentialNotImplementedError()
-            elif (isinstance(fact[1], KLKLFunction)):
-                alpha = fact[1].argument.coeff(r)
-                for arg in fact[0].args:
-                    coeff, expo = util.get_coeff_and_expo_of_symbol(arg, r)
-                    if (expo % 2):  # odd
-                        if (expo > 0):
-                            n = (expo - 1) // 2
-                            integral = IntegralBA((n, alpha), (r, a, b))
-                            res += coeff * integral.doit()
-                        else:
-
-                            raise NuPairPotentialNotImplementedError()
-                    else:
+        for coeff, integral_cls, n, alpha in integrals:
+            res += coeff * integral_cls((n, alpha), (r, a, b)).doit()
+        if (not sp.sympify(b).is_infinite):
+            res += antiderivative.subs(r, b) - antiderivative.subs(r, a)
+
+        return res
+    # ==================================================================
+    @staticmethod
+    def cumulative_integral_over_r(expr, m_1, m_2, m_3, r, r_grid
+                                   ) -> Callable:
+        r"""Return the numpy function of the masses m_1, m_2 and m_3
+        which computes the cumulative integrals of expr over r:
 
-                        NuPairPotentialNotImplementedError()
+        .. math::  \int_{r_0}^{r_k} V(r) dr
 
-            else:   # consider all other symbol/functions as constant
-                #res += sp.Rational(0)#sp.integrate(fact[0], r)
-                print('')
+        for all the nodes :math:`r_k > 0` of the array r_grid at once.
 
-        return res
+        Notes
+        -----
+        The coefficients and arguments of the terms of
+        :meth:`get_radial_integrals` are compiled in one function of the
+        masses, the terms sharing the same integral are summed up. Each
+        antiderivative is then evaluated once on the entire grid, see
+        :meth:`AbstractIntegralB.evaluate_antiderivative`, as well as the
+        antiderivative of the Laurent polynomial part.
+
+        """
+        r_grid = np.asarray(r_grid, dtype=float)
+        integrals_, antiderivative = NuPairPotential.get_radial_integrals(
+            expr, r)
+        integrals: Dict[Tuple, cst.EXPR_TYPE] = {}
+        for coeff, integral_cls, n, alpha in integrals_:
+            key = (integral_cls, n, alpha)
+            integrals[key] = integrals.get(key, sp.Rational(0)) + coeff
+        keys = list(integrals.keys())
+        numeric = util.lambdify_numeric(
+            (m_1, m_2, m_3), ([integrals[key] for key in keys]
+                              + [key[2] for key in keys]))
+        numeric_poly = util.lambdify_numeric((r, m_1, m_2, m_3),
+                                             antiderivative)
+
+        def cumulative_integral(m_1, m_2, m_3) -> np.ndarray:
+            values = numeric(m_1, m_2, m_3)
+            res = np.zeros(r_grid.shape) + numeric_poly(r_grid, m_1, m_2,
+                                                        m_3)
+            res -= res.flat[0]
+            for (integral_cls, n, _), coeff, alpha in\
+                    zip(keys, values[:len(keys)], values[len(keys):]):
+                antiderivative = integral_cls.evaluate_antiderivative(
+                    n, np.full(r_grid.shape, float(alpha)), r_grid)
+                res += float(coeff) * (antiderivative
+                                       - antiderivative.flat[0])
+
+            return res
+
+        return cumulative_integral
+    # ==================================================================
+    @staticmethod
+    def get_radial_integrals(expr, r
+                             ) -> Tuple[List[Tuple], cst.EXPR_TYPE]:
+        r"""Return the list of tuples (coefficient, integral class,
+        order n, alpha) and the antiderivative of the remaining Laurent
+        polynomial in r, such that the integral of expr over r is the
+        sum of the coefficients times the integrals of the IntegralB
+        family of order n and argument :math:`\alpha r`, see
+        :meth:`factorize`, plus the antiderivative.
+        """
+        integrals = []
+        antiderivative = sp.Rational(0)
+        for coeff_expr, factor in NuPairPotential.factorize(expr, r):
+            terms = [NuPairPotential._split_monomial(term, r)
+                     for term in sp.Add.make_args(coeff_expr)]
+            if (factor == 1):
+                antiderivative = sp.Add(*[
+                    (coeff*sp.log(r)) if (expo == -1)
+                    else (coeff * (r**(expo+1)) / (expo+1))
+                    for coeff, expo in terms])
+                continue
+            if (factor.is_Pow):
+
+                raise NuPairPotentialNotImplementedError("No radial "
+                    "integral is known for the power {}.".format(factor))
+            alpha = factor.argument.coeff(r)
+            if ((factor.argument - (alpha*r)).expand()):
+
+                raise NuPairPotentialNotImplementedError("The argument {} "
+                    "is not linear in {}.".format(factor.argument, r))
+            for coeff, expo in terms:
+                integral_cls, n = NuPairPotential._get_radial_integral(
+                    factor, expo)
+                integrals.append((coeff, integral_cls, n, alpha))
+
+        return integrals, antiderivative
+    # ==================================================================
+    @staticmethod
+    def _split_monomial(term, r) -> Tuple[cst.EXPR_TYPE, int]:
+        # coefficient and integer exponent of the monomial term in r
+        coeff, expo = term.as_coeff_exponent(r)
+        if (coeff.has(r) or (not expo.is_Integer)):
+
+            raise NuPairPotentialNotImplementedError("The term {} is not a "
+                "monomial in {}.".format(term, r))
+
+        return coeff, int(expo)
+    # ==================================================================
+    @staticmethod
+    def _get_radial_integral(factor, expo: int) -> Tuple[type, int]:
+        # integral class and order of the integrand r**expo * factor
+        if (isinstance(factor, KLKLFunction)):
+            if ((expo % 2) and (expo > 0)):
+
+                return IntegralBA, (expo-1) // 2
+
+        elif (factor.order == 0):
+            if (expo % 2):  # odd
+                if (expo > 0):
+
+                    return IntegralBB, (expo-1) // 2
+
+                return IntegralBE, (abs(expo)-1) // 2
+
+            elif (expo >= 0):
+
+                return IntegralBF, expo // 2
+
+        elif (factor.order == 1):
+            if (not (expo % 2)):  # even
+                if (expo > 0):
+
+                    return IntegralBC, expo // 2
+
+                return IntegralBD, abs(expo) // 2
+
+            elif (expo > 0):
+
+                return IntegralBG, (expo-1) // 2
+
+        raise NuPairPotentialNotImplementedError("No integral of r^{} {} "
+            "is implemented.".format(expo, factor))
@@ -0,0 +1,149 @@
+
+""".. moduleauthor:: Sacha Medaer"""
+
+from typing import Dict, Iterator, List, Tuple
+
+import sympy as sp
+
+import nupot.utils.constants as cst
+import nupot.utils.utilities as util
+from nupot.cache.lru_dict import LRUDict
+from nupot.integrals.integralAA import IntegralAA
+
+
+# Exceptions
+class SeriesBuilderInputError(Exception):
+    pass
+
+
+class SeriesBuilder(object):
+    r"""This class builds incrementally the binomial series of the
+    potential terms in :math:`e = (m_1 - m_2)^2`.
+
+    Notes
+    -----
+    Represents the following series, with :math:`a = (m_1 + m_2)^2`:
+
+    .. math::  \sum_{k=0}^{n-1} (-1)^k \binom{\frac{1}{2}}{k} e^k
+               \int_{a}^{\infty} x^{\rho_0 - k} (x-a)^{\frac{1}{2}}
+               e^{-r \sqrt{x}} dx
+
+    The terms and the partial sums already computed are kept, such
+    that increasing the order by one costs one new term. The builders
+    are shared through :meth:`get` for a given :math:`(m_1, m_2, r,
+    \rho_0)` and the integrals are shared between all the builders of
+    the same :math:`(m_1, m_2, r)`, e.g. the term :math:`k` of
+    :math:`\rho_0 = \frac{1}{2}` reuses the term :math:`k-1` of
+    :math:`\rho_0 = -\frac{1}{2}`. The shared builders and integrals
+    are kept for the :attr:`cache_size` most recently used parameters,
+    such that a sweep over numeric masses or radii does not grow them
+    without bound.
+
+    """
+    # Maximum number of shared builders and of shared (m_1, m_2, r)
+    cache_size: int = 128
+    __builders: Dict[Tuple, 'SeriesBuilder'] = LRUDict(cache_size)
+    __integrals: Dict[Tuple, Dict[sp.Rational, cst.EXPR_TYPE]] = LRUDict(
+        cache_size)
+
+    def __init__(self, m_1, m_2, r, rho_0) -> None:
+        rho_0 = sp.Rational(rho_0)
+        if (not (2*rho_0).is_integer):
+
+            raise SeriesBuilderInputError("The initial order rho_0={} must "
+                                          "be an integer or half-integer."
+                                          .format(rho_0))
+        self._m_1 = m_1
+        self._m_2 = m_2
+        self._r = r
+        self._rho_0: sp.Rational = rho_0
+        self._a = (m_1 + m_2)**sp.Rational(2)
+        self._e = (m_1 - m_2)**sp.Rational(2)
+        integrals = SeriesBuilder.__integrals.get((m_1, m_2, r))
+        if (integrals is None):
+            integrals = {}
+            SeriesBuilder.__integrals[(m_1, m_2, r)] = integrals
+        self._integrals: Dict[sp.Rational, cst.EXPR_TYPE] = integrals
+        self._terms: List[cst.EXPR_TYPE] = []
+        self._partial_sums: List[cst.EXPR_TYPE] = [sp.Rational(0)]
+
+        return None
+    # ==================================================================
+    @staticmethod
+    def get(m_1, m_2, r, rho_0) -> 'SeriesBuilder':
+        """Return the shared builder of the parameters (m_1, m_2, r,
+        rho_0).
+        """
+        key = (m_1, m_2, r, sp.Rational(rho_0))
+        builder = SeriesBuilder.__builders.get(key)
+        if (builder is None):
+            builder = SeriesBuilder(*key)
+            SeriesBuilder.__builders[key] = builder
+
+        return builder
+    # ==================================================================
+    @staticmethod
+    def clear() -> None:
+        """Remove all the shared builders and integrals."""
+        SeriesBuilder.__builders.clear()
+        SeriesBuilder.__integrals.clear()
+
+        return None
+    # ==================================================================
+    @property
+    def rho_0(self) -> sp.Rational:
+
+        return self._rho_0
+    # ==================================================================
+    @property
+    def nbr_terms(self) -> int:
+        """Return the number of terms already computed."""
+
+        return len(self._terms)
+    # ==================================================================
+    def get_integral(self, rho) -> cst.EXPR_TYPE:
+        """Return the integral of :class:`IntegralAA` of parameters
+        (rho, 1/2, (m_1+m_2)^2, r), shared by the builders of the same
+        (m_1, m_2, r).
+        """
+        rho = sp.Rational(rho)
+        integral = self._integrals.get(rho)
+        if (integral is None):
+            integral = IntegralAA.solve_def_integral(None, rho,
+                                                     sp.Rational(1, 2),
+                                                     self._a, self._r)
+            self._integrals[rho] = integral
+
+        return integral
+    # ==================================================================
+    def get_term(self, k: int) -> cst.EXPR_TYPE:
+        """Return the term of order k of the series."""
+        while (len(self._terms) <= k):
+            k_ = len(self._terms)
+            term = ((sp.Rational(-1)**k_)
+                    * sp.Rational(sp.binomial(sp.Rational(1, 2), k_))
+                    * (self._e**k_) * self.get_integral(self._rho_0 - k_))
+            self._terms.append(term)
+            self._partial_sums.append(self._partial_sums[-1] + term)
+
+        return self._terms[k]
+    # ==================================================================
+    def __iter__(self) -> Iterator[cst.EXPR_TYPE]:
+        """Yield the terms of the series from order 0, computing the
+        new terms on demand.
+        """
+        k = 0
+        while (True):
+            yield self.get_term(k)
+            k += 1
+    # ==================================================================
+    def partial_sum(self, order: int) -> cst.EXPR_TYPE:
+        """Return the sum of the first order terms of the series."""
+        if (order < 0):
+
+            raise SeriesBuilderInputError("The order must be positive, "
+                                          "got {}.".format(order))
+        if (order):
+            self.get_term(order - 1)
+
+        return self._partial_sums[order]
@@ -14,8 +14,9 @@ class ConstantRealSymbol(sp.Symbol):
     def __new__(cls, value: float, *args, **kwargs):
         # Ignore the additional argument fort this child class and call
         # the parent constructor
+        kwargs['real'] = True
 
-        return super().__new__(cls, *args, **kwargs, real=True)
+        return super().__new__(cls, *args, **kwargs)
     # ==================================================================
     def __init__(self, value: float, *args, **kwargs):
         # N.B.: not constructor defined for the Function object in sympy
@@ -28,6 +29,15 @@ class ConstantRealSymbol(sp.Symbol):
     def _eval_evalf(self, prec):
 
         return sp.Float(self._value, prec)
+    # ==================================================================
+    # Pickling (the value is not part of the sympy arguments)
+    def __getnewargs_ex__(self):
+
+        return ((self._value, self.name), self.assumptions0)
+    # ==================================================================
+    def __getstate__(self):
+
+        return {'_value': self._value}
 
 
 if __name__ == '__main__':
@@ -1,4 +1,6 @@
 
 """.. moduleauthor:: Sacha Medaer"""
 
+from nupot.utils.utilities_helpers.bessel_helpers import *
+from nupot.utils.utilities_helpers.lambdify_helpers import *
 from nupot.utils.utilities_helpers.sympy_helpers import *
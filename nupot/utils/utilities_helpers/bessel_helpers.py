@@ -0,0 +1,95 @@
+
+""".. moduleauthor:: Sacha Medaer"""
+
+from functools import lru_cache
+from typing import Tuple
+
+import sympy as sp
+
+
+class BesselHelpersInputError(Exception):
+    pass
+
+
+@lru_cache(maxsize=None)
+def get_besselk_reduction(order) -> Tuple[Tuple[sp.Rational, ...],
+                                          Tuple[sp.Rational, ...]]:
+    r"""Return the coefficients of the reduction of the modified Bessel
+    function of the second kind :math:`K_{\nu}` of integer or half-integer
+    order :math:`\nu` as polynomials in :math:`1/x`.
+
+    Notes
+    -----
+    The table is built from the recurrence relation
+    :math:`K_{\nu+1}(x) = K_{\nu-1}(x) + \frac{2\nu}{x}K_{\nu}(x)` with
+    :math:`K_{-\nu} = K_{\nu}`. For an integer order, the two returned
+    tuples :math:`(p_k)` and :math:`(q_k)` are such that:
+
+    .. math::  K_n(x) = \sum_k p_k x^{-k} K_0(x) + \sum_k q_k x^{-k} K_1(x)
+
+    For a half-integer order, the second tuple is empty and:
+
+    .. math::  K_{n+\frac{1}{2}}(x) = \sum_k p_k x^{-k} K_{\frac{1}{2}}(x)
+               \quad \text{with}\quad K_{\frac{1}{2}}(x)
+               = \sqrt{\frac{\pi}{2x}} e^{-x}
+
+    """
+    order = abs(sp.Rational(order))
+    if (not (2*order).is_integer):
+
+        raise BesselHelpersInputError("The reduction of K_{} is only "
+            "available for integer and half-integer orders.".format(order))
+    if (order.is_integer):
+        # (K_{nu-1}, K_{nu}) with nu=1, basis (K_0, K_1)
+        prev_ = ((sp.Rational(1),), ())
+        crt = ((), (sp.Rational(1),))
+        nu = sp.Rational(1)
+        if (not order):
+
+            return prev_
+    else:
+        # (K_{nu-1}, K_{nu}) with nu=1/2 as K_{-1/2} = K_{1/2}
+        prev_ = ((sp.Rational(1),), ())
+        crt = ((sp.Rational(1),), ())
+        nu = sp.Rational(1, 2)
+    while (nu < order):
+        next_ = tuple(_add_poly(prev_coeffs, _shift_poly(crt_coeffs, 2*nu))
+                      for prev_coeffs, crt_coeffs in zip(prev_, crt))
+        prev_, crt = crt, next_
+        nu += 1
+
+    return crt
+
+
+def _shift_poly(coeffs, factor) -> Tuple[sp.Rational, ...]:
+    # multiply the polynomial in 1/x by factor/x
+    if (not coeffs):
+
+        return ()
+
+    return (sp.Rational(0),) + tuple(factor*coeff for coeff in coeffs)
+
+
+def _add_poly(coeffs_1, coeffs_2) -> Tuple[sp.Rational, ...]:
+    length = max(len(coeffs_1), len(coeffs_2))
+    coeffs_1 = tuple(coeffs_1) + (sp.Rational(0),)*(length-len(coeffs_1))
+    coeffs_2 = tuple(coeffs_2) + (sp.Rational(0),)*(length-len(coeffs_2))
+
+    return tuple(c_1 + c_2 for c_1, c_2 in zip(coeffs_1, coeffs_2))
+
+
+def besselk_reduced(order, x):
+    r"""Return the modified Bessel function of the second kind
+    :math:`K_{\nu}(x)` of integer or half-integer order expressed with
+    :math:`K_0(x)` and :math:`K_1(x)`, or with elementary functions for
+    half-integer orders, see :func:`get_besselk_reduction`.
+    """
+    coeffs_0, coeffs_1 = get_besselk_reduction(order)
+    poly_0 = sp.Add(*[coeff*(x**(-k)) for k, coeff in enumerate(coeffs_0)])
+    poly_1 = sp.Add(*[coeff*(x**(-k)) for k, coeff in enumerate(coeffs_1)])
+    if (sp.Rational(order).is_integer):
+
+        return (poly_0*sp.besselk(0, x)) + (poly_1*sp.besselk(1, x))
+
+    return (poly_0 * sp.sqrt(sp.pi/2) * (x**sp.Rational(-1, 2))
+            * sp.exp(-x))
@@ -0,0 +1,68 @@
+
+""".. moduleauthor:: Sacha Medaer"""
+
+from typing import Callable, Sequence
+
+import sympy as sp
+from sympy.printing.numpy import SciPyPrinter
+
+
+class NumericPrinter(SciPyPrinter):
+    r"""Printer of the nupot expressions in numpy/scipy code.
+
+    Notes
+    -----
+    :math:`K_0` and :math:`K_1` are printed as the dedicated
+    scipy.special.k0 and scipy.special.k1 instead of the generic kv, the
+    custom function :class:`KLKLFunction` as its vectorized
+    implementation :func:`klkl` and the :class:`ConstantRealSymbol` as
+    their values. With the setting tabulated, the three functions are
+    printed as their Chebyshev tables, see :func:`klkl_table`.
+
+    """
+    _default_settings = dict(SciPyPrinter._default_settings,
+                             tabulated=False)
+
+    def _print_besselk(self, expr) -> str:
+        order, arg = expr.args
+        if (order in (0, 1)):
+            if (self._settings['tabulated']):
+                func = 'nupot.functions.chebyshev_table.k{}_table'
+            else:
+                func = 'scipy.special.k{}'
+
+            return '{}({})'.format(self._module_format(func.format(order)),
+                                   self._print(arg))
+
+        return super()._print_besselk(expr)
+    # ==================================================================
+    def _print_KLKLFunction(self, expr) -> str:
+        if (self._settings['tabulated']):
+            func = 'nupot.functions.chebyshev_table.klkl_table'
+        else:
+            func = 'nupot.functions.klkl_function.klkl'
+
+        return '{}({})'.format(self._module_format(func),
+                               self._print(expr.args[0]))
+    # ==================================================================
+    def _print_ConstantRealSymbol(self, expr) -> str:
+
+        return repr(float(expr._value))
+
+
+def lambdify_numeric(args: Sequence, expr, cse: bool = True,
+                     tabulated: bool = False) -> Callable:
+    """Return the numpy-vectorized function of the arguments args
+    which computes the expression expr, see :class:`NumericPrinter`. If
+    cse is True, the common subexpressions are computed only once. If
+    tabulated is True, :math:`K_0`, :math:`K_1` and :class:`KLKLFunction`
+    are evaluated from their Chebyshev tables.
+    """
+    printer = NumericPrinter({'fully_qualified_modules': False,
+                              'inline': True,
+                              'allow_unknown_functions': True,
+                              'user_functions': {},
+                              'tabulated': tabulated})
+
+    return sp.lambdify(args, expr, modules=['scipy', 'numpy'],
+                       printer=printer, cse=cse)
@@ -1,11 +1,18 @@
+import re
+
 import setuptools
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
 
+# single source of the version, also part of the expression cache keys
+with open("nupot/__init__.py", "r") as fh:
+    version = re.search(r"^__version__ = '([^']+)'", fh.read(),
+                        re.MULTILINE).group(1)
+
 setuptools.setup(
     name="nupot",
-    version="0.1.1",
+    version=version,
     author="Sacha Medaer",
     author_email="sacha@medaer.me",
     python_requires=">=3.9.0",
@@ -17,6 +24,7 @@ setuptools.setup(
     license='???',
     packages=setuptools.find_packages(exclude=("tests",)),
     include_package_data=True,	# controls whether non-code files are copied when package is installed
+    package_data={"nupot": ["functions/data/*.npy", "physics/data/*.npy"]},
     install_requires=["scipy", "numpy", "matplotlib", "pillow", "pyfftw",
                       "typing_extensions", "sympy"],
     classifiers=[
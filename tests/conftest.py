@@ -0,0 +1,15 @@
+import pytest
+
+import mpmath
+from sympy.utilities.lambdify import implemented_function
+
+
+@pytest.fixture(scope='session')
+def klkl_mp():
+    r"""Return the mpmath reference of :class:`KLKLFunction`, to be
+    substituted for it in the expressions lambdified with mpmath.
+    """
+
+    return implemented_function(
+        'klkl_mp', lambda x: ((mpmath.besselk(0, x)*mpmath.struvel(-1, x))
+                              + (mpmath.besselk(1, x)*mpmath.struvel(0, x))))
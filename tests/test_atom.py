@@ -0,0 +1,97 @@
+import pytest
+
+import math
+import numpy as np
+import pickle
+
+from mendeleev import element
+
+from nupot.physics.atom import Atom, AtomInputError
+from nupot.physics.element_table import NBR_ELEMENTS, TABLE_DTYPE,\
+                                        ElementTableError, _load_table,\
+                                        get_table
+
+# ----------------------------------------------------------------------
+# Tests ----------------------------------------------------------------
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.physics
+def test_element_table():
+    r"""Should fail if the packaged element table does not match the
+    mendeleev database.
+    """
+    table = get_table()
+    elems = [element(Z) for Z in (1, 26, 54, 74, 118)]
+
+    # Tests
+    assert (len(table) == NBR_ELEMENTS)
+    assert (list(table['Z']) == list(range(1, NBR_ELEMENTS+1)))
+    for elem in elems:
+        row = table[elem.atomic_number-1]
+        assert (row['N'] == elem.neutrons)
+        assert (row['A'] == elem.mass_number)
+        assert (row['atomic_weight'] == elem.atomic_weight)
+        assert (row['symbol'] == elem.symbol)
+        assert (row['name'] == elem.name)
+
+
+@pytest.mark.physics
+def test_flyweight_atom():
+    r"""Should fail if the atoms of the same element are not shared, if
+    their properties do not match mendeleev or if an unknown element
+    does not raise.
+    """
+    atom = Atom('Fe')
+    elem = element('Fe')
+
+    # Tests
+    assert (Atom(26) is atom)
+    assert (Atom('iron') is atom)
+    assert (pickle.loads(pickle.dumps(atom)) is atom)
+    assert (atom.name == elem.name)
+    assert (float(atom.atomic_number.evalf()) == elem.atomic_number)
+    assert (float(atom.neutrons.evalf()) == elem.neutrons)
+    assert (atom.element.density == elem.density)
+    assert (not Atom.does_element_exist('Xx'))
+    with pytest.raises(AtomInputError):
+        Atom(0)
+
+
+@pytest.mark.physics
+def test_isotopes():
+    r"""Should fail if the natural isotopes of an element do not match
+    the mendeleev database or if their abundances are not normalized.
+    """
+    isotopes = Atom('W').isotopes
+    isotopes_theo = sorted((iso.mass_number, iso.abundance)
+                           for iso in element('W').isotopes
+                           if iso.abundance is not None)
+
+    # Tests
+    assert (list(isotopes['A']) == [iso[0] for iso in isotopes_theo])
+    assert (np.all(isotopes['N'] == (isotopes['A'] - 74)))
+    assert (np.allclose(isotopes['abundance'],
+                        np.array([iso[1] for iso in isotopes_theo])/100.0,
+                        rtol=1e-4, atol=0.0))
+    assert (math.isclose(np.sum(isotopes['abundance']), 1.0,
+                         rel_tol=1e-15))
+    assert (len(Atom('Tc').isotopes) == 1)
+
+
+@pytest.mark.physics
+def test_truncated_table(tmp_path):
+    r"""Should fail if a stored table without the rows of all the
+    elements is loaded instead of being rebuilt, or if an incomplete
+    built table is not rejected.
+    """
+    path = str(tmp_path / 'element_table.npy')
+    np.save(path, get_table()[:-1])
+    table = _load_table(path, TABLE_DTYPE, get_table, NBR_ELEMENTS)
+
+    # Tests
+    assert (len(table) == NBR_ELEMENTS)
+    assert (len(np.load(path)) == NBR_ELEMENTS)
+    with pytest.raises(ElementTableError):
+        _load_table(str(tmp_path / 'other.npy'), TABLE_DTYPE,
+                    lambda: get_table()[1:], NBR_ELEMENTS)
@@ -0,0 +1,66 @@
+import pytest
+
+import sympy as sp
+
+from nupot.expressions.bessel_basis_expr import BesselBasisExpr,\
+                                                BesselBasisExprInputError,\
+                                                BesselBasisExprOperationError
+from nupot.functions.klkl_function import KLKLFunction
+
+# ----------------------------------------------------------------------
+# Tests ----------------------------------------------------------------
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.expressions
+def test_sympy_conversion():
+    r"""Should fail if the conversion from and back to sympy does not
+    give back the initial expression.
+    """
+    a, r = sp.symbols("a r", positive=True)
+    b_arg = r*(a**sp.Rational(1, 2))
+    expr = ((2*sp.besselk(0, b_arg)) - (2*b_arg*sp.besselk(1, b_arg))
+            - (sp.pi*a*(r**2)*KLKLFunction(b_arg)) + (sp.pi*b_arg))
+    res = BesselBasisExpr.from_sympy(expr, (a, r))
+
+    # Tests
+    assert (len(res.basis_functions()) == 4)
+    assert (res.terms[sp.S.One] == {(sp.Rational(1, 2), 1): sp.pi})
+    assert (sp.expand(res.to_sympy() - expr) == 0)
+
+
+@pytest.mark.expressions
+def test_operations():
+    r"""Should fail if the addition, scaling and multiplication do not
+    match the ones of the corresponding sympy expressions.
+    """
+    a, r = sp.symbols("a r", positive=True)
+    b_arg = r*(a**sp.Rational(1, 2))
+    expr_1 = (r*sp.besselk(0, b_arg)) + (a*KLKLFunction(b_arg)) + 1
+    expr_2 = (r*sp.besselk(0, b_arg)) - (a**sp.Rational(-1, 2))
+    basis_1 = BesselBasisExpr.from_sympy(expr_1, (a, r))
+    basis_2 = BesselBasisExpr.from_sympy(expr_2, (a, r))
+    poly = BesselBasisExpr.from_sympy(r - (3*a), (a, r))
+
+    # Tests
+    assert (sp.expand((basis_1 + basis_2).to_sympy() - expr_1 - expr_2) == 0)
+    assert (sp.expand((basis_1 - basis_2).to_sympy() - expr_1 + expr_2) == 0)
+    assert (not (basis_1 - basis_1))
+    assert (sp.expand(basis_1.scale(sp.Rational(2, 3), (1, -2)).to_sympy()
+                      - (sp.Rational(2, 3)*a*expr_1/(r**2))) == 0)
+    assert (sp.expand((basis_1*poly).to_sympy() - (expr_1*(r-(3*a)))) == 0)
+    assert (sp.expand((basis_1*r).to_sympy() - (expr_1*r)) == 0)
+    with pytest.raises(BesselBasisExprOperationError):
+        basis_1 * basis_2
+
+
+@pytest.mark.expressions
+def test_wrong_input():
+    r"""Should fail if an expression which is not a linear combination
+    of basis functions with Laurent polynomial coefficients is accepted.
+    """
+    a, r, m = sp.symbols("a r m", positive=True)
+
+    # Tests
+    with pytest.raises(BesselBasisExprInputError):
+        BesselBasisExpr.from_sympy(m*sp.besselk(0, r), (a, r))
@@ -0,0 +1,49 @@
+import pytest
+
+import mpmath
+import sympy as sp
+
+import nupot.utils.utilities as util
+from nupot.utils.utilities_helpers.bessel_helpers import\
+    BesselHelpersInputError
+
+# ----------------------------------------------------------------------
+# Tests ----------------------------------------------------------------
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.functions
+@pytest.mark.parametrize("order",
+    [0, 1, 2, 3, -4, 7, sp.Rational(1, 2), sp.Rational(3, 2),
+     sp.Rational(-5, 2), sp.Rational(11, 2)
+    ])
+def test_besselk_reduced(order):
+    r"""Should fail if the reduced Bessel function does not correspond
+    to the modified Bessel function of the second kind.
+    """
+    x = sp.Symbol('x', positive=True)
+    res = util.besselk_reduced(order, x)
+    x_num = [0.05, 0.7, 3.0, 25.0]
+
+    # Tests
+    assert (not any(bessel.args[0] not in (0, 1)
+                    for bessel in res.atoms(sp.besselk)))
+    for x_ in x_num:
+        res_num = sp.N(res.subs(x, x_), 30)
+        res_theo = mpmath.besselk(mpmath.mpf(order), x_)
+        assert (abs(res_num/res_theo - 1) < 1e-12)
+
+
+@pytest.mark.functions
+def test_besselk_reduction_coeffs():
+    r"""Should fail if the coefficients of the reduction are not the
+    exact ones or if a non half-integer order is accepted.
+    """
+    coeffs = util.get_besselk_reduction(3)
+
+    # Tests
+    assert (coeffs == ((0, 4), (1, 0, 8)))
+    assert (all(isinstance(coeff, sp.Rational) for coeff in coeffs[1]))
+    assert (util.get_besselk_reduction(sp.Rational(5, 2)) == ((1, 3, 3), ()))
+    with pytest.raises(BesselHelpersInputError):
+        util.get_besselk_reduction(sp.Rational(1, 3))
@@ -0,0 +1,74 @@
+import pytest
+
+import math
+import numpy as np
+import sympy as sp
+from scipy.special import k0, k1
+
+import nupot.functions.chebyshev_table as chebyshev_table
+import nupot.utils.utilities as util
+from nupot.functions.chebyshev_table import k0_table, k1_table, klkl_table
+from nupot.functions.klkl_function import KLKLFunction, klkl
+
+# ----------------------------------------------------------------------
+# Tests ----------------------------------------------------------------
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.functions
+def test_max_rel_error():
+    r"""Should fail if the tabulated functions do not match their direct
+    evaluation within the documented maximum relative error in the range
+    of the table or if they do not fall back to it outside.
+    """
+    rng = np.random.default_rng(0)
+    x = np.exp(rng.uniform(chebyshev_table.U_MIN, math.log(700.0), 20000))
+    tol = chebyshev_table.MAX_REL_ERROR + (2.2e-16*x)
+    x_out = np.array([0.0, 1e-8, 2000.0, np.inf])
+
+    # Tests
+    assert (np.all(np.abs((k0_table(x)/k0(x)) - 1) < tol))
+    assert (np.all(np.abs((k1_table(x)/k1(x)) - 1) < tol))
+    assert (np.all(np.abs((klkl_table(x)/klkl(x)) - 1)
+                   < chebyshev_table.MAX_REL_ERROR))
+    assert (np.array_equal(klkl_table(x_out), klkl(x_out)))
+    assert (np.array_equal(k0_table(x_out), k0(x_out)))
+    assert (klkl_table(2.5).shape == ())
+
+
+@pytest.mark.functions
+def test_stored_table(tmp_path, monkeypatch):
+    r"""Should fail if the table is not built and saved at the first use
+    or if the saved table is not loaded back.
+    """
+    path = str(tmp_path / 'data' / 'table.npy')
+    monkeypatch.setattr(chebyshev_table, 'TABLE_PATH', path)
+    chebyshev_table.get_table.cache_clear()
+    try:
+        table = chebyshev_table.get_table()
+        chebyshev_table.get_table.cache_clear()
+        table_loaded = chebyshev_table.get_table()
+    finally:
+        chebyshev_table.get_table.cache_clear()
+
+    # Tests
+    assert (table.shape == (3, chebyshev_table.DEGREE+1,
+                            chebyshev_table.NBR_PIECES))
+    assert (np.array_equal(np.load(path), table))
+    assert (np.array_equal(table_loaded, table))
+
+
+@pytest.mark.functions
+def test_tabulated_lambdify():
+    r"""Should fail if the expressions compiled with the tabulated
+    functions do not match the ones compiled with the direct evaluation.
+    """
+    x = sp.Symbol('x', positive=True)
+    expr = sp.besselk(0, x) + (x*sp.besselk(1, x)) + KLKLFunction(2*x)
+    func = util.lambdify_numeric((x,), expr)
+    func_tab = util.lambdify_numeric((x,), expr, tabulated=True)
+    x_num = np.linspace(0.01, 30.0, 50)
+
+    # Tests
+    assert (np.allclose(func_tab(x_num), func(x_num), rtol=1e-13,
+                        atol=0.0))
@@ -1,6 +1,9 @@
 import pytest
 
 import math
+import mpmath
+from itertools import combinations_with_replacement
+
 import numpy as np
 import sympy as sp
 from scipy.integrate import quad, dblquad
@@ -8,8 +11,12 @@ from scipy.special import kn
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
+from nupot.functions.klkl_function import KLKLFunction
+from nupot.matrices.global_weak_charge import GlobalWeakCharge
 from nupot.physics.atom import Atom
+from nupot.physics.nu import Nu
 from nupot.potentials.dirac_nu_pair_potential import DiracNuPairPotential
+from nupot.symbols.constant_real_symbol import ConstantRealSymbol
 
 # ----------------------------------------------------------------------
 # Tests ----------------------------------------------------------------
@@ -91,3 +98,206 @@ def test_eval_potential_2(m_1_num, m_2_num, r_1_num):
 
     # Tests
     assert (math.isclose(res_num, res_int, rel_tol=1e-0))
+
+
+@pytest.mark.integral
+def test_numeric_potential():
+    r"""Should fail if the compiled numeric potential does not
+    correspond to the evaluation of the symbolic potential.
+    """
+    m_1, m_2, m_3, r = sp.symbols('m_1 m_2 m_3 r', positive=True)
+    pot = DiracNuPairPotential(Atom('Fe'), Atom('Cu'), m_1, m_2, m_3, r)
+    res = pot.doit()
+    func = pot.to_numeric()
+    r_num = np.array([0.5, 1.0, 2.0])
+    masses = (0.1, 0.05, 0.02)
+    res_num = func(r_num, *masses)
+    res_theo = [complex(res.evalf(subs={m_1: masses[0], m_2: masses[1],
+                                        m_3: masses[2], r: r_}))
+                for r_ in r_num]
+
+    # Tests
+    assert (res_num.shape == r_num.shape)
+    assert (np.allclose(res_num, res_theo, rtol=1e-10, atol=0.0))
+    assert (np.allclose(func(r_num[:, None], *masses), res_num[:, None],
+                        rtol=1e-12, atol=0.0))
+
+
+@pytest.mark.integral
+def test_scaled_potential(klkl_mp):
+    r"""Should fail if the exponentially scaled evaluation does not
+    match the numeric potential at moderate radius or the high precision
+    evaluation of the symbolic potential at large radius.
+    """
+    m_1, m_2, m_3, r = sp.symbols('m_1 m_2 m_3 r', positive=True)
+    pot = DiracNuPairPotential(Atom('Fe'), Atom('Cu'), m_1, m_2, m_3, r)
+    masses = (0.1, 0.2, 0.35)
+    r_num = np.array([0.5, 2.0, 10.0])
+    mantissa, log_scale = pot.evaluate_scaled(r_num, *masses)
+    res_num = pot.evaluate(r_num, *masses)
+    r_large = 150.0
+    mantissa_large, log_scale_large = pot.evaluate_scaled(r_large, *masses)
+    expr = pot.doit().replace(KLKLFunction, klkl_mp)
+    expr = expr.xreplace({symbol: sp.Float(symbol._value, 60) for symbol
+                          in expr.atoms(ConstantRealSymbol)})
+    func = sp.lambdify((r, m_1, m_2, m_3), expr, modules='mpmath')
+    with mpmath.workdps(60):
+        res_theo = func(mpmath.mpf(r_large),
+                        *[mpmath.mpf(str(mass)) for mass in masses])
+        log_theo = float(mpmath.log(abs(res_theo)))
+
+    # Tests
+    assert (mantissa.shape == r_num.shape)
+    assert (np.allclose(mantissa*np.exp(-log_scale), res_num, rtol=1e-12,
+                        atol=0.0))
+    assert (np.sign(mantissa_large) == np.sign(float(mpmath.re(res_theo))))
+    assert (math.isclose(np.log(np.abs(mantissa_large)) - log_scale_large,
+                         log_theo, rel_tol=1e-12))
+
+
+@pytest.mark.integral
+def test_parallel_potential():
+    r"""Should fail if the potential derived in a process pool differs
+    from the serial one.
+    """
+    m_1, m_2, m_3, r = sp.symbols('m_1 m_2 m_3 r', positive=True)
+    pot = DiracNuPairPotential(Atom('Fe'), Atom('Cu'), m_1, m_2, m_3, r,
+                               orders=[2, 2, 2])
+    res_parallel = pot.doit(parallel=True, max_workers=2)
+    res_serial = pot.doit()
+
+    # Tests
+    assert (res_parallel == res_serial)
+
+
+@pytest.mark.integral
+def test_kinematic_kernel():
+    r"""Should fail if the kinematic kernel is not shared between atom
+    pairs or if its contraction with the weak charges does not
+    correspond to the compiled potential.
+    """
+    m_1, m_2, m_3, r = sp.symbols('m_1 m_2 m_3 r', positive=True)
+    pot_1 = DiracNuPairPotential(Atom('Fe'), Atom('Cu'), m_1, m_2, m_3, r)
+    pot_2 = DiracNuPairPotential(Atom('H'), Atom('Pb'), m_1, m_2, m_3, r)
+    r_num = np.array([0.5, 1.0, 2.0])
+    masses = (0.1, 0.05, 0.02)
+
+    # Tests
+    assert (pot_1.get_pair_terms((m_1, m_2, m_3), r)
+            is pot_2.get_pair_terms((m_1, m_2, m_3), r))
+    assert (pot_1.get_numeric_pair_terms() is pot_2.get_numeric_pair_terms())
+    assert (pot_1.evaluate_pair_terms(r_num, *masses).shape == (6, 3))
+    assert (not np.allclose(pot_1.evaluate(r_num, *masses),
+                            pot_2.evaluate(r_num, *masses)))
+    for pot in (pot_1, pot_2):
+        assert (np.allclose(pot.evaluate(r_num, *masses),
+                            pot.to_numeric()(r_num, *masses), rtol=1e-12,
+                            atol=0.0))
+
+
+@pytest.mark.integral
+def test_real_charge_products():
+    r"""Should fail if the numeric evaluation drops a non-zero imaginary
+    part of the products of weak charges of the symbolic potential, i.e.
+    if it does not correspond to the compiled potential for a non-zero
+    CP phase.
+    """
+    m_1, m_2, m_3, r = sp.symbols('m_1 m_2 m_3 r', positive=True)
+    atom_A, atom_B = Atom('Xe'), Atom('W')
+    pot = DiracNuPairPotential(atom_A, atom_B, m_1, m_2, m_3, r)
+    r_num = np.array([0.5, 1.0, 2.0])
+    masses = (0.1, 0.05, 0.02)
+    res_num = pot.evaluate(r_num, *masses)
+    res_theo = pot.to_numeric()(r_num, *masses)
+    Q_A = GlobalWeakCharge(atom_A.atomic_number, atom_A.neutrons)
+    Q_B = GlobalWeakCharge(atom_B.atomic_number, atom_B.neutrons)
+    products_theo = [complex((Q_A[i, j]*sp.conjugate(Q_B[i, j])).evalf(30))
+                     for i, j in combinations_with_replacement([0, 1, 2], 2)]
+    products = pot.get_charge_products()
+
+    # Tests
+    assert (math.sin(float(Nu.delta_cp.evalf())) != 0.0)
+    assert (np.isrealobj(res_num) and np.isrealobj(products))
+    assert (np.allclose(products, products_theo, rtol=1e-12, atol=0.0))
+    assert (np.allclose(res_num, res_theo, rtol=1e-12, atol=0.0))
+
+
+@pytest.mark.integral
+def test_adaptive_orders():
+    r"""Should fail if the adaptive orders do not reach the requested
+    tolerance or do not stop early for nearly degenerate masses.
+    """
+    m_1, m_2, m_3, r = sp.symbols('m_1 m_2 m_3 r', positive=True)
+    r_num = np.array([0.5, 1.0, 2.0, 4.0])
+    masses = (0.1, 0.0995, 0.05)
+    samples = {r: r_num, m_1: masses[0], m_2: masses[1], m_3: masses[2]}
+    pot = DiracNuPairPotential(Atom('Fe'), Atom('Cu'), m_1, m_2, m_3, r)
+    orders = pot.set_adaptive_orders(samples, rtol=1e-8)
+    pot_ref = DiracNuPairPotential(Atom('Fe'), Atom('Cu'), m_1, m_2, m_3, r,
+                                   orders=[8, 8, 8])
+
+    # Tests
+    assert (orders[(0, 0)] is None)
+    assert (max(orders[(0, 1)]) <= 2)
+    assert (pot.orders == orders)
+    assert (np.allclose(pot.evaluate(r_num, *masses),
+                        pot_ref.evaluate(r_num, *masses), rtol=1e-8,
+                        atol=0.0))
+
+
+@pytest.mark.integral
+def test_factorize():
+    r"""Should fail if the factorization does not sum up to the
+    expression, if a factor appears twice, if a factor with an
+    argument other than r(m_i+m_j) or a power of a factor is not
+    detected or if the deprecated signature is not supported.
+    """
+    m_1, m_2, m_3, r = sp.symbols('m_1 m_2 m_3 r', positive=True)
+    expr = DiracNuPairPotential(Atom('Fe'), Atom('Cu'), m_1, m_2, m_3, r,
+                                orders=[1, 1, 1]).doit()
+    other = sp.besselk(0, 3*m_1*r)
+    expr += ((r**2) * other + m_2 * r * other + cst.G_F
+             + m_3 * (other**2))
+    res = DiracNuPairPotential.factorize(expr, r)
+    factors = [fact[1] for fact in res]
+    with pytest.warns(DeprecationWarning):
+        res_deprecated = DiracNuPairPotential.factorize(expr, m_1, m_2, m_3,
+                                                        r)
+
+    # Tests
+    assert (sp.expand(sp.Add(*[c*f for c, f in res]) - expr) == 0)
+    assert (len(set(factors)) == len(factors))
+    assert (res[factors.index(other)][0] == (r**2) + (m_2*r))
+    assert (res[factors.index(other**2)][0] == m_3)
+    assert (factors[-1] == 1)
+    assert (res_deprecated == res)
+
+
+@pytest.mark.integral
+def test_cumulative_integral():
+    r"""Should fail if the cumulative integrals over the radial grid do
+    not correspond to numerical integration of the potential or to the
+    symbolic definite integral.
+    """
+    m_1, m_2, m_3, r, a = sp.symbols('m_1 m_2 m_3 r a', positive=True)
+    masses = (0.3, 0.2, 0.1)
+    pot = DiracNuPairPotential(Atom('Fe'), Atom('Cu'), m_1, m_2, m_3, r,
+                               orders=[2, 2, 2])
+    expr = pot.doit()
+    r_grid = np.linspace(0.5, 4.0, 200)
+    func = DiracNuPairPotential.cumulative_integral_over_r(expr, m_1, m_2,
+                                                           m_3, r, r_grid)
+    res = func(*masses)
+    potential = pot.to_numeric()
+    res_int = [quad(potential, r_grid[0], r_grid[k], args=masses,
+                    epsabs=0.0, epsrel=1e-12)[0] for k in (1, 50, 199)]
+    res_sym = DiracNuPairPotential.integrate_over_r(expr, m_1, m_2, m_3, r,
+                                                    a, r_grid[-1])
+    res_sym = res_sym.subs(dict(zip((m_1, m_2, m_3, a),
+                                    masses + (r_grid[0],)))).evalf()
+
+    # Tests
+    assert (res.shape == r_grid.shape)
+    assert (res[0] == 0.0)
+    assert (np.allclose(res[[1, 50, 199]], res_int, rtol=1e-10, atol=0.0))
+    assert (math.isclose(res_sym, res[-1], rel_tol=1e-10))
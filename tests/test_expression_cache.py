@@ -0,0 +1,113 @@
+import pytest
+
+import os
+import sympy as sp
+
+import nupot.utils.constants as cst
+from nupot.cache.expression_cache import ExpressionCache,\
+                                         ExpressionCacheInputError
+from nupot.cache.lru_dict import LRUDict, LRUDictInputError
+from nupot.physics.atom import Atom
+from nupot.potentials.nu_pair_potential import NuPairPotential
+from nupot.potentials.dirac_nu_pair_potential import DiracNuPairPotential
+
+# ----------------------------------------------------------------------
+# Tests ----------------------------------------------------------------
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.cache
+def test_store_and_load(tmp_path):
+    r"""Should fail if a stored expression is not loaded back identical
+    or if the key does not depend on the symbol assumptions.
+    """
+    m, r = sp.symbols('m r', positive=True)
+    m_real = sp.Symbol('m', real=True)
+    expr = (cst.G_F**2) * sp.besselk(1, 2*m*r) / r
+    cache = ExpressionCache(str(tmp_path))
+    key = ExpressionCache.make_key('test', [1, 2], m, r)
+    cache.set(key, expr)
+    res = cache.get(key)
+
+    # Tests
+    assert (key in cache)
+    assert (res == expr)
+    assert (sp.N(res.subs({m: 0.1, r: 1.0})).is_Float)
+    assert (ExpressionCache.make_key('test', [1, 2], m_real, r) != key)
+    assert (cache.get(ExpressionCache.make_key('other')) is None)
+    with pytest.raises(ExpressionCacheInputError):
+        ExpressionCache(str(tmp_path), 0)
+
+
+@pytest.mark.cache
+def test_lru_eviction(tmp_path):
+    r"""Should fail if the least recently used entries are not removed
+    when the maximum size is exceeded.
+    """
+    x = sp.Symbol('x')
+    cache = ExpressionCache(str(tmp_path))
+    cache.set('a', sp.Add(*[x**i for i in range(50)]))
+    entry_size = cache.size()
+    cache = ExpressionCache(str(tmp_path), max_size=int(2.5*entry_size))
+    os.utime(cache._get_path('a'), (0, 0))
+    cache.set('b', sp.Add(*[x**i for i in range(50, 100)]))
+    os.utime(cache._get_path('b'), (1, 1))
+    cache.get('a')      # 'a' becomes the most recently used
+    cache.set('c', sp.Add(*[x**i for i in range(100, 150)]))
+
+    # Tests
+    assert ('a' in cache)
+    assert ('b' not in cache)
+    assert ('c' in cache)
+    assert (cache.size() <= cache.max_size)
+
+
+@pytest.mark.cache
+def test_potential_cache(tmp_path):
+    r"""Should fail if the potential loaded from the cache differs from
+    the derived one.
+    """
+    m_1, m_2, m_3, r = sp.symbols('m_1 m_2 m_3 r', positive=True)
+    atom_A = Atom('Fe')
+    atom_B = Atom('Cu')
+    NuPairPotential.kernel_cache_clear()
+    NuPairPotential.expression_cache = ExpressionCache(str(tmp_path))
+    try:
+        res_1 = DiracNuPairPotential(atom_A, atom_B, m_1, m_2, m_3, r).doit()
+        nbr_entries = len(os.listdir(str(tmp_path)))
+        res_2 = DiracNuPairPotential(atom_A, atom_B, m_1, m_2, m_3, r).doit()
+        DiracNuPairPotential(atom_A, atom_B, m_1, m_2, m_3, r,
+                             orders=[2, 1, 1]).doit()
+    finally:
+        NuPairPotential.expression_cache = None
+        NuPairPotential.kernel_cache_clear()
+    res_3 = DiracNuPairPotential(atom_A, atom_B, m_1, m_2, m_3, r).doit()
+
+    # Tests
+    assert (nbr_entries == 1)
+    assert (len(os.listdir(str(tmp_path))) == 2)
+    assert (res_1 == res_2)
+    assert (sp.expand(res_1 - res_3) == 0)
+
+
+@pytest.mark.cache
+def test_lru_dict():
+    r"""Should fail if the in-memory cache keeps more than its maximum
+    number of entries or does not remove the least recently used one.
+    """
+    cache = LRUDict(3)
+    for i in range(3):
+        cache[i] = str(i)
+    cache.get(0)
+    cache[3] = '3'
+    keys_1 = list(cache)
+    cache[2]
+    cache[4] = '4'
+    keys_2 = list(cache)
+
+    # Tests
+    assert (keys_1 == [2, 0, 3])
+    assert (keys_2 == [3, 2, 4])
+    assert (len(cache) == cache.maxsize)
+    with pytest.raises(LRUDictInputError):
+        LRUDict(0)
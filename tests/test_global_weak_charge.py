@@ -0,0 +1,99 @@
+import pytest
+
+from itertools import combinations_with_replacement
+
+import numpy as np
+import sympy as sp
+
+from nupot.matrices.global_weak_charge import GlobalWeakCharge
+from nupot.physics.atom import Atom
+from nupot.physics.nu import Nu
+
+# ----------------------------------------------------------------------
+# Tests ----------------------------------------------------------------
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.matrices
+def test_numeric_weak_charge():
+    r"""Should fail if the numeric weak charge tensor differs from the
+    evaluation of the symbolic matrices.
+    """
+    atoms = [Atom('H'), Atom('Fe'), Atom('Cu'), Atom('Pb')]
+    res = GlobalWeakCharge.evaluate_atoms(atoms)
+    res_theo = [np.array(GlobalWeakCharge(atom.atomic_number,
+                                          atom.neutrons).evalf(),
+                         dtype=complex)
+                for atom in atoms]
+
+    # Tests
+    assert (res.shape == (len(atoms), 3, 3))
+    assert (np.allclose(res, res_theo, rtol=1e-14, atol=0.0))
+    assert (GlobalWeakCharge.evaluate(26.0, 30.0).shape == (3, 3))
+
+
+@pytest.mark.matrices
+def test_numeric_pmns():
+    r"""Should fail if the numeric PMNS matrix differs from the
+    evaluation of the symbolic one or if it is not unitary.
+    """
+    pmns = Nu.PMNSMatrix_numeric
+    pmns_theo = np.array(Nu.PMNSMatrix.evalf(), dtype=complex)
+
+    # Tests
+    assert (np.allclose(pmns, pmns_theo, rtol=0.0, atol=1e-15))
+    assert (np.allclose(pmns @ np.conj(pmns.T), np.eye(3), rtol=0.0,
+                        atol=1e-15))
+
+
+@pytest.mark.matrices
+def test_pair_products():
+    r"""Should fail if the pair products differ from the products of the
+    symbolic elements or if the chunked products differ from the full
+    ones.
+    """
+    Z_A, N_A = np.array([1.0, 26.0, 82.0]), np.array([0.0, 30.0, 125.0])
+    Z_B, N_B = np.array([29.0, 8.0]), np.array([35.0, 8.0])
+    Q_A = GlobalWeakCharge.evaluate(Z_A, N_A)
+    Q_B = GlobalWeakCharge.evaluate(Z_B, N_B)
+    res = GlobalWeakCharge.pair_products(Q_A, Q_B)
+    Q_sym_A = GlobalWeakCharge(sp.Float(Z_A[1]), sp.Float(N_A[1]))
+    Q_sym_B = GlobalWeakCharge(sp.Float(Z_B[0]), sp.Float(N_B[0]))
+    res_theo = [complex((Q_sym_A[i, j]*sp.conjugate(Q_sym_B[i, j])).evalf())
+                for i, j in combinations_with_replacement([0, 1, 2], 2)]
+    res_chunks = np.concatenate([products for _, products
+                                 in GlobalWeakCharge.iter_pair_products(
+                                     Q_A, Q_B, max_bytes=200)])
+
+    # Tests
+    assert (res.shape == (3, 2, 6))
+    assert (np.allclose(res[1, 0], res_theo, rtol=1e-14, atol=0.0))
+    assert (np.array_equal(res_chunks, res))
+
+
+@pytest.mark.matrices
+def test_natural_weak_charge():
+    r"""Should fail if the natural weak charges are not the abundance
+    weighted means over the isotopes or if the pair products of the
+    means differ from the abundance weighted pair products.
+    """
+    atoms = [Atom('Xe'), Atom('Ge'), Atom('W'), Atom('Tc')]
+    res = GlobalWeakCharge.evaluate_natural(atoms)
+    Q, abundances, indices = GlobalWeakCharge.evaluate_isotopes(atoms)
+    res_theo = [np.sum(abundances[indices == k, None, None]
+                       * Q[indices == k], axis=0)
+                for k in range(len(atoms))]
+    rows, cols = np.triu_indices(3)
+    is_A, is_B = (indices == 0), (indices == 2)
+    products = np.einsum('a,b,ak,bk->k', abundances[is_A],
+                         abundances[is_B], Q[is_A][:, rows, cols],
+                         np.conj(Q[is_B][:, rows, cols]))
+
+    # Tests
+    assert (res.shape == (len(atoms), 3, 3))
+    assert (np.sum(indices == 0) == 9)
+    assert (np.allclose(res, res_theo, rtol=1e-14, atol=0.0))
+    assert (np.allclose(GlobalWeakCharge.pair_products(res, res)[0, 2],
+                        products, rtol=1e-14, atol=0.0))
+    assert (np.array_equal(res[3], GlobalWeakCharge.evaluate_atoms(
+        [Atom('Tc')])[0]))
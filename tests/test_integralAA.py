@@ -6,7 +6,10 @@ import sympy as sp
 from scipy.integrate import quad
 
 from nupot.functions.klkl_function import KLKLFunction
-from nupot.integrals.integralAA import FunctionAA, IntegralAA
+from nupot.integrals.integralAA import FunctionAA, IntegralAA,\
+                                       IntegralAAInputError
+from nupot.integrals.quadratureAA import QuadratureAA,\
+                                        QuadratureAAInputError
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
 
@@ -188,3 +191,135 @@ def test_eval_integralAA_1(rho, mu):
 
     # Tests
     assert (math.isclose(res_num, res_int, rel_tol=1e-4))
+
+
+@pytest.mark.integral
+def test_cache_integralAA():
+    r"""Should fail if the memoized solution of the definite integral
+    does not match the non-memoized one or if the statistics of the
+    memoization table are not updated.
+    """
+    a, r, x = sp.symbols("a r dummyx")
+    rho = sp.Rational(-5, 2)
+    mu = sp.Rational(1, 2)
+    IntegralAA.cache_clear()
+    res_1 = IntegralAA((rho, mu, a, r), (x, a, np.inf)).doit()
+    info_1 = IntegralAA.cache_info()
+    res_2 = IntegralAA((rho, mu, a, r), (x, a, np.inf)).doit()
+    info_2 = IntegralAA.cache_info()
+    res_theo = IntegralAA._solve_def_integral(x, rho, mu, IntegralAA.a_cache,
+                                              IntegralAA.r_cache).to_sympy()
+    res_theo = res_theo.subs({IntegralAA.a_cache: a, IntegralAA.r_cache: r})
+    IntegralAA.cache_clear()
+
+    # Tests
+    assert (info_1.misses > 1)
+    assert (info_2.misses == info_1.misses)
+    assert (info_2.hits == info_1.hits + 1)
+    assert (IntegralAA.cache_info().currsize == 0)
+    assert (res_1 == res_2)
+    assert (res_1.equals(res_theo))
+
+
+@pytest.mark.integral
+@pytest.mark.parametrize("rho, mu",
+    [(sp.Rational(1, 2), sp.Rational(1, 2)),
+     (sp.Rational(-3, 2), sp.Rational(1, 2)),
+     (sp.Rational(-7, 2), sp.Rational(1, 2)),
+     (sp.Rational(-1), sp.Rational(-3, 2)),
+    ])
+def test_evaluate_integralAA(rho, mu):
+    r"""Should fail if the vectorized numeric evaluation does not
+    correspond to the evaluation of the symbolic solution.
+    """
+    a_num = np.array([0.01, 0.04, 0.25, 1.0])
+    r_num = np.array([0.5, 1.0, 1.5, 3.0])
+    a, r = sp.symbols("a r")
+    res = IntegralAA((rho, mu, a, r), (r, a, np.inf)).doit()
+    res_num = IntegralAA.evaluate(rho, mu, a_num, r_num)
+    res_theo = [float(res.subs({a: a_, r: r_}).evalf())
+                for a_, r_ in zip(a_num, r_num)]
+
+    # Tests
+    assert (res_num.shape == a_num.shape)
+    assert (np.allclose(res_num, res_theo, rtol=1e-10))
+    assert (np.allclose(IntegralAA.evaluate(rho, mu, a_num[:, None], r_num),
+                        IntegralAA.evaluate(rho, mu, a_num[:, None]
+                                            *np.ones((1, 4)), r_num)))
+
+
+@pytest.mark.integral
+@pytest.mark.parametrize("rho, mu",
+    [(sp.Rational(1, 2), sp.Rational(1, 2)),
+     (sp.Rational(-3, 2), sp.Rational(1, 2)),
+     (sp.Rational(-1), sp.Rational(-1, 2)),
+     (sp.Rational(0), sp.Rational(0)),
+     (sp.Rational(1), sp.Rational(-1, 2)),
+     (sp.Rational(-9, 2), sp.Rational(1, 2)),
+    ])
+def test_quadrature_integralAA(rho, mu):
+    r"""Should fail if the numeric quadrature does not correspond to
+    the closed form of the integral.
+    """
+    a_num = np.array([0.01, 0.04, 0.25, 1.0])
+    r_num = np.array([0.5, 1.0, 1.5, 3.0])
+    res_num = QuadratureAA.evaluate(rho, mu, a_num, r_num)
+    res_theo = IntegralAA.evaluate(rho, mu, a_num, r_num)
+    res_scaled = QuadratureAA.evaluate(rho, mu, a_num, r_num, scaled=True)
+
+    # Tests
+    assert (np.allclose(res_num, res_theo, rtol=1e-10))
+    assert (np.allclose(res_scaled*np.exp(-r_num*np.sqrt(a_num)), res_theo,
+                        rtol=1e-10))
+
+
+@pytest.mark.integral
+def test_quadrature_arbitrary_integralAA():
+    r"""Should fail if the integral with (rho, mu) which are not integer
+    or half-integer is not computed numerically or does not correspond
+    to the scipy quadrature.
+    """
+    rho, mu = 0.3, -0.25
+    a_num = np.array([0.01, 0.25, 1.0])
+    r_num = np.array([0.5, 1.5, 3.0])
+    res_num = IntegralAA.evaluate(rho, mu, a_num, r_num)
+    res_theo = [quad(lambda x: (x**rho)*((x-a_)**mu)*np.exp(-r_*np.sqrt(x)),
+                     a_, np.inf, limit=200)[0]
+                for a_, r_ in zip(a_num, r_num)]
+
+    # Tests
+    assert (not IntegralAA.has_closed_form(rho, mu))
+    assert (np.allclose(res_num, res_theo, rtol=1e-8))
+    with pytest.raises(IntegralAAInputError):
+        IntegralAA.get_template(rho, mu)
+    with pytest.raises(QuadratureAAInputError):
+        QuadratureAA.evaluate(rho, -1, a_num, r_num)
+
+
+@pytest.mark.integral
+@pytest.mark.parametrize("rho, mu",
+    [(sp.Rational(-1), sp.Rational(1)),
+     (sp.Rational(-1), sp.Rational(0)),
+     (sp.Rational(-2), sp.Rational(1)),
+     (sp.Rational(-1), sp.Rational(3, 2)),
+    ])
+def test_quadrature_no_closed_form_integralAA(rho, mu):
+    r"""Should fail if the integral with integer or half-integer (rho,
+    mu) for which the recursion of the closed form divides by zero is
+    not computed numerically or does not correspond to the scipy
+    quadrature.
+    """
+    a_num = np.array([0.01, 0.25, 1.0])
+    r_num = np.array([0.5, 1.5, 3.0])
+    res_num = IntegralAA.evaluate(rho, mu, a_num, r_num)
+    res_theo = [quad(lambda x: (x**float(rho))*((x-a_)**float(mu))
+                     *np.exp(-r_*np.sqrt(x)), a_, np.inf, limit=200)[0]
+                for a_, r_ in zip(a_num, r_num)]
+    a, r = sp.symbols("a r")
+
+    # Tests
+    assert (not IntegralAA.has_closed_form(rho, mu))
+    assert (np.all(np.isfinite(res_num)))
+    assert (np.allclose(res_num, res_theo, rtol=1e-8))
+    with pytest.raises(IntegralAAInputError):
+        IntegralAA((rho, mu, a, r), (r, a, np.inf)).doit()
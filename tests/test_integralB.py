@@ -0,0 +1,94 @@
+import pytest
+
+import mpmath
+import numpy as np
+import sympy as sp
+from scipy.integrate import quad
+
+import nupot.utils.utilities as util
+from nupot.functions.klkl_function import KLKLFunction
+from nupot.integrals.integralBA import FunctionBA, IntegralBA
+from nupot.integrals.integralBB import FunctionBB, IntegralBB
+from nupot.integrals.integralBC import FunctionBC, IntegralBC
+from nupot.integrals.integralBD import FunctionBD, IntegralBD
+from nupot.integrals.integralBE import FunctionBE, IntegralBE
+from nupot.integrals.integralBF import FunctionBF, IntegralBF
+from nupot.integrals.integralBG import FunctionBG, IntegralBG
+
+# ----------------------------------------------------------------------
+# Tests ----------------------------------------------------------------
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.integral
+@pytest.mark.parametrize("integral, function",
+    [(IntegralBB, FunctionBB), (IntegralBC, FunctionBC),
+     (IntegralBE, FunctionBE), (IntegralBF, FunctionBF)
+    ])
+def test_closed_form_integralB(integral, function, klkl_mp):
+    r"""Should fail if the derivative of the closed form of high order
+    built from the unrolled recurrence is not the integrand.
+    """
+    a, r = sp.symbols("a r", positive=True)
+    n = 8
+    # only the closed forms of IntegralBF contain KLKL, the series of
+    # IntegralBE is sized for the largest a*r below
+    expr = integral((n, a), (r,)).doit(x_max=3.0)
+    expr = expr.replace(KLKLFunction, klkl_mp)
+    func = sp.lambdify((r, a), expr, modules='mpmath')
+    integrand = sp.lambdify((r, a), function(r, n, a).doit(),
+                            modules='mpmath')
+    errors = []
+    with mpmath.workdps(50):
+        a_num = mpmath.mpf('0.7')
+        for r_num in ('0.6', '1.3', '4.0'):
+            r_num = mpmath.mpf(r_num)
+            res = mpmath.diff(lambda x: func(x, a_num), r_num)
+            errors.append(float(abs((res/integrand(r_num, a_num)) - 1)))
+
+    # Tests
+    assert (len(integral.get_coefficients(n)) <= (2*n)+2)
+    assert (max(errors) < 1e-20)
+
+
+@pytest.mark.integral
+@pytest.mark.parametrize("integral, function",
+    [(IntegralBA, FunctionBA), (IntegralBB, FunctionBB),
+     (IntegralBC, FunctionBC), (IntegralBD, FunctionBD),
+     (IntegralBE, FunctionBE), (IntegralBF, FunctionBF),
+     (IntegralBG, FunctionBG)
+    ])
+@pytest.mark.parametrize("n_num", [0, 1, 3])
+def test_numeric_eval_integralB(integral, function, n_num):
+    r"""Should fail if the vectorized numeric evaluation does not
+    correspond to numerical integration.
+    """
+    a, r = sp.symbols("a r", positive=True)
+    a_num = np.array([0.5, 1.0, 2.0, 4.0])
+    r_1_num = np.array([0.8, 1.0, 0.5, 2.0])
+    r_2_num = np.array([2.0, np.inf, 3.0, np.inf])
+    if (integral is IntegralBA):    # diverges at infinity
+        r_2_num = np.where(np.isinf(r_2_num), 5.0, r_2_num)
+    integrand = util.lambdify_numeric((r, a), function(r, n_num, a).doit())
+    res = integral.evaluate(n_num, a_num, r_1_num, r_2_num)
+    res_int = np.array([quad(integrand, r_1, r_2, args=(a_,),
+                             epsabs=0.0, epsrel=1e-13)[0]
+                        for a_, r_1, r_2 in zip(a_num, r_1_num, r_2_num)])
+
+    # Tests
+    assert (res.shape == a_num.shape)
+    assert (np.allclose(res, res_int, rtol=1e-9, atol=0.0))
+
+
+@pytest.mark.integral
+@pytest.mark.parametrize("n_num", [0, 1, 3])
+def test_numeric_divergence_integralBA(n_num):
+    r"""Should fail if the divergent integral to infinity is not
+    infinite.
+    """
+    a_num = np.array([0.5, 1.0, 2.0, 4.0])
+    r_1_num = np.array([0.8, 1.0, 0.5, 2.0])
+
+    # Tests
+    assert (np.isinf(IntegralBA.evaluate(n_num, a_num, r_1_num,
+                                         np.inf)).all())
@@ -2,12 +2,14 @@ import pytest
 
 import math
 import numpy as np
+import warnings
 import sympy as sp
 from scipy.integrate import quad
 from scipy.special import kn
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
+from nupot.integrals.integralBD import IntegralBD
 from nupot.integrals.integralBE import FunctionBE, IntegralBE
 
 # ----------------------------------------------------------------------
@@ -41,3 +43,24 @@ def test_eval_integralBE_1(n_num, r_2_num):
 
     # Tests
     assert (math.isclose(res_num, res_int, rel_tol=1e-4))
+
+
+@pytest.mark.integral
+def test_series_terms_integralBE():
+    r"""Should fail if the default symbolic closed forms warn about the
+    number of terms of the series of KSiIntegral, or if the bound x_max
+    is not passed along from doit to the series.
+    """
+    a, r = sp.symbols("a r", positive=True)
+    a_num, r_1_num = 1.0, 6.0
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        res_default = IntegralBE((2, a), (r, r_1_num, np.inf)).doit()
+        IntegralBD.solve_integral(r, 2, a)
+        res = IntegralBE((2, a), (r, r_1_num, np.inf)).doit(x_max=6.0)
+    res_num = float(res.evalf(30, subs={a: a_num}))
+    res_theo = IntegralBE.evaluate(2, a_num, r_1_num, np.inf)
+
+    # Tests
+    assert (sp.count_ops(res) > sp.count_ops(res_default))
+    assert (math.isclose(res_num, float(res_theo), rel_tol=1e-10))
@@ -1,9 +1,12 @@
 import pytest
 
+import math
+import mpmath
 import numpy as np
 import sympy as sp
 
-from nupot.functions.klkl_function import KLKLFunction
+from nupot.functions.klkl_function import KLKLFunction, klkl_mpmath,\
+                                         klkl_remainder_scaled
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
 
@@ -48,3 +51,88 @@ def test_factorization():
     expected_coeff = (d**2) + e
     # Tests
     assert (coeff_expr.equals(expected_coeff))
+
+
+@pytest.mark.functions
+def test_remainder_scaled():
+    r"""Should fail if the scaled remainder of the function does not
+    match the high precision evaluation in all the regimes.
+    """
+    x = np.array([1e-3, 0.5, 1.9, 2.1, 10.0, 34.0, 36.0, 80.0, 200.0])
+    res = klkl_remainder_scaled(x)
+    res_theo = []
+    with mpmath.workdps(150):
+        for x_ in x:
+            x_ = mpmath.mpf(x_)
+            klkl = ((mpmath.besselk(0, x_)*mpmath.struvel(-1, x_))
+                    + (mpmath.besselk(1, x_)*mpmath.struvel(0, x_)))
+            res_theo.append(float(mpmath.exp(x_)*(klkl - (1/x_))))
+
+    # Tests
+    assert (res.shape == x.shape)
+    assert (np.allclose(res, res_theo, rtol=1e-13, atol=0.0))
+    assert (klkl_remainder_scaled(5.0).shape == ())
+
+
+@pytest.mark.functions
+def test_numeric_values():
+    r"""Should fail if the vectorized function does not match the high
+    precision evaluation in all the regimes or if it is not the numeric
+    implementation of the function.
+    """
+    x_sym = sp.Symbol('x', positive=True)
+    x = np.concatenate((np.logspace(-4, np.log10(300.0), 25), [2.0, 2.001]))
+    res = KLKLFunction._imp_(x)
+    res_theo = []
+    for x_ in x:
+        with mpmath.workdps(int(x_/2) + 30):
+            x_ = mpmath.mpf(x_)
+            res_theo.append(float((mpmath.besselk(0, x_)
+                                   * mpmath.struvel(-1, x_))
+                                  + (mpmath.besselk(1, x_)
+                                     * mpmath.struvel(0, x_))))
+
+    # Tests
+    assert (np.allclose(res, res_theo, rtol=1e-13, atol=0.0))
+    assert (np.allclose(sp.lambdify(x_sym, KLKLFunction(x_sym))(x), res,
+                        rtol=0.0, atol=0.0))
+    assert (np.allclose(util.lambdify_numeric((x_sym,),
+                                              KLKLFunction(x_sym))(x),
+                        res, rtol=0.0, atol=0.0))
+    assert (math.isclose(float(KLKLFunction(sp.Float(3.0)).evalf()),
+                         float(KLKLFunction._imp_(3.0)), rel_tol=1e-15))
+    assert (KLKLFunction._imp_(np.array([0.0, np.inf])).tolist()
+            == [np.inf, 0.0])
+
+
+@pytest.mark.functions
+def test_evalf_precision():
+    r"""Should fail if the evaluation does not honor the requested
+    precision, including through the cancellation with the algebraic
+    part :math:`\frac{1}{x}` at large argument, or if the high precision
+    values are not memoized.
+    """
+    x = sp.Symbol('x', positive=True)
+    expr = (sp.pi*x*KLKLFunction(x)) - sp.pi
+    res = KLKLFunction(sp.Rational(3)).evalf(50)
+    klkl_mpmath.cache_clear()
+    KLKLFunction(sp.Rational(7, 2)).evalf(40)
+    KLKLFunction(sp.Rational(7, 2)).evalf(40)
+    res_cancel = expr.evalf(30, subs={x: 200})
+    with mpmath.workdps(150):
+        res_theo = ((mpmath.besselk(0, 3)*mpmath.struvel(-1, 3))
+                    + (mpmath.besselk(1, 3)*mpmath.struvel(0, 3)))
+        x_ = mpmath.mpf(200)
+        res_cancel_theo = ((mpmath.pi*x_*((mpmath.besselk(0, x_)
+                                          * mpmath.struvel(-1, x_))
+                                         + (mpmath.besselk(1, x_)
+                                            * mpmath.struvel(0, x_))))
+                           - mpmath.pi)
+        err = abs((mpmath.mpf(str(res))/res_theo) - 1)
+        err_cancel = abs((mpmath.mpf(str(res_cancel))/res_cancel_theo) - 1)
+
+    # Tests
+    assert (err < 1e-48)
+    assert (err_cancel < 1e-28)
+    assert (klkl_mpmath.cache_info().hits >= 1)
+    assert (KLKLFunction(sp.Rational(3)).evalf()._prec == 53)
@@ -1,10 +1,11 @@
 import pytest
 
 import math
+import mpmath
 import numpy as np
 import sympy as sp
 from scipy.integrate import quad
-from scipy.special import kn
+from scipy.special import k0e, kn
 
 import nupot.utils.constants as cst
 import nupot.utils.utilities as util
@@ -26,7 +27,8 @@ def test_eval_integralBA_1(r_2_num):
     a_num = 0.5
     r_1_num = 1e-4
     a, r = sp.symbols("a r")
-    res = KSiIntegral((a, ), (r, r_1_num, r_2_num)).doit()
+    # largest alpha*r of the series, the value at infinity is zero
+    res = KSiIntegral((a, ), (r, r_1_num, r_2_num)).doit(x_max=1.0)
     res = res.subs({a: a_num})
     res_num = res.evalf()
 
@@ -38,3 +40,76 @@ def test_eval_integralBA_1(r_2_num):
 
     # Tests
     assert (math.isclose(res_num, res_int, rel_tol=1e-3))
+
+
+@pytest.mark.function
+def test_eval_precision():
+    r"""Should fail if the evaluation of the series with many terms does
+    not honor the requested precision.
+    """
+    a_num = sp.Rational(1, 2)
+    r_num = sp.Rational(1, 10)
+    a = sp.Symbol('a', positive=True)
+    res = KSiIntegral.solve_def_integral(r_num, a, 30)
+    res = res.evalf(40, subs={a: a_num})
+    with mpmath.workdps(45):
+        res_int = mpmath.quad(lambda x: mpmath.besselk(0, x)/x,
+                              [mpmath.mpf(1)/20, 1, mpmath.inf]) * 2
+        err = abs((mpmath.mpf(str(res))/res_int) - 1)
+
+    # Tests
+    assert (err < 1e-35)
+
+
+@pytest.mark.function
+def test_numeric_evaluation():
+    r"""Should fail if the vectorized evaluation does not match the
+    numerical integration in the series and tail regimes, or if the
+    symbolic series does not pick enough terms to reach the tolerance.
+    """
+    alpha = np.array([0.5, 2.0])
+    x_small = np.array([1e-5, 0.3, 2.0, 2.999])
+    x_large = np.array([3.001, 10.0, 100.0, 600.0])
+    res_small = KSiIntegral.evaluate(x_small[:, None]/alpha, alpha)
+    res_large = KSiIntegral.evaluate(x_large, 1.0) * np.exp(x_large)
+    res_small_int = []
+    for x in x_small:
+        with mpmath.workdps(20):
+            x = mpmath.mpf(x)
+            res_small_int.append(float(mpmath.quad(
+                lambda t: mpmath.besselk(0, t)/t, [x, 1, 10, mpmath.inf])))
+    res_small_int = np.array(res_small_int)[:, None] / alpha
+    res_large_int = [quad(lambda s: k0e(x+s)*np.exp(-s)/(x+s), 0, np.inf,
+                          epsabs=0, epsrel=1e-13, limit=200)[0]
+                     for x in x_large]
+    res_sym = KSiIntegral.solve_def_integral(sp.Rational(5, 2),
+                                             sp.Integer(1)).evalf(20)
+
+    # Tests
+    assert (res_small.shape == (4, 2))
+    assert (np.allclose(res_small, res_small_int, rtol=1e-13, atol=0.0))
+    assert (np.allclose(res_large, res_large_int, rtol=1e-13, atol=0.0))
+    assert (math.isclose(float(res_sym), KSiIntegral.evaluate(2.5, 1.0),
+                         rel_tol=5e-14))
+    assert (KSiIntegral.get_nbr_terms(1e-4) < KSiIntegral.get_nbr_terms(3.0))
+
+
+@pytest.mark.function
+def test_symbolic_nbr_terms():
+    r"""Should fail if the symbolic series silently picks its number of
+    terms for alpha*a <= x_series or if it does not reach the tolerance
+    up to the explicit bound x_max.
+    """
+    alpha, r = sp.symbols('alpha r', positive=True)
+    with pytest.warns(UserWarning):
+        res_default = KSiIntegral.solve_def_integral(r, alpha)
+    res = KSiIntegral.solve_def_integral(r, alpha, x_max=10.0)
+    res_num = res.evalf(30, subs={alpha: 1, r: 10})
+    res_default_num = res_default.evalf(30, subs={alpha: 1, r: 10})
+    res_theo = KSiIntegral.evaluate(10.0, 1.0)
+
+    # Tests
+    assert (sp.count_ops(res) > sp.count_ops(res_default))
+    assert (not math.isclose(float(res_default_num), res_theo,
+                             rel_tol=1e-3))
+    assert (math.isclose(float(res_num), res_theo, rel_tol=1e-12))
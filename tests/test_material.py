@@ -0,0 +1,81 @@
+import pytest
+
+import math
+import numpy as np
+import sympy as sp
+from collections import namedtuple
+from scipy.constants import Avogadro
+
+from nupot.physics.atom import Atom
+from nupot.physics.material import Material, MaterialInputError
+from nupot.potentials.dirac_nu_pair_potential import DiracNuPairPotential
+
+# An isotope, with the attributes of Atom used by the potentials
+Isotope = namedtuple('Isotope', ['atomic_number', 'neutrons'])
+
+# ----------------------------------------------------------------------
+# Tests ----------------------------------------------------------------
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.physics
+def test_material_fractions():
+    r"""Should fail if the fractions and the number densities of a
+    compound or of an alloy are not the expected ones.
+    """
+    silica = Material('SiO2', {'Si': 1, 'O': 2}, 2.65)
+    steel = Material('Steel', {'Fe': 0.70, 'Cr': 0.18, 'Ni': 0.12}, 8.0,
+                     mass_fractions=True)
+    molar_mass = (Atom('Si').atomic_weight + (2*Atom('O').atomic_weight))
+
+    # Tests
+    assert (np.allclose(silica.atom_fractions, [1/3, 2/3], rtol=1e-15))
+    assert (math.isclose(silica.molar_mass, molar_mass/3, rel_tol=1e-15))
+    assert (math.isclose(np.sum(silica.number_densities),
+                         2.65*6.02214076e23*3/molar_mass, rel_tol=1e-14))
+    assert (np.allclose(steel.mass_fractions, [0.70, 0.18, 0.12],
+                        rtol=1e-14))
+    with pytest.raises(MaterialInputError):
+        Material('Void', {'Fe': 1}, 0.0)
+
+
+@pytest.mark.physics
+def test_material_potential():
+    r"""Should fail if the potential between two materials is not the
+    sum of the potentials between the isotopes of their atoms weighted
+    by the number densities and the natural abundances, or if the
+    symbolic potential of the materials does not match its numeric
+    evaluation.
+    """
+    m_1, m_2, m_3, r = sp.symbols('m_1 m_2 m_3 r', positive=True)
+    silica = Material('SiO2', {'Si': 1, 'O': 2}, 2.65)
+    tungsten = Material('W', {Atom('W'): 1}, 19.3)
+    pot = DiracNuPairPotential(silica, tungsten, m_1, m_2, m_3, r,
+                               orders=[1, 1, 1])
+    r_num, masses = np.array([0.5, 2.0]), (0.1, 0.2, 0.3)
+    res = pot.evaluate(r_num, *masses)
+    res_sym = pot.to_numeric()(r_num, *masses)
+    # number densities in 1/cm^3 from the stoichiometry
+    weight_SiO2 = Atom('Si').atomic_weight + (2*Atom('O').atomic_weight)
+    densities_A = {'Si': 2.65*Avogadro/weight_SiO2,
+                   'O': 2*2.65*Avogadro/weight_SiO2}
+    densities_B = {'W': 19.3*Avogadro/Atom('W').atomic_weight}
+    res_theo = np.zeros(r_num.shape)
+    for symbol_A, n_A in densities_A.items():
+        for symbol_B, n_B in densities_B.items():
+            for iso_A in Atom(symbol_A).isotopes:
+                for iso_B in Atom(symbol_B).isotopes:
+                    pot_AB = DiracNuPairPotential(
+                        Isotope(sp.Integer(iso_A['Z']),
+                                sp.Integer(iso_A['N'])),
+                        Isotope(sp.Integer(iso_B['Z']),
+                                sp.Integer(iso_B['N'])),
+                        m_1, m_2, m_3, r, orders=[1, 1, 1])
+                    res_theo += (n_A * n_B * iso_A['abundance']
+                                 * iso_B['abundance']
+                                 * pot_AB.evaluate(r_num, *masses))
+
+    # Tests
+    assert (silica.weak_charge_tensor is silica.weak_charge_tensor)
+    assert (np.allclose(res, res_theo, rtol=1e-12, atol=0.0))
+    assert (np.allclose(res_sym, res, rtol=1e-12, atol=0.0))
@@ -0,0 +1,79 @@
+import pytest
+
+from itertools import islice
+
+import sympy as sp
+
+from nupot.integrals.integralAA import IntegralAA
+from nupot.potentials.series_builder import SeriesBuilder,\
+                                            SeriesBuilderInputError
+
+# ----------------------------------------------------------------------
+# Tests ----------------------------------------------------------------
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.integral
+def test_incremental_series():
+    r"""Should fail if the series is not built incrementally or if the
+    partial sums do not correspond to the sum of the terms.
+    """
+    m_1, m_2, r = sp.symbols('m_1 m_2 r', positive=True)
+    SeriesBuilder.clear()
+    series = SeriesBuilder.get(m_1, m_2, r, sp.Rational(-1, 2))
+    res_2 = series.partial_sum(2)
+    nbr_terms_2 = series.nbr_terms
+    res_3 = series.partial_sum(3)
+    terms = list(islice(series, 3))
+    a = (m_1 + m_2)**2
+    e = (m_1 - m_2)**2
+    term_theo = (sp.Rational(-1, 8) * (e**2)
+                 * IntegralAA.solve_def_integral(None, sp.Rational(-5, 2),
+                                                 sp.Rational(1, 2), a, r))
+
+    # Tests
+    assert (nbr_terms_2 == 2)
+    assert (series.nbr_terms == 3)
+    assert (SeriesBuilder.get(m_1, m_2, r, -0.5) is series)
+    assert (res_3 == res_2 + terms[2])
+    assert (sp.expand(terms[2] - term_theo) == 0)
+    assert (series.partial_sum(0) == 0)
+    with pytest.raises(SeriesBuilderInputError):
+        series.partial_sum(-1)
+
+
+@pytest.mark.integral
+def test_shared_integrals():
+    r"""Should fail if the integrals are not shared between the series
+    of the same masses and radius.
+    """
+    m_1, m_2, r = sp.symbols('m_1 m_2 r', positive=True)
+    SeriesBuilder.clear()
+    series_1 = SeriesBuilder.get(m_1, m_2, r, sp.Rational(1, 2))
+    series_2 = SeriesBuilder.get(m_1, m_2, r, sp.Rational(-1, 2))
+    series_1.partial_sum(3)
+
+    # Tests
+    assert (series_2.get_integral(sp.Rational(-3, 2))
+            is series_1.get_integral(sp.Rational(-3, 2)))
+    with pytest.raises(SeriesBuilderInputError):
+        SeriesBuilder(m_1, m_2, r, sp.Rational(1, 3))
+
+
+@pytest.mark.integral
+def test_bounded_builders():
+    r"""Should fail if the shared builders of a sweep over numeric
+    masses are not bounded by the size of the cache.
+    """
+    r = sp.Symbol('r', positive=True)
+    rho_0 = sp.Rational(-1, 2)
+    SeriesBuilder.clear()
+    masses = [sp.Rational(i+1, 10) for i in range(SeriesBuilder.cache_size+1)]
+    builders = [SeriesBuilder.get(m, m, r, rho_0) for m in masses]
+    first = SeriesBuilder.get(masses[0], masses[0], r, rho_0)
+    last = SeriesBuilder.get(masses[-1], masses[-1], r, rho_0)
+    SeriesBuilder.clear()
+
+    # Tests
+    assert (first is not builders[0])
+    assert (last is builders[-1])